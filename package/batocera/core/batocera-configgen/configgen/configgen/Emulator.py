@@ -5,17 +5,27 @@ from settings.unixSettings import UnixSettings
 import xml.etree.ElementTree as ET
 import shlex
 from utils.logger import get_logger
+from utils.trace import span
 import yaml
 import collections
+import copy
+import hashlib
+import pickle
 
 eslog = get_logger(__name__)
 
+# libyaml is much faster than the python loader to rebuild the cache
+YamlLoader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+DEFAULTS_CACHE_VERSION = 1
+
 class Emulator():
+    @span("Emulator.init")
     def __init__(self, name, rom):
         self.name = name
 
         # read the configuration from the system name
-        self.config = Emulator.get_system_config(self.name, "/usr/share/batocera/configgen/configgen-defaults.yml", "/usr/share/batocera/configgen/configgen-defaults-arch.yml")
+        with span("Emulator.defaults"):
+            self.config = Emulator.get_system_config(self.name, "/usr/share/batocera/configgen/configgen-defaults.yml", "/usr/share/batocera/configgen/configgen-defaults-arch.yml")
         if "emulator" not in self.config or self.config["emulator"] == "":
             eslog.error("no emulator defined. exiting.")
             raise Exception("No emulator found")
@@ -24,7 +34,8 @@ class Emulator():
         system_core     = self.config["core"]
 
         # load configuration from batocera.conf
-        recalSettings = UnixSettings(batoceraFiles.batoceraConf)
+        with span("Emulator.settings"):
+            recalSettings = UnixSettings.snapshot(batoceraFiles.batoceraConf)
         globalSettings = recalSettings.loadAll('global')
         systemSettings = recalSettings.loadAll(self.name)
         folderSettings = recalSettings.loadAll(self.name + ".folder[\"" + os.path.dirname(rom) + "\"]")
@@ -91,13 +102,60 @@ class Emulator():
 
     @staticmethod
     def get_generic_config(system, defaultyml, defaultarchyml):
+        defaults = Emulator.get_compiled_defaults(defaultyml, defaultarchyml)
+        if system in defaults["systems"]:
+            return defaults["systems"][system]
+        return defaults["default"]
+
+    # the merged defaults of all the systems are compiled once and pickled in the cache directory,
+    # they are rebuilt only when one of the yml files changes
+    @staticmethod
+    def get_compiled_defaults(defaultyml, defaultarchyml):
+        sources = Emulator.defaults_sources(defaultyml, defaultarchyml)
+        cachefile = "{}/configgen/defaults-{}.pickle".format(batoceraFiles.CACHE, hashlib.md5((defaultyml + ":" + defaultarchyml).encode()).hexdigest())
+
+        try:
+            with open(cachefile, 'rb') as f:
+                cached = pickle.load(f)
+            if cached["version"] == DEFAULTS_CACHE_VERSION and cached["sources"] == sources:
+                return cached
+        except Exception:
+            pass # missing or outdated cache
+
+        eslog.debug("compiling {} and {}".format(defaultyml, defaultarchyml))
+        compiled = Emulator.compile_defaults(defaultyml, defaultarchyml)
+        compiled["version"] = DEFAULTS_CACHE_VERSION
+        compiled["sources"] = sources
+        try:
+            os.makedirs(os.path.dirname(cachefile), exist_ok=True)
+            tmpfile = "{}.{}.tmp".format(cachefile, os.getpid())
+            with open(tmpfile, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, cachefile)
+        except Exception as e:
+            eslog.warning("unable to write the defaults cache {}: {}".format(cachefile, e))
+        return compiled
+
+    @staticmethod
+    def defaults_sources(*files):
+        sources = []
+        for file in files:
+            try:
+                st = os.stat(file)
+                sources.append((file, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                sources.append((file, None, None))
+        return sources
+
+    @staticmethod
+    def compile_defaults(defaultyml, defaultarchyml):
         with open(defaultyml, 'r') as f:
-            systems_default = yaml.load(f, Loader=yaml.FullLoader)
+            systems_default = yaml.load(f, Loader=YamlLoader)
 
         systems_default_arch = {}
         if os.path.exists(defaultarchyml):
             with open(defaultarchyml, 'r') as f:
-                systems_default_arch = yaml.load(f, Loader=yaml.FullLoader)
+                systems_default_arch = yaml.load(f, Loader=YamlLoader)
                 if systems_default_arch is None:
                     systems_default_arch = {}
         dict_all = {}
@@ -108,13 +166,16 @@ class Emulator():
         if "default" in systems_default_arch:
             Emulator.dict_merge(dict_all, systems_default_arch["default"])
 
-        if system in systems_default:
-            Emulator.dict_merge(dict_all, systems_default[system])
-
-        if system in systems_default_arch:
-            Emulator.dict_merge(dict_all, systems_default_arch[system])
+        systems = {}
+        for system in set(systems_default) | set(systems_default_arch):
+            dict_system = copy.deepcopy(dict_all)
+            if system in systems_default:
+                Emulator.dict_merge(dict_system, systems_default[system])
+            if system in systems_default_arch:
+                Emulator.dict_merge(dict_system, systems_default_arch[system])
+            systems[system] = dict_system
 
-        return dict_all
+        return { "default": dict_all, "systems": systems }
 
     @staticmethod
     def get_system_config(system, defaultyml, defaultarchyml):
@@ -4,228 +4,393 @@ import subprocess
 import json
 import re
 import os
+import pickle
+import hashlib
+import batoceraFiles
 from utils.logger import get_logger
+from utils.trace import span
 import evdev
 
 eslog = get_logger(__name__)
 
+evmapyDir = "/var/run/evmapy"
+evmapyPid = "/var/run/evmapy.pid"
+evmapyCache = batoceraFiles.CACHE + "/configgen/evmapy.pickle"
+EVMAPY_CACHE_VERSION = 1
+evmapyCacheMaxEntries = 100
+
+# the .keys files of the evmapy directories by system and emulator ({system}.keys -> None, {system}.{emulator}.keys -> emulator),
+# so that the launches of the systems without mapping don't look for them one by one.
+# it is saved in the cache and a directory is listed again only when its mtime changes
+class EvmapyKeysIndex():
+
+    def __init__(self, indexFile, directories):
+        self.indexFile = indexFile
+        self.directories = directories
+        self.dirs = None # directory -> (mtime, { system: { emulator: path } })
+
+    def load(self):
+        if self.dirs is not None:
+            return
+        try:
+            with open(self.indexFile, 'rb') as f:
+                self.dirs = pickle.load(f)
+        except Exception:
+            self.dirs = dict() # missing or invalid
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.indexFile), exist_ok=True)
+            tmpfile = "{}.{}.tmp".format(self.indexFile, os.getpid())
+            with open(tmpfile, 'wb') as f:
+                pickle.dump(self.dirs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, self.indexFile)
+        except Exception as e:
+            eslog.debug("unable to save the evmapy index: {}".format(e))
+
+    # list again the directories which changed
+    def refresh(self):
+        self.load()
+        changed = False
+        for directory in self.directories:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            if directory in self.dirs and self.dirs[directory][0] == mtime:
+                continue
+            systems = {}
+            if mtime is not None:
+                for file in os.listdir(directory):
+                    if file.endswith(".keys"):
+                        names = file[:-5].split(".", 1)
+                        systems.setdefault(names[0], {})[names[1] if len(names) > 1 else None] = directory + "/" + file
+            self.dirs[directory] = (mtime, systems)
+            changed = True
+        if changed:
+            self.save()
+
+    # the keys file of the directory for the system and the emulator (None for the one of the system), None if there is none
+    def keysFile(self, directory, system, emulator=None):
+        return self.dirs[directory][1].get(system, {}).get(emulator)
+
+evmapyUserDir = "/userdata/system/configs/evmapy"
+evmapySystemDir = "/usr/share/evmapy"
+evmapyKeysIndex = EvmapyKeysIndex(batoceraFiles.CACHE + "/configgen/evmapy-index.pickle", [ evmapyUserDir, evmapySystemDir ])
+
 class Evmapy():
     # evmapy is a process that map pads to keyboards (for pygame for example)
     __started = False
 
     @staticmethod
+    @span("Evmapy.start")
     def start(system, emulator, core, rom, playersControllers):
-        if Evmapy.__prepare(system, emulator, core, rom, playersControllers):
+        prepared = Evmapy.__prepare(system, emulator, core, rom, playersControllers)
+        if prepared:
             Evmapy.__started = True
-            subprocess.call(["batocera-evmapy", "start"])
+            if prepared == "unchanged" and Evmapy.__isRunning():
+                eslog.debug("evmapy is already running with the same configuration")
+            else:
+                subprocess.call(["batocera-evmapy", "start"])
 
     @staticmethod
+    @span("Evmapy.stop")
     def stop():
         if Evmapy.__started:
             Evmapy.__started = False
             subprocess.call(["batocera-evmapy", "stop"])
 
+    # returns False when there is no keys file, "unchanged" when the configuration files in /var/run/evmapy were already the good ones, True otherwise
     @staticmethod
+    @span("Evmapy.prepare")
     def __prepare(system, emulator, core, rom, playersControllers):
         # consider files here in this order to get a configuration
-        for keysfile in [
-                "{}.keys" .format (rom),
-                "{}/padto.keys" .format (rom), # case when the rom is a directory
-                #"/userdata/system/configs/evmapy/{}.{}.{}.keys" .format (system, emulator, core),
-                #"/userdata/system/configs/evmapy/{}.{}.keys" .format (system, emulator),
-                "/userdata/system/configs/evmapy/{}.keys" .format (system),
-                #"/usr/share/evmapy/{}.{}.{}.keys" .format (system, emulator, core),
-                "/usr/share/evmapy/{}.{}.keys" .format (system, emulator),
-                "/usr/share/evmapy/{}.keys" .format (system)
-        ]:
-            if os.path.exists(keysfile) and not (os.path.isdir(rom) and keysfile == "{}.keys" .format (rom)): # "{}.keys" .format (rom) is forbidden for directories, it must be inside
+        # "{}.keys" .format (rom) is forbidden for directories, it must be inside ("{}/padto.keys" .format (rom))
+        if os.path.isdir(rom):
+            keysfiles = [ "{}/padto.keys" .format (rom) ]
+        else:
+            keysfiles = [ "{}.keys" .format (rom) ]
+        keysfiles = [ keysfile for keysfile in keysfiles if os.path.exists(keysfile) ]
+
+        # the ones of the evmapy directories, from the index
+        evmapyKeysIndex.refresh()
+        keysfiles += [
+            evmapyKeysIndex.keysFile(evmapyUserDir, system),
+            #evmapyKeysIndex.keysFile(evmapyUserDir, system, "{}.{}" .format (emulator, core)),
+            #evmapyKeysIndex.keysFile(evmapyUserDir, system, emulator),
+            #evmapyKeysIndex.keysFile(evmapySystemDir, system, "{}.{}" .format (emulator, core)),
+            evmapyKeysIndex.keysFile(evmapySystemDir, system, emulator),
+            evmapyKeysIndex.keysFile(evmapySystemDir, system)
+        ]
+
+        for keysfile in keysfiles:
+            if keysfile is not None:
                 eslog.debug("evmapy on {}".format(keysfile))
-                subprocess.call(["batocera-evmapy", "clear"])
-    
-                padActionConfig = json.load(open(keysfile))
-    
+
+                with open(keysfile, "rb") as fd:
+                    keysdata = fd.read()
+                keyshash = hashlib.sha1(keysdata).hexdigest()
+                padActionConfig = json.loads(keysdata)
+
+                # the pad configurations are generated only for new (keys file, player, pad mapping, pad axes) combinations
+                cache = Evmapy.__loadCache()
+                cachechanged = False
+
                 # configure each player
+                configs = {}
                 nplayer = 1
                 for playercontroller, pad in sorted(playersControllers.items()):
                     if "actions_player"+str(nplayer) in padActionConfig:
-                        configfile = "/var/run/evmapy/{}.json" .format (os.path.basename(pad.dev))
-                        eslog.debug("config file for keysfile is {} (from {})" .format (configfile, keysfile))
-    
-                        # create mapping
-                        padConfig = {}
-                        padConfig["axes"] = []
-                        padConfig["buttons"] = []
-                        padConfig["grab"] = False
-                        absbasex_positive = True
-                        absbasey_positive = True
-    
-                        # define buttons / axes
-                        known_buttons_names = {}
-                        known_buttons_codes = {}
-                        known_buttons_alias = {}
-                        known_axes_codes = {}
-                        for index in pad.inputs:
-                            input = pad.inputs[index]
-                            if input.type == "button":
-                                # don't add 2 times the same button (ie select as hotkey)
-                                if input.code is not None:
-                                    if input.code not in known_buttons_codes:
-                                        known_buttons_names[input.name] = True
-                                        known_buttons_codes[input.code] = input.name # keep the master name for aliases
-                                        padConfig["buttons"].append({
-                                            "name": input.name,
-                                            "code": int(input.code)
-                                        })
-                                    else:
-                                        known_buttons_alias[input.name] = known_buttons_codes[input.code]
-                            elif input.type == "hat":
-                                if int(input.value) in [1, 2]: # don't duplicate values
-                                    if int(input.value) == 1:
-                                        name = "X"
-                                        isYAsInt = 0
-                                    else:
-                                        name = "Y"
-                                        isYAsInt =  1 
-                                    known_buttons_names["HAT" + input.id + name + ":min"] = True
-                                    known_buttons_names["HAT" + input.id + name + ":max"] = True
-                                    padConfig["axes"].append({
-                                        "name": "HAT" + input.id + name,
-                                        "code": int(input.id) + 16 + isYAsInt, # 16 = HAT0X in linux/input.h
-                                        "min": -1,
-                                        "max": 1
-                                    })
-                            elif input.type == "axis":
-                                if input.code not in known_axes_codes: # avoid duplicated value for axis (bad pad configuration that make evmappy to stop)
-                                    known_axes_codes[input.code] = True
-                                    axisId = None
-                                    axisName = None
-                                    if input.name == "joystick1up" or input.name == "joystick1left":
-                                        axisId = "0"
-                                    elif input.name == "joystick2up" or input.name == "joystick2left":
-                                        axisId = "1"
-                                    if input.name == "joystick1up" or input.name == "joystick2up":
-                                        axisName = "Y"
-                                    elif input.name == "joystick1left" or input.name == "joystick2left":
-                                        axisName = "X"
-                                    elif input.name == "up" or input.name == "down":
-                                        axisId   = "BASE"
-                                        axisName = "Y"
-                                        if input.name == "up":
-                                            absbasey_positive =  int(input.value) >= 0
-                                        else:
-                                            axisId = None # don't duplicate, configuration should be done for up
-                                    elif input.name == "left" or input.name == "right":
-                                        axisId   = "BASE"
-                                        axisName = "X"
-                                        if input.name == "left":
-                                            absbasex_positive = int(input.value) < 0
-                                        else:
-                                            axisId = None # don't duplicate, configuration should be done for left
-                                    else:
-                                        axisId   = "_OTHERS_"
-                                        axisName = input.name
-
-                                    if ((axisId in ["0", "1", "BASE"] and axisName in ["X", "Y"]) or axisId == "_OTHERS_") and input.code is not None:
-                                        axisMin, axisMax = Evmapy.__getPadMinMaxAxis(pad.dev, int(input.code))
-                                        known_buttons_names["ABS" + axisId + axisName + ":min"] = True
-                                        known_buttons_names["ABS" + axisId + axisName + ":max"] = True
-                                        known_buttons_names["ABS" + axisId + axisName + ":val"] = True
-
-                                        padConfig["axes"].append({
-                                            "name": "ABS" + axisId + axisName,
-                                            "code": int(input.code),
-                                            "min": axisMin,
-                                            "max": axisMax
-                                        })
-
-                        # only add actions for which buttons are defined (otherwise, evmapy doesn't like it)
-                        padActionsPreDefined = padActionConfig["actions_player"+str(nplayer)]
-                        padActionsFiltered = []
-
-                        # handle mouse events : only joystick1 or joystick2 defined for 2 events
-                        padActionsDefined = []
-                        for action in padActionsPreDefined:
-                            if "type" in action and action["type"] == "mouse" and "target" not in action and "trigger" in action:
-                                if action["trigger"] == "joystick1":
-                                    newaction = action.copy()
-                                    newaction["trigger"] = "joystick1x"
-                                    newaction["target"] = 'X'
-                                    padActionsDefined.append(newaction)
-                                    newaction = action.copy()
-                                    newaction["trigger"] = "joystick1y"
-                                    newaction["target"] = 'Y'
-                                    padActionsDefined.append(newaction)
-                                elif action["trigger"] == "joystick2":
-                                    newaction = action.copy()
-                                    newaction["trigger"] = "joystick2x"
-                                    newaction["target"] = 'X'
-                                    padActionsDefined.append(newaction)
-                                    newaction = action.copy()
-                                    newaction["trigger"] = "joystick2y"
-                                    newaction["target"] = 'Y'
-                                    padActionsDefined.append(newaction)
-                            else:
-                                padActionsDefined.append(action)
-
-                        # define actions
-                        for action in padActionsDefined:
-                            if "trigger" in action:
-                                trigger = Evmapy.__trigger_mapper(action["trigger"], known_buttons_alias, known_buttons_names, absbasex_positive, absbasey_positive)
-                                if "mode" not in action:
-                                    mode = Evmapy.__trigger_mapper_mode(action["trigger"])
-                                    if mode != None:
-                                        action["mode"] = mode
-                                action["trigger"] = trigger
-                                if isinstance(trigger, list):
-                                    allfound = True
-                                    for x in trigger:
-                                        if x not in known_buttons_names and ("ABS_OTHERS_" + x + ":max") not in known_buttons_names :
-                                            allfound = False
-                                    if allfound:
-                                        # rewrite axis buttons
-                                        x = 0
-                                        for val in trigger:
-                                            if "ABS_OTHERS_" + val + ":max" in known_buttons_names:
-                                                action["trigger"][x] = "ABS_OTHERS_" + val + ":max"
-                                            x = x+1
-                                        padActionsFiltered.append(action)
-                                else:
-                                    if trigger in known_buttons_names:
-                                        padActionsFiltered.append(action)
-                                    if "ABS_OTHERS_" + trigger + ":max" in known_buttons_names:
-                                        action["trigger"] = "ABS_OTHERS_" + action["trigger"] + ":max"
-                                        padActionsFiltered.append(action)
-                                padConfig["actions"] = padActionsFiltered
-
-                        # remove comments
-                        for action in padConfig["actions"]:
-                            if "description" in action:
-                                del action["description"]
-
-                        # use full axis for mouse and 50% for keys
-                        axis_for_mouse = {}
-                        for action in padConfig["actions"]:
-                            if "type" in action and action["type"] == "mouse":
-                                if isinstance(action["trigger"], list):
-                                    for x in action["trigger"]:
-                                        axis_for_mouse[x] = True
-                                else:
-                                    axis_for_mouse[action["trigger"]] = True
-
-                        for axis in padConfig["axes"]:
-                            if axis["name"]+":val" not in axis_for_mouse and axis["name"]+":min" not in axis_for_mouse and axis["name"]+":max" not in axis_for_mouse:
-                                min, max = Evmapy.__getPadMinMaxAxisForKeys(axis["min"], axis["max"])
-                                axis["min"] = min
-                                axis["max"] = max
-
-                        # save config file
-                        with open(configfile, "w") as fd:
-                            fd.write(json.dumps(padConfig, indent=4))
-    
+                        configfile = "{}.json" .format (os.path.basename(pad.dev))
+                        # the device is open only for the pads with axes, once per launch
+                        if any(input.type == "axis" and input.code is not None for input in pad.inputs.values()):
+                            absinfos = Evmapy.__getPadAbsInfos(pad.dev)
+                        else:
+                            absinfos = ()
+                        key = (keyshash, nplayer, pad.guid, tuple([ (input.name, input.type, input.id, input.value, input.code) for input in pad.inputs.values() ]), absinfos)
+                        if key in cache:
+                            configs[configfile] = cache.pop(key)
+                        else:
+                            eslog.debug("config file for keysfile is {}/{} (from {})" .format (evmapyDir, configfile, keysfile))
+                            padConfig = Evmapy.__buildPadConfig(padActionConfig["actions_player"+str(nplayer)], pad, { code: (min, max) for (code, min, max) in absinfos })
+                            configs[configfile] = json.dumps(padConfig, indent=4)
+                            cachechanged = True
+                        cache[key] = configs[configfile] # the most recently used last
                     nplayer += 1
+
+                if cachechanged:
+                    Evmapy.__saveCache(cache)
+
+                # nothing to do if evmapy already has exactly these files
+                if Evmapy.__readConfigs() == configs:
+                    eslog.debug("evmapy configuration unchanged")
+                    return "unchanged"
+
+                subprocess.call(["batocera-evmapy", "clear"])
+                for configfile in configs:
+                    with open(evmapyDir + "/" + configfile, "w") as fd:
+                        fd.write(configs[configfile])
                 return True
         # otherwise, preparation did nothing
         return False
+
+    @staticmethod
+    def __buildPadConfig(padActionsPreDefined, pad, absinfos):
+        padConfig = {}
+        padConfig["axes"] = []
+        padConfig["buttons"] = []
+        padConfig["grab"] = False
+        absbasex_positive = True
+        absbasey_positive = True
+
+        # define buttons / axes
+        known_buttons_names = {}
+        known_buttons_codes = {}
+        known_buttons_alias = {}
+        known_axes_codes = {}
+        for index in pad.inputs:
+            input = pad.inputs[index]
+            if input.type == "button":
+                # don't add 2 times the same button (ie select as hotkey)
+                if input.code is not None:
+                    if input.code not in known_buttons_codes:
+                        known_buttons_names[input.name] = True
+                        known_buttons_codes[input.code] = input.name # keep the master name for aliases
+                        padConfig["buttons"].append({
+                            "name": input.name,
+                            "code": int(input.code)
+                        })
+                    else:
+                        known_buttons_alias[input.name] = known_buttons_codes[input.code]
+            elif input.type == "hat":
+                if int(input.value) in [1, 2]: # don't duplicate values
+                    if int(input.value) == 1:
+                        name = "X"
+                        isYAsInt = 0
+                    else:
+                        name = "Y"
+                        isYAsInt =  1 
+                    known_buttons_names["HAT" + input.id + name + ":min"] = True
+                    known_buttons_names["HAT" + input.id + name + ":max"] = True
+                    padConfig["axes"].append({
+                        "name": "HAT" + input.id + name,
+                        "code": int(input.id) + 16 + isYAsInt, # 16 = HAT0X in linux/input.h
+                        "min": -1,
+                        "max": 1
+                    })
+            elif input.type == "axis":
+                if input.code not in known_axes_codes: # avoid duplicated value for axis (bad pad configuration that make evmappy to stop)
+                    known_axes_codes[input.code] = True
+                    axisId = None
+                    axisName = None
+                    if input.name == "joystick1up" or input.name == "joystick1left":
+                        axisId = "0"
+                    elif input.name == "joystick2up" or input.name == "joystick2left":
+                        axisId = "1"
+                    if input.name == "joystick1up" or input.name == "joystick2up":
+                        axisName = "Y"
+                    elif input.name == "joystick1left" or input.name == "joystick2left":
+                        axisName = "X"
+                    elif input.name == "up" or input.name == "down":
+                        axisId   = "BASE"
+                        axisName = "Y"
+                        if input.name == "up":
+                            absbasey_positive =  int(input.value) >= 0
+                        else:
+                            axisId = None # don't duplicate, configuration should be done for up
+                    elif input.name == "left" or input.name == "right":
+                        axisId   = "BASE"
+                        axisName = "X"
+                        if input.name == "left":
+                            absbasex_positive = int(input.value) < 0
+                        else:
+                            axisId = None # don't duplicate, configuration should be done for left
+                    else:
+                        axisId   = "_OTHERS_"
+                        axisName = input.name
+
+                    if ((axisId in ["0", "1", "BASE"] and axisName in ["X", "Y"]) or axisId == "_OTHERS_") and input.code is not None:
+                        axisMin, axisMax = absinfos.get(int(input.code), (0, 0)) # (0, 0) when not found
+                        known_buttons_names["ABS" + axisId + axisName + ":min"] = True
+                        known_buttons_names["ABS" + axisId + axisName + ":max"] = True
+                        known_buttons_names["ABS" + axisId + axisName + ":val"] = True
+
+                        padConfig["axes"].append({
+                            "name": "ABS" + axisId + axisName,
+                            "code": int(input.code),
+                            "min": axisMin,
+                            "max": axisMax
+                        })
+
+        # only add actions for which buttons are defined (otherwise, evmapy doesn't like it)
+        padActionsFiltered = []
+
+        # handle mouse events : only joystick1 or joystick2 defined for 2 events
+        padActionsDefined = []
+        for action in padActionsPreDefined:
+            if "type" in action and action["type"] == "mouse" and "target" not in action and "trigger" in action:
+                if action["trigger"] == "joystick1":
+                    newaction = action.copy()
+                    newaction["trigger"] = "joystick1x"
+                    newaction["target"] = 'X'
+                    padActionsDefined.append(newaction)
+                    newaction = action.copy()
+                    newaction["trigger"] = "joystick1y"
+                    newaction["target"] = 'Y'
+                    padActionsDefined.append(newaction)
+                elif action["trigger"] == "joystick2":
+                    newaction = action.copy()
+                    newaction["trigger"] = "joystick2x"
+                    newaction["target"] = 'X'
+                    padActionsDefined.append(newaction)
+                    newaction = action.copy()
+                    newaction["trigger"] = "joystick2y"
+                    newaction["target"] = 'Y'
+                    padActionsDefined.append(newaction)
+            else:
+                padActionsDefined.append(action)
+
+        # define actions
+        for action in padActionsDefined:
+            if "trigger" in action:
+                trigger = Evmapy.__trigger_mapper(action["trigger"], known_buttons_alias, known_buttons_names, absbasex_positive, absbasey_positive)
+                if "mode" not in action:
+                    mode = Evmapy.__trigger_mapper_mode(action["trigger"])
+                    if mode != None:
+                        action["mode"] = mode
+                action["trigger"] = trigger
+                if isinstance(trigger, list):
+                    allfound = True
+                    for x in trigger:
+                        if x not in known_buttons_names and ("ABS_OTHERS_" + x + ":max") not in known_buttons_names :
+                            allfound = False
+                    if allfound:
+                        # rewrite axis buttons
+                        x = 0
+                        for val in trigger:
+                            if "ABS_OTHERS_" + val + ":max" in known_buttons_names:
+                                action["trigger"][x] = "ABS_OTHERS_" + val + ":max"
+                            x = x+1
+                        padActionsFiltered.append(action)
+                else:
+                    if trigger in known_buttons_names:
+                        padActionsFiltered.append(action)
+                    if "ABS_OTHERS_" + trigger + ":max" in known_buttons_names:
+                        action["trigger"] = "ABS_OTHERS_" + action["trigger"] + ":max"
+                        padActionsFiltered.append(action)
+                padConfig["actions"] = padActionsFiltered
+
+        # remove comments
+        for action in padConfig["actions"]:
+            if "description" in action:
+                del action["description"]
+
+        # use full axis for mouse and 50% for keys
+        axis_for_mouse = {}
+        for action in padConfig["actions"]:
+            if "type" in action and action["type"] == "mouse":
+                if isinstance(action["trigger"], list):
+                    for x in action["trigger"]:
+                        axis_for_mouse[x] = True
+                else:
+                    axis_for_mouse[action["trigger"]] = True
+
+        for axis in padConfig["axes"]:
+            if axis["name"]+":val" not in axis_for_mouse and axis["name"]+":min" not in axis_for_mouse and axis["name"]+":max" not in axis_for_mouse:
+                min, max = Evmapy.__getPadMinMaxAxisForKeys(axis["min"], axis["max"])
+                axis["min"] = min
+                axis["max"] = max
+
+        return padConfig
+
+    # the json files currently given to evmapy
+    @staticmethod
+    def __readConfigs():
+        configs = {}
+        try:
+            for file in os.listdir(evmapyDir):
+                if file.endswith(".json"):
+                    with open(evmapyDir + "/" + file) as fd:
+                        configs[file] = fd.read()
+        except OSError:
+            return None
+        return configs
+
+    # the evmapy started by batocera-evmapy start is still there
+    @staticmethod
+    def __isRunning():
+        try:
+            with open(evmapyPid) as fd:
+                pid = fd.read().strip()
+            with open("/proc/" + pid + "/comm") as fd:
+                return fd.read().strip() == "evmapy"
+        except OSError:
+            return False
+
+    # pad configuration key -> json, the most recently used last
+    @staticmethod
+    def __loadCache():
+        try:
+            with open(evmapyCache, 'rb') as f:
+                cached = pickle.load(f)
+            if cached["version"] == EVMAPY_CACHE_VERSION:
+                return cached["configs"]
+        except Exception:
+            pass # missing or outdated cache
+        return {}
+
+    @staticmethod
+    def __saveCache(cache):
+        configs = dict(list(cache.items())[-evmapyCacheMaxEntries:])
+        try:
+            os.makedirs(os.path.dirname(evmapyCache), exist_ok=True)
+            tmpfile = "{}.{}.tmp".format(evmapyCache, os.getpid())
+            with open(tmpfile, 'wb') as f:
+                pickle.dump({ "version": EVMAPY_CACHE_VERSION, "configs": configs }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, evmapyCache)
+        except Exception as e:
+            eslog.debug("unable to save {}: {}".format(evmapyCache, e))
+
     
     # remap evmapy trigger (aka up become HAT0Y:max)
     @staticmethod
@@ -308,17 +473,22 @@ class Evmapy():
             return "any"
         return None
 
+    # (code, min, max) of the axes of the device
     @staticmethod
-    def __getPadMinMaxAxis(devicePath, axisCode):
+    def __getPadAbsInfos(devicePath):
         device = evdev.InputDevice(devicePath)
-        capabilities = device.capabilities(False)
+        try:
+            capabilities = device.capabilities(False)
+        finally:
+            device.close()
 
+        absinfos = []
         for event_type in capabilities:
             if event_type == 3: # "EV_ABS"
                 for abs_code, val in capabilities[event_type]:
-                    if abs_code == axisCode:
-                        return val.min, val.max
-        return 0,0 # not found
+                    if abs_code not in [ code for (code, min, max) in absinfos ]: # the first one, as before
+                        absinfos.append((abs_code, val.min, val.max))
+        return tuple(absinfos)
 
     @staticmethod
     def __getPadMinMaxAxisForKeys(min, max):
@@ -16,6 +16,10 @@ esInputs = CONF + '/emulationstation/es_input.cfg'
 esSettings = CONF + '/emulationstation/es_settings.cfg'
 batoceraConf = HOME + '/batocera.conf'
 logdir = HOME + '/logs/'
+configgenSocket = '/var/run/configgen.sock'
+configgenEmulatorPid = '/var/run/configgen-emulator.pid'
+videoModesCache = '/var/run/batocera-resolution.modes'
+videoModesChanged = '/var/run/batocera-resolution.changed'
 
 # This dict is indexed on the emulator name, not on the system
 batoceraBins = {'dosbox'         : '/usr/bin/dosbox'
@@ -103,6 +107,7 @@ viceConfig = CONF + "/vice"
 overlaySystem = "/usr/share/batocera/datainit/decorations"
 overlayUser = "/userdata/decorations"
 overlayConfigFile = "/userdata/system/configs/retroarch/overlay.cfg"
+overlayCache = CACHE + "/bezels"
 
 amiberryRoot = CONF + '/amiberry'
 amiberryRetroarchInputsDir = amiberryRoot + '/conf/retroarch/inputs'
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# renders in advance the bezels of a decoration adapted to the current resolution, in the bezels cache (see utils/bezels.py)
+# so that the launches find them instead of rendering them. low priority, one process per core.
+#   configgen-bezels                 the system bezels of the decoration set in batocera.conf
+#   configgen-bezels --games --hud   the game bezels too, and the resized bezels of the hud
+
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import batoceraFiles
+from Emulator import Emulator
+from settings.unixSettings import UnixSettings
+import utils.bezels as bezelsUtil
+import utils.videoMode as videoMode
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+# the bezels of the decoration, the user ones first, then the system ones not overridden by the user
+# the game bezels come first so that the system ones, shared by many games, are the last ones evicted from the cache
+def listBezels(bezel, games):
+    roots = [ batoceraFiles.overlayUser + "/" + bezel, batoceraFiles.overlaySystem + "/" + bezel ]
+    directories = []
+    if games:
+        systems = set()
+        for root in roots:
+            if os.path.isdir(root + "/games"):
+                systems.update([ system for system in os.listdir(root + "/games") if os.path.isdir(root + "/games/" + system) ])
+        directories += [ "/games/" + system for system in sorted(systems) ] + [ "/games" ]
+    directories += [ "/systems", "" ]
+
+    bezels = dict() # relative path -> png
+    for directory in directories:
+        for root in roots:
+            if not os.path.isdir(root + directory):
+                continue
+            for file in sorted(os.listdir(root + directory)):
+                if file.endswith(".png") and (directory + "/" + file) not in bezels:
+                    bezels[directory + "/" + file] = root + directory + "/" + file
+    return list(bezels.values())
+
+# the same decisions as libretroConfig.writeBezelConfig and launcher.getHudBezel, for them to find the renders in the cache
+def prerender(png, width, height, hud):
+    infos = {}
+    info = os.path.splitext(png)[0] + ".info"
+    if os.path.exists(info):
+        try:
+            infos = json.load(open(info))
+        except:
+            infos = {}
+
+    if width / float(height) >= 1.6:
+        if "width" in infos and "height" in infos and "top" in infos and "left" in infos and "bottom" in infos and "right" in infos:
+            bezel_width, bezel_height = infos["width"], infos["height"]
+        else:
+            bezel_width, bezel_height = bezelsUtil.fast_image_size(png)
+        if width != bezel_width or height != bezel_height:
+            bezelsUtil.cachedPadImage(png, width, height, bezel_width, bezel_height)
+
+    if hud:
+        if "width" in infos and "height" in infos:
+            bezel_width, bezel_height = infos["width"], infos["height"]
+        else:
+            bezel_width, bezel_height = bezelsUtil.fast_image_size(png)
+        if abs(width / height - bezel_width / bezel_height) <= 0.01 and (width != bezel_width or height != bezel_height):
+            bezelsUtil.cachedResizeImage(png, width, height)
+
+def waitIdle(maxload):
+    while os.getloadavg()[0] > maxload:
+        time.sleep(30)
+
+def main():
+    parser = argparse.ArgumentParser(description="bezels pre-rendering for the current resolution")
+    parser.add_argument("-b", "--bezel", help="decoration set (default: the one of batocera.conf)", default=None)
+    parser.add_argument("-g", "--games", help="the game bezels too", action="store_true")
+    parser.add_argument("--hud", help="the bezels resized for the hud too", action="store_true")
+    parser.add_argument("-j", "--jobs", help="number of processes (default: number of cores)", type=int, default=os.cpu_count())
+    parser.add_argument("--idle", help="wait for the load average to be under this value first", type=float, default=None)
+    args = parser.parse_args()
+
+    # the launches have priority, the workers inherit it
+    os.nice(19)
+    if args.idle is not None:
+        waitIdle(args.idle)
+
+    bezel = args.bezel
+    if bezel is None:
+        bezel = UnixSettings.snapshot(batoceraFiles.batoceraConf).loadAll('global').get('bezel')
+    if bezel is None:
+        bezel = Emulator.get_compiled_defaults("/usr/share/batocera/configgen/configgen-defaults.yml", "/usr/share/batocera/configgen/configgen-defaults-arch.yml")["default"].get("options", {}).get("bezel")
+    if bezel is None or bezel == "" or bezel == "none":
+        print("no decoration set")
+        return 0
+
+    resolution = videoMode.getCurrentResolution()
+    bezels = listBezels(bezel, args.games)
+    print("{} bezels of {} for {}x{}".format(len(bezels), bezel, resolution["width"], resolution["height"]))
+
+    start = time.monotonic()
+    nbfailures = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        jobs = { executor.submit(prerender, png, resolution["width"], resolution["height"], args.hud): png for png in bezels }
+        for job in as_completed(jobs):
+            try:
+                job.result()
+            except Exception as e:
+                nbfailures += 1
+                eslog.error("unable to render {}: {}".format(jobs[job], e))
+    print("done in {:.1f}s, {} failures".format(time.monotonic() - start, nbfailures))
+    return 0 if nbfailures == 0 else 1
+
+if __name__ == '__main__':
+    exit(main())
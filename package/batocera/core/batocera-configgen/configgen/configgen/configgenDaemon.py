@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+# resident configgen: keeps the launcher, the generators and their dependencies imported
+# and forks a worker for each emulatorlauncher request received on the unix socket.
+# the client passes its stdin/stdout/stderr so that the logs still go where es expects them.
+#
+# protocol (one json document per line):
+#   client -> daemon : {"args": {...}, "cwd": "...", "env": {...}} + the 3 std fds (SCM_RIGHTS)
+#   daemon -> client : {"pid": <worker pid>}
+#   daemon -> client : {"exitcode": <emulator exit code>}
+# the client doesn't send anything else: the end of the connection means it died, the worker then kills the emulator.
+# the emulator is a child of the worker, not of emulatorlauncher: its pid is published in /var/run/configgen-emulator.pid
+# for batocera-es-swissknife.
+
+import os
+import sys
+import json
+import array
+import signal
+import socket
+import argparse
+import threading
+import batoceraFiles
+from settings.unixSettings import UnixSettings
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+NB_STD_FDS = 3
+
+# worker state
+pendingSignal = None # the signal to send to the emulator, received before it was started
+launchDone = False
+
+def forward(args):
+    # returns the exit code of the launch done by the daemon, None if no daemon is available
+    if not os.path.exists(batoceraFiles.configgenSocket):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(batoceraFiles.configgenSocket)
+    except OSError as e:
+        eslog.debug("configgen daemon not available: {}".format(e))
+        sock.close()
+        return None
+
+    with sock:
+        request = json.dumps({ "args": vars(args), "cwd": os.getcwd(), "env": dict(os.environ) }) + "\n"
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            sock.sendmsg([request.encode()], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", _stdFds()))])
+        except OSError as e:
+            eslog.debug("unable to send the request to the configgen daemon: {}".format(e))
+            return None
+
+        worker = None
+        for line in sock.makefile("r"):
+            answer = json.loads(line)
+            if "pid" in answer:
+                worker = answer["pid"]
+                eslog.debug("launch handled by the configgen daemon (worker {})".format(worker))
+                # es stops the game by signaling this process, pass it to the worker
+                for sig in [signal.SIGINT, signal.SIGTERM]:
+                    signal.signal(sig, lambda signum, frame: _signalWorker(worker, signum))
+            elif "exitcode" in answer:
+                return answer["exitcode"]
+
+    if worker is None:
+        # the daemon died before starting the launch, it can still be done locally
+        return None
+    eslog.error("configgen daemon worker {} exited without exit code".format(worker))
+    return -1
+
+def _signalWorker(worker, signum):
+    try:
+        os.kill(worker, signum)
+    except ProcessLookupError:
+        pass
+
+def _stdFds():
+    fds = []
+    for stream in [sys.stdin, sys.stdout, sys.stderr]:
+        try:
+            fds.append(stream.fileno())
+        except (AttributeError, ValueError, OSError):
+            fds.append(os.open(os.devnull, os.O_RDWR))
+    return fds
+
+def serve():
+    # import everything once, the forked workers inherit it
+    import launcher
+    launcher.generators.preload()
+    from Evmapy import evmapyKeysIndex
+    evmapyKeysIndex.refresh()
+    from generators.mame.messRegistry import messRegistry
+    messRegistry.load()
+    from generators.mame.mameControlScheme import controlSchemeClassifier
+    controlSchemeClassifier.load()
+    import generators.libretro.libretroMAMEConfig # imported by the libretro mame launches only
+
+    if os.path.exists(batoceraFiles.configgenSocket):
+        os.unlink(batoceraFiles.configgenSocket)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(batoceraFiles.configgenSocket)
+    server.listen(4)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN) # workers are reaped automatically
+    eslog.info("configgen daemon listening on {}".format(batoceraFiles.configgenSocket))
+
+    try:
+        while True:
+            conn, addr = server.accept()
+            # parsed here while batocera.conf doesn't change, so that the workers inherit it
+            try:
+                UnixSettings.snapshot(batoceraFiles.batoceraConf)
+            except Exception as e:
+                eslog.error("unable to read {}: {}".format(batoceraFiles.batoceraConf, e))
+            evmapyKeysIndex.refresh()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                server.close()
+                status = 1
+                try:
+                    status = runWorker(conn, launcher)
+                except Exception:
+                    eslog.error("configgen daemon worker exception: ", exc_info=True)
+                finally:
+                    os._exit(status)
+            conn.close()
+    finally:
+        server.close()
+        if os.path.exists(batoceraFiles.configgenSocket):
+            os.unlink(batoceraFiles.configgenSocket)
+
+def runWorker(conn, launcher):
+    fdsize = array.array("i").itemsize
+    data, ancdata, flags, addr = conn.recvmsg(65536, socket.CMSG_LEN(NB_STD_FDS * fdsize))
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            return 1
+        data += chunk
+
+    fds = array.array("i")
+    for level, type, fddata in ancdata:
+        if level == socket.SOL_SOCKET and type == socket.SCM_RIGHTS:
+            fds.frombytes(fddata[:len(fddata) - (len(fddata) % fdsize)])
+    if len(fds) != NB_STD_FDS:
+        eslog.error("configgen daemon: invalid request, {} fds received".format(len(fds)))
+        return 1
+
+    # take the place of the client
+    for target, fd in enumerate(fds):
+        if fd != target:
+            os.dup2(fd, target)
+            os.close(fd)
+    request = json.loads(data.decode())
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL) # subprocess needs to wait for its children
+    signal.signal(signal.SIGTERM, terminateWorker)
+    launcher.procStarted = emulatorStarted
+    threading.Thread(target=watchClient, args=(conn,), name="client-watch", daemon=True).start()
+
+    global launchDone
+    conn.sendall((json.dumps({ "pid": os.getpid() }) + "\n").encode())
+    try:
+        exitcode = launcher.launch(argparse.Namespace(**request["args"]))
+    finally:
+        launchDone = True
+        removeEmulatorPid()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        conn.sendall((json.dumps({ "exitcode": exitcode }) + "\n").encode())
+    except OSError:
+        eslog.debug("emulatorlauncher is gone, exit code {} not sent".format(exitcode))
+    conn.close()
+    return 0
+
+def stopEmulator(signum):
+    global pendingSignal
+    import launcher
+    pendingSignal = signum
+    if launcher.proc:
+        eslog.debug('terminating proc')
+        launcher.proc.send_signal(signum)
+
+def terminateWorker(signum, frame):
+    eslog.debug('Exiting')
+    stopEmulator(signal.SIGTERM)
+
+# the client never sends anything after the request, the end of the connection means that it died (kill -9...)
+def watchClient(conn):
+    try:
+        while conn.recv(4096):
+            pass
+    except OSError:
+        pass
+    if not launchDone:
+        eslog.debug("emulatorlauncher is gone, killing the emulator")
+        stopEmulator(signal.SIGKILL)
+
+def emulatorStarted(proc):
+    try:
+        tmpfile = "{}.{}.tmp".format(batoceraFiles.configgenEmulatorPid, os.getpid())
+        with open(tmpfile, "w") as f:
+            f.write("{}\n".format(proc.pid))
+        os.replace(tmpfile, batoceraFiles.configgenEmulatorPid)
+    except OSError as e:
+        eslog.debug("unable to write {}: {}".format(batoceraFiles.configgenEmulatorPid, e))
+    # stopped before it was even started
+    if pendingSignal is not None:
+        eslog.debug('terminating proc')
+        proc.send_signal(pendingSignal)
+
+def removeEmulatorPid():
+    try:
+        with open(batoceraFiles.configgenEmulatorPid) as f:
+            import launcher
+            if launcher.proc is None or f.read().strip() != str(launcher.proc.pid):
+                return # not ours
+        os.unlink(batoceraFiles.configgenEmulatorPid)
+    except OSError:
+        pass
+
+if __name__ == '__main__':
+    serve()
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
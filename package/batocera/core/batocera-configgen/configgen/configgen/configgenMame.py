@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+# fills the cache of the mame machines infos (see generators/mame/mameMachines.py) with all the machines of the mame binary,
+# so that the launches don't run mame -listxml. nothing to do when it is already complete for this binary.
+#   configgen-mame              build it if needed
+#   configgen-mame -m pacman    show the infos of a machine
+
+import os
+import time
+import argparse
+from generators.mame import mameMachines
+
+def waitIdle(maxload):
+    while os.getloadavg()[0] > maxload:
+        time.sleep(30)
+
+def main():
+    parser = argparse.ArgumentParser(description="mame machines infos cache")
+    parser.add_argument("-f", "--force", help="build it even if it is complete", action="store_true")
+    parser.add_argument("-m", "--machine", help="show the infos of this machine", default=None)
+    parser.add_argument("--idle", help="wait for the load average to be under this value first", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.machine is not None:
+        print(mameMachines.getMachineInfos(args.machine))
+        return 0
+
+    if mameMachines.binaryStamp() is None:
+        print("{} not found".format(mameMachines.mameBin))
+        return 0
+    if mameMachines.isComplete() and not args.force:
+        print("the mame machines cache is complete")
+        return 0
+
+    # the launches have priority
+    os.nice(19)
+    if args.idle is not None:
+        waitIdle(args.idle)
+
+    start = time.monotonic()
+    nbmachines = mameMachines.buildCache()
+    print("{} machines in {:.1f}s".format(nbmachines, time.monotonic() - start))
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
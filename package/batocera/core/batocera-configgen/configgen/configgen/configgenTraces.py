@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# where does the launch time go ? durations by phase over the last launches traced by utils/trace.py
+# a phase done several times in a launch (ie videoMode.getCurrentMode) counts for its total in the launch
+
+import sys
+import math
+import json
+import argparse
+import utils.trace as trace
+
+def percentile(values, p):
+    # nearest rank, values are sorted
+    rank = max(1, math.ceil(p / 100.0 * len(values)))
+    return values[rank - 1]
+
+def loadDurations(files):
+    durations = dict() # phase -> [ms by launch]
+    calls = dict()     # phase -> nb of calls
+    nbtraces = 0
+    for file in files:
+        try:
+            with open(file) as f:
+                events = json.load(f)["traceEvents"]
+        except (IOError, ValueError, KeyError) as e:
+            print("skipping {}: {}".format(file, e), file=sys.stderr)
+            continue
+        nbtraces += 1
+        launch = dict()
+        for event in events:
+            if event.get("ph") != "X":
+                continue
+            launch[event["name"]] = launch.get(event["name"], 0) + event["dur"] / 1000.0
+            calls[event["name"]] = calls.get(event["name"], 0) + 1
+        for name in launch:
+            if name not in durations:
+                durations[name] = []
+            durations[name].append(launch[name])
+    return (nbtraces, durations, calls)
+
+def main():
+    parser = argparse.ArgumentParser(description="configgen launch phases percentiles")
+    parser.add_argument("-n", "--last", help="number of launches", type=int, default=20)
+    parser.add_argument("-p", "--phase", help="only the phases starting with this prefix (ie videoMode.)", default=None)
+    parser.add_argument("-d", "--dir", help="traces directory", default=trace.traceDir)
+    args = parser.parse_args()
+
+    files = trace.listTraces(args.dir)
+    if args.last > 0:
+        files = files[-args.last:]
+    (nbtraces, durations, calls) = loadDurations(files)
+    if nbtraces == 0:
+        print("no trace found in {}".format(args.dir))
+        return 1
+
+    print("{} launches ({})".format(nbtraces, args.dir))
+    print("{:<40} {:>8} {:>6} {:>9} {:>9} {:>9} {:>9}".format("phase (ms)", "launches", "calls", "p50", "p90", "p99", "max"))
+    rows = []
+    for name in durations:
+        if args.phase is not None and not name.startswith(args.phase):
+            continue
+        values = sorted(durations[name])
+        rows.append((percentile(values, 50), name, values))
+    for (p50, name, values) in sorted(rows, key=lambda row: row[0], reverse=True):
+        print("{:<40} {:>8} {:>6} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f}".format(name, len(values), calls[name], p50, percentile(values, 90), percentile(values, 99), values[-1]))
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
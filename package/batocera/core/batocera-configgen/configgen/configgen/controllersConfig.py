@@ -1,8 +1,18 @@
 #!/usr/bin/env python
+import os
+import pickle
+import hashlib
 import xml.etree.ElementTree as ET
 import batoceraFiles
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
 
 esInputs = batoceraFiles.esInputs
+esInputsCache = batoceraFiles.CACHE + "/configgen/es_input.pickle"
+ES_INPUTS_CACHE_VERSION = 1
+sdlGameDBCache = batoceraFiles.CACHE + "/configgen/gamecontrollerdb"
+sdlGameDBCacheMaxFiles = 32
 
 """Default mapping of Batocera keys to SDL_GAMECONTROLLERCONFIG keys."""
 _DEFAULT_SDL_MAPPING = {
@@ -18,6 +28,8 @@ _DEFAULT_SDL_MAPPING = {
 }
 
 class Input:
+    __slots__ = ("name", "type", "id", "value", "code")
+
     def __init__(self, name, type, id, value, code):
         self.name = name
         self.type = type
@@ -27,6 +39,8 @@ class Input:
 
 
 class Controller:
+    __slots__ = ("type", "configName", "index", "realName", "guid", "player", "dev", "nbbuttons", "nbhats", "nbaxes", "inputs")
+
     def __init__(self, configName, type, guid, player, index="-1", realName="", inputs=None, dev=None, nbbuttons=None, nbhats=None, nbaxes=None):
         self.type = type
         self.configName = configName
@@ -47,35 +61,73 @@ class Controller:
         return _generateSdlGameControllerConfig(self)
 
 
+# controllers by guid+name, indexed by guid and by name too
+# the first one in the order of es_input.cfg wins, as when they were searched one after the other
+class ControllersIndex(dict):
+    def __init__(self, controllers):
+        dict.__init__(self, controllers)
+        self.byGuid = dict()
+        self.byName = dict()
+        for controller in self.values():
+            if controller.guid not in self.byGuid:
+                self.byGuid[controller.guid] = controller
+            if controller.configName not in self.byName:
+                self.byName[controller.configName] = controller
+
+
+# the controllers of es_input.cfg in the order of the file, parsed once and pickled as tuples in the cache directory
+# (much faster to load than objects), reused as long as the file has the same mtime and size
+def loadEsInputs():
+    st = os.stat(esInputs)
+    stamp = (esInputs, st.st_mtime_ns, st.st_size)
+
+    configs = None
+    try:
+        with open(esInputsCache, 'rb') as f:
+            cached = pickle.load(f)
+        if cached["version"] == ES_INPUTS_CACHE_VERSION and cached["stamp"] == stamp:
+            configs = cached["configs"]
+    except Exception:
+        pass # missing or outdated cache
+
+    if configs is None:
+        configs = []
+        tree = ET.parse(esInputs)
+        root = tree.getroot()
+        for controller in root.findall(".//inputConfig"):
+            inputs = tuple([ (input.get("name"), input.get("type"), input.get("id"), input.get("value"), input.get("code")) for input in controller.findall("input") ])
+            configs.append((controller.get("deviceName"), controller.get("type"), controller.get("deviceGUID"), inputs))
+        try:
+            os.makedirs(os.path.dirname(esInputsCache), exist_ok=True)
+            tmpfile = "{}.{}.tmp".format(esInputsCache, os.getpid())
+            with open(tmpfile, 'wb') as f:
+                pickle.dump({ "version": ES_INPUTS_CACHE_VERSION, "stamp": stamp, "configs": configs }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, esInputsCache)
+        except Exception as e:
+            eslog.debug("unable to save {}: {}".format(esInputsCache, e))
+
+    controllers = []
+    for (deviceName, type, deviceGUID, inputs) in configs:
+        controllerInstance = Controller(deviceName, type, deviceGUID, None, None)
+        for input in inputs:
+            controllerInstance.inputs[input[0]] = Input(*input)
+        controllers.append(controllerInstance)
+    return controllers
+
+
 # Load all controllers from the es_input.cfg
 def loadAllControllersConfig():
     controllers = dict()
-    tree = ET.parse(esInputs)
-    root = tree.getroot()
-    for controller in root.findall(".//inputConfig"):
-        controllerInstance = Controller(controller.get("deviceName"), controller.get("type"),
-                                        controller.get("deviceGUID"), None, None)
-        uidname = controller.get("deviceGUID") + controller.get("deviceName")
-        controllers[uidname] = controllerInstance
-        for input in controller.findall("input"):
-            inputInstance = Input(input.get("name"), input.get("type"), input.get("id"), input.get("value"), input.get("code"))
-            controllerInstance.inputs[input.get("name")] = inputInstance
-    return controllers
+    for controller in loadEsInputs():
+        controllers[controller.guid + controller.configName] = controller
+    return ControllersIndex(controllers)
 
 
 # Load all controllers from the es_input.cfg
 def loadAllControllersByNameConfig():
     controllers = dict()
-    tree = ET.parse(esInputs)
-    root = tree.getroot()
-    for controller in root.findall(".//inputConfig"):
-        controllerInstance = Controller(controller.get("deviceName"), controller.get("type"),
-                                        controller.get("deviceGUID"), None, None)
-        deviceName = controller.get("deviceName")
-        controllers[deviceName] = controllerInstance
-        for input in controller.findall("input"):
-            inputInstance = Input(input.get("name"), input.get("type"), input.get("id"), input.get("value"), input.get("code"))
-            controllerInstance.inputs[input.get("name")] = inputInstance
+    for controller in loadEsInputs():
+        controllers[controller.configName] = controller
     return controllers
 
 
@@ -91,23 +143,23 @@ def loadControllerConfig(controllersInput):
     return playerControllers
 
 def findBestControllerConfig(controllers, x, pxguid, pxindex, pxname, pxdev, pxnbbuttons, pxnbhats, pxnbaxes):
-    # when there will have more joysticks, use hash tables
-    for controllerGUID in controllers:
-        controller = controllers[controllerGUID]
-        if controller.guid == pxguid and controller.configName == pxname:
-            return Controller(controller.configName, controller.type, pxguid, x, pxindex, pxname,
-                              controller.inputs, pxdev, pxnbbuttons, pxnbhats, pxnbaxes)
-    for controllerGUID in controllers:
-        controller = controllers[controllerGUID]
-        if controller.guid == pxguid:
-            return Controller(controller.configName, controller.type, pxguid, x, pxindex, pxname,
-                              controller.inputs, pxdev, pxnbbuttons, pxnbhats, pxnbaxes)
-    for controllerGUID in controllers:
-        controller = controllers[controllerGUID]
-        if controller.configName == pxname:
-            return Controller(controller.configName, controller.type, pxguid, x, pxindex, pxname,
-                              controller.inputs, pxdev, pxnbbuttons, pxnbhats, pxnbaxes)
-    return None
+    if not isinstance(controllers, ControllersIndex):
+        controllers = ControllersIndex(controllers)
+
+    # by guid and name, then by guid, then by name
+    controller = None
+    if pxguid is not None and pxname is not None:
+        controller = controllers.get(pxguid + pxname)
+        if controller is not None and (controller.guid != pxguid or controller.configName != pxname):
+            controller = None
+    if controller is None:
+        controller = controllers.byGuid.get(pxguid)
+    if controller is None:
+        controller = controllers.byName.get(pxname)
+    if controller is None:
+        return None
+    return Controller(controller.configName, controller.type, pxguid, x, pxindex, pxname,
+                      controller.inputs, pxdev, pxnbbuttons, pxnbhats, pxnbaxes)
 
 
 def _generateSdlGameControllerConfig(controller, sdlMapping=_DEFAULT_SDL_MAPPING):
@@ -195,13 +247,46 @@ def _keyToSdlGameControllerConfig(keyname, name, type, id, value=None):
 def generateSdlGameControllerConfig(controllers):
     configs = []
     for idx, controller in controllers.items():
-        configs.append(controller.generateSDLGameDBLine())
+        config = controller.generateSDLGameDBLine()
+        # the same pad several times gives the same line (a different mapping for the same guid is kept, sdl uses the last one)
+        if config not in configs:
+            configs.append(config)
     return "\n".join(configs)
 
 
+# the gamecontrollerdb of the controllers, one file per content in the cache,
+# so that the emulators reading a file get a link to it instead of a new copy at each launch
+def getSDLGameDBFile(controllers):
+    content = generateSdlGameControllerConfig(controllers)
+    dbFile = "{}/{}.txt".format(sdlGameDBCache, hashlib.sha1(content.encode("utf-8")).hexdigest())
+    if os.path.exists(dbFile):
+        os.utime(dbFile) # recently used
+        return dbFile
+
+    os.makedirs(sdlGameDBCache, exist_ok=True)
+    tmpfile = "{}.{}.tmp".format(dbFile, os.getpid())
+    with open(tmpfile, "w", encoding="utf-8") as text_file:
+        text_file.write(content)
+    os.replace(tmpfile, dbFile)
+
+    # keep only the last ones, the links to the removed ones are updated at the next launch
+    files = sorted([ (entry.stat().st_mtime, entry.path) for entry in os.scandir(sdlGameDBCache) if entry.name.endswith(".txt") ])
+    for (mtime, path) in files[:-sdlGameDBCacheMaxFiles]:
+        if path != dbFile:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return dbFile
+
+
 def writeSDLGameDBAllControllers(controllers, outputFile = "/tmp/gamecontrollerdb.txt"):
-    with open(outputFile, "w") as text_file:
-        text_file.write(generateSdlGameControllerConfig(controllers))
+    dbFile = getSDLGameDBFile(controllers)
+    if os.path.islink(outputFile) and os.readlink(outputFile) == dbFile:
+        return outputFile # already the good one
+    tmpfile = "{}.{}.tmp".format(outputFile, os.getpid())
+    os.symlink(dbFile, tmpfile)
+    os.replace(tmpfile, outputFile)
     return outputFile
 
 def generateSdlGameControllerPadsOrderConfig(controllers):
@@ -170,12 +170,14 @@ class AmiberryGenerator(Generator):
             commandArray.append("-s")
             commandArray.append("sound_max_buff=4096")
 
-            os.chdir("/usr/share/amiberry")
             return Command.Command(array=commandArray,env={
                 "SDL_GAMECONTROLLERCONFIG": controllersConfig.generateSdlGameControllerConfig(playersControllers)})
         # otherwise, unknown format
         return Command.Command(array=[])
 
+    def executionDirectory(self, config, rom):
+        return "/usr/share/amiberry"
+
     def floppiesFromRom(self, rom):
         floppies = []
         
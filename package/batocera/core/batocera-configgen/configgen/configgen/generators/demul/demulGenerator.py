@@ -64,8 +64,6 @@ class DemulGenerator(Generator):
         elif demulsystem == "awave":
             romname = rom.replace("/userdata/roms/atomiswave/", "")
 
-        # move to the emulator path to ensure configs are saved etc
-        os.chdir(emupath)
         configFileName = emupath + "/Demul.ini"
         Config = configparser.ConfigParser(interpolation=None)
         Config.optionxform = str
@@ -212,3 +210,7 @@ class DemulGenerator(Generator):
                 "SPA_PLUGIN_DIR": "/usr/lib/spa-0.2:/lib32/spa-0.2",
                 "PIPEWIRE_MODULE_DIR": "/usr/lib/pipewire-0.3:/lib32/pipewire-0.3"
             })
+
+    # the emulator path, to ensure configs are saved etc
+    def executionDirectory(self, config, rom):
+        return batoceraFiles.SAVES + "/demul/demul"
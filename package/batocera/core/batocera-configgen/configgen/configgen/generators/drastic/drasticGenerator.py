@@ -86,7 +86,6 @@ class DrasticGenerator(Generator):
         #Configuring Pad in the cfg
         configurePads(settings, system, drastic_conf)
 
-        os.chdir(drastic_root)
         commandArray = [drastic_bin, rom]
         #subprocess.Popen(commandArray, cwd=drastic_root) # Launched two times if activated
         return Command.Command(
@@ -97,6 +96,9 @@ class DrasticGenerator(Generator):
                 'SDL_GAMECONTROLLERCONFIG': controllersConfig.generateSdlGameControllerConfig(playersControllers)
             })
 
+    def executionDirectory(self, config, rom):
+        return "/userdata/system/configs/drastic"
+
 # Language auto-setting
 def getDrasticLangFromEnvironment():
     lang = environ['LANG'][:5]
@@ -193,6 +195,3 @@ def configurePads(settings, system, drastic_conf):
     f.write("\n")    
     f.write(padpart)
     f.close()
-
-#    def executionDirectory(self, config, rom):
-#        return os.path.dirname(drastic_root)
@@ -21,10 +21,12 @@ class ECWolfGenerator(Generator):
         if not path.isdir(ecwolfSaves):
             os.mkdir(ecwolfSaves)
 
-        try:
-            os.chdir(rom)
-        # Only game directories, not .zip
-        except Exception as e:
-            print("Error: couldn't go into directory {} ({})".format(rom, e))
         commandArray = ["ecwolf", "--fullscreen", "--joystick", "--savedir /userdata/saves/ecwolf", "--config /userdata/system/configs/ecwolf/ecwolf.cfg"]
         return Command.Command(array=commandArray)
+
+    # Only game directories, not .zip
+    def executionDirectory(self, config, rom):
+        if path.isdir(rom):
+            return rom
+        print("Error: couldn't go into directory {}".format(rom))
+        return None
@@ -3,14 +3,13 @@ import sys
 import os
 import batoceraFiles
 from . import libretroOptions
-from . import libretroMAMEConfig
 from Emulator import Emulator
 import settings
 from settings.unixSettings import UnixSettings
 import json
 import subprocess
 from utils.logger import get_logger
-from PIL import Image, ImageOps
+from utils.trace import span
 import utils.bezels as bezelsUtil
 import utils.videoMode as videoMode
 
@@ -59,6 +58,7 @@ systemNetplayModes = {'host', 'client', 'spectator'}
 # Cores that require .slang shaders (even on OpenGL, not only Vulkan)
 coreForceSlangShaders = { 'mupen64plus-next' }
 
+@span("libretro.config")
 def writeLibretroConfig(retroconfig, system, controllers, rom, bezel, gameResolution, gfxBackend):
     writeLibretroConfigToFile(retroconfig, createLibretroConfig(system, controllers, rom, bezel, gameResolution, gfxBackend))
 
@@ -86,6 +86,8 @@ def createLibretroConfig(system, controllers, rom, bezel, gameResolution, gfxBac
         libretroOptions.generateHatariConf(batoceraFiles.hatariConf)
 
     if system.config['core'] in [ 'mame', 'mess', 'mamevirtual' ]:
+        # imported for the mame cores only, with the mame modules it uses
+        from . import libretroMAMEConfig
         libretroMAMEConfig.generateMAMEConfigs(controllers, system, rom)
 
     retroarchConfig = dict()
@@ -649,6 +651,7 @@ def writeLibretroConfigToFile(retroconfig, config):
     for setting in config:
         retroconfig.save(setting, config[setting])
 
+@span("libretro.bezel")
 def writeBezelConfig(bezel, retroarchConfig, rom, gameResolution, system):
     # disable the overlay
     # if all steps are passed, enable them
@@ -744,14 +747,6 @@ def writeBezelConfig(bezel, retroarchConfig, rom, gameResolution, system):
         if gameResolution["width"] < infos["width"] or gameResolution["height"] < infos["height"]:
             bezel_stretch = True
 
-        if bezel_game is True:
-            output_png_file = "/tmp/bezel_game_adapted.png"
-            create_new_bezel_file = True
-        else:
-            # The logic to cache system bezels is not true anymore now that we have tattoos
-            output_png_file = "/tmp/" + os.path.splitext(os.path.basename(overlay_png_file))[0] + "_adapted.png"
-            create_new_bezel_file = True
-
         if bezel_stretch:
             retroarchConfig['custom_viewport_x']      = infos["left"] * wratio
             retroarchConfig['custom_viewport_y']      = infos["top"] * hratio
@@ -769,20 +764,15 @@ def writeBezelConfig(bezel, retroarchConfig, rom, gameResolution, system):
             retroarchConfig['video_message_pos_x']    = infos["messagex"] + xoffset/2
             retroarchConfig['video_message_pos_y']    = infos["messagey"] + yoffset/2
 
-        if create_new_bezel_file is True:
-            # Padding left and right borders for ultrawide screens (larger than 16:9 aspect ratio)
-            # or up/down for 4K
-            eslog.debug("Generating a new adapted bezel file {}".format(output_png_file))
-            try:
-                bezelsUtil.padImage(overlay_png_file, output_png_file, gameResolution["width"], gameResolution["height"], infos["width"], infos["height"])
-            except Exception as e:
-                eslog.debug("Failed to create the adapated image: {}".format(e))
-                return
-        overlay_png_file = output_png_file # replace by the new file (recreated or cached in /tmp)
+        # Padding left and right borders for ultrawide screens (larger than 16:9 aspect ratio)
+        # or up/down for 4K
+        try:
+            overlay_png_file = bezelsUtil.cachedPadImage(overlay_png_file, gameResolution["width"], gameResolution["height"], infos["width"], infos["height"])
+        except Exception as e:
+            eslog.debug("Failed to create the adapated image: {}".format(e))
+            return
         if system.isOptSet('bezel.tattoo') and system.config['bezel.tattoo'] != "0":
-            output_png = "/tmp/bezel_tattooed.png"
-            bezelsUtil.tatooImage(overlay_png_file, output_png_file, system)
-            overlay_png_file = output_png_file
+            overlay_png_file = bezelsUtil.cachedTatooImage(overlay_png_file, system)
     else:
         if viewPortUsed:
             retroarchConfig['custom_viewport_x']      = infos["left"]
@@ -792,9 +782,7 @@ def writeBezelConfig(bezel, retroarchConfig, rom, gameResolution, system):
         retroarchConfig['video_message_pos_x']    = infos["messagex"]
         retroarchConfig['video_message_pos_y']    = infos["messagey"]
         if system.isOptSet('bezel.tattoo') and system.config['bezel.tattoo'] != "0":
-            output_png = "/tmp/bezel_tattooed.png"
-            bezelsUtil.tatooImage(overlay_png_file, output_png, system)
-            overlay_png_file = output_png
+            overlay_png_file = bezelsUtil.cachedTatooImage(overlay_png_file, system)
 
     eslog.debug("Bezel file set to {}".format(overlay_png_file))
     writeBezelCfgConfig(overlay_cfg_file, overlay_png_file)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+# the mame cfg files (default.cfg and the per system ones) written by the standalone and the libretro mame.
+# read and built with ElementTree, written the way minidom toprettyxml did (without its empty lines),
+# and not written at all when the file already holds the same config (mame rewrites them at exit, in its own layout).
+
+import os
+import xml.etree.ElementTree as ET
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+# keeps the comments, the ones around the root too (mame writes one before <mameconfig>)
+class ConfigTreeBuilder(ET.TreeBuilder):
+
+    def __init__(self):
+        super().__init__(insert_comments=True)
+        self.depth = 0
+        self.rootDone = False
+        self.prolog = []
+        self.epilog = []
+
+    def start(self, tag, attrs):
+        self.depth += 1
+        return super().start(tag, attrs)
+
+    def end(self, tag):
+        self.depth -= 1
+        if self.depth == 0:
+            self.rootDone = True
+        return super().end(tag)
+
+    def comment(self, text):
+        node = super().comment(text)
+        if self.depth == 0:
+            if self.rootDone:
+                self.epilog.append(node)
+            else:
+                self.prolog.append(node)
+        return node
+
+def escape(data):
+    return data.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+# the nodes as minidom sees them: text, elements and comments, the tails being text nodes
+def childNodes(element):
+    nodes = []
+    if element.text:
+        nodes.append(element.text)
+    for child in element:
+        nodes.append(child)
+        if child.tail:
+            nodes.append(child.tail)
+    return nodes
+
+# minidom Node.writexml(indent="\t", newl="\n")
+def writeNode(out, node, indent):
+    if isinstance(node, str):
+        out.append(indent + escape(node) + "\n")
+    elif node.tag is ET.Comment:
+        out.append("{}<!--{}-->\n".format(indent, node.text))
+    else:
+        out.append(indent + "<" + node.tag)
+        for (name, value) in node.attrib.items():
+            out.append(" {}=\"{}\"".format(name, escape(value)))
+        nodes = childNodes(node)
+        if len(nodes) == 0:
+            out.append("/>\n")
+        elif len(nodes) == 1 and isinstance(nodes[0], str):
+            out.append(">{}</{}>\n".format(escape(nodes[0]), node.tag))
+        else:
+            out.append(">\n")
+            for child in nodes:
+                writeNode(out, child, indent + "\t")
+            out.append("{}</{}>\n".format(indent, node.tag))
+
+class MameConfigFile():
+
+    def __init__(self, configFile):
+        self.configFile = configFile
+        self.exists = os.path.exists(configFile)
+        self.prolog = []
+        self.epilog = []
+        self.root = None
+        self.current = None # the file content, as it would be written
+        if self.exists:
+            try:
+                builder = ConfigTreeBuilder()
+                self.root = ET.parse(configFile, ET.XMLParser(target=builder)).getroot()
+                self.prolog = builder.prolog
+                self.epilog = builder.epilog
+                self.current = self.toString()
+            except Exception as e:
+                eslog.debug("unable to read {}: {}".format(configFile, e)) # reinit the file
+                self.root = None
+        if self.root is None or self.root.tag != "mameconfig":
+            self.root = ET.Element("mameconfig")
+            self.prolog = []
+            self.epilog = []
+
+    # the first one, created if needed
+    def getSection(self, parent, name):
+        section = parent.find(name)
+        if section is None:
+            section = ET.SubElement(parent, name)
+        return section
+
+    # removes the existing ones and adds an empty one
+    def resetSection(self, parent, name):
+        for section in parent.findall(name):
+            parent.remove(section)
+        return ET.SubElement(parent, name)
+
+    def toString(self):
+        out = [ '<?xml version="1.0" ?>\n' ]
+        for node in self.prolog + [ self.root ] + self.epilog:
+            writeNode(out, node, "")
+        return "\n".join([ s for s in "".join(out).splitlines() if s.strip() ])
+
+    # returns False when the file already holds this config, written atomically otherwise
+    def save(self):
+        content = self.toString()
+        if content == self.current:
+            eslog.debug("{} is unchanged".format(self.configFile))
+            return False
+        target = os.path.realpath(self.configFile)
+        tmpfile = "{}.{}.tmp".format(target, os.getpid())
+        try:
+            with open(tmpfile, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmpfile, target)
+        finally:
+            if os.path.exists(tmpfile):
+                os.remove(tmpfile)
+        self.current = content
+        return True
+
+# a <port> with its <newseq> (type, value)
+def portElement(attributes, sequences):
+    port = ET.Element("port", attributes)
+    for (seqtype, value) in sequences:
+        newseq = ET.SubElement(port, "newseq", { "type": seqtype })
+        newseq.text = value
+    return port
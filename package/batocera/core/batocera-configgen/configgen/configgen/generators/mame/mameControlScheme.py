@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+# the control scheme of a mame game (for the games with 5-6 buttons or other unusual controls), used by the standalone and the libretro mame.
+# the game lists (mameCapcom.txt...) are read once into a single rom name -> family dict, kept in memory
+# (the configgen daemon workers inherit it), and read again only when one of them changes.
+
+import os
+from utils.trace import span
+
+# in the order they were tested, the first list wins
+families = [
+    ("capcom",    "mameCapcom.txt"),
+    ("mk",        "mameMKombat.txt"),
+    ("ki",        "mameKInstinct.txt"),
+    ("neogeo",    "mameNeogeo.txt"),
+    ("twinstick", "mameTwinstick.txt"),
+    ("qbert",     "mameRotatedstick.txt")
+]
+
+# family -> controller type (altlayout) -> scheme, "*" for any type. default when not found
+schemes = {
+    "capcom":    { "auto": "sfsnes", "snes": "sfsnes", "megadrive": "megadrive",   "fightstick": "sfstick" },
+    "mk":        { "auto": "mksnes", "snes": "mksnes", "megadrive": "mkmegadrive", "fightstick": "mkstick" },
+    "ki":        { "auto": "kisnes", "snes": "kisnes", "megadrive": "megadrive",   "fightstick": "sfstick" },
+    "neogeo":    { "*": "neomini" },
+    "twinstick": { "*": "twinstick" },
+    "qbert":     { "*": "qbert" },
+    None:        { "fightstick": "fightstick" }
+}
+
+class ControlSchemeClassifier():
+
+    def __init__(self, dataDir):
+        self.dataDir = dataDir
+        self.sources = None
+        self.roms = None
+        self.checkedPid = None
+
+    def getSources(self):
+        sources = []
+        for (family, file) in families:
+            st = os.stat(self.dataDir + "/" + file)
+            sources.append((file, st.st_mtime_ns, st.st_size))
+        return sources
+
+    # the files are checked once per process (per launch)
+    def load(self):
+        if self.roms is not None and self.checkedPid == os.getpid():
+            return self.roms
+        sources = self.getSources()
+        if self.roms is None or self.sources != sources:
+            roms = dict()
+            for (family, file) in families:
+                with open(self.dataDir + "/" + file) as f:
+                    for rom in f.read().split():
+                        roms.setdefault(rom, family)
+            self.roms = roms
+            self.sources = sources
+        self.checkedPid = os.getpid()
+        return self.roms
+
+    def getFamily(self, romName):
+        return self.load().get(romName)
+
+controlSchemeClassifier = ControlSchemeClassifier("/usr/share/batocera/configgen/data/mame")
+
+@span("mame.controlScheme")
+def getMameControlScheme(system, romBasename):
+    # Controls for games with 5-6 buttons or other unusual controls
+    if system.isOptSet("altlayout"):
+        controllerType = system.config["altlayout"] # Option was manually selected
+    else:
+        controllerType = "auto"
+
+    if controllerType in [ "default", "neomini", "neocd", "twinstick", "qbert" ]:
+        return controllerType
+
+    scheme = schemes[controlSchemeClassifier.getFamily(os.path.splitext(romBasename)[0])]
+    return scheme.get("*", scheme.get(controllerType, "default"))
@@ -6,19 +6,18 @@ import Command
 import shutil
 import os
 from utils.logger import get_logger
+from utils.trace import span
 from os import path
 from os import environ
 import configparser
-from xml.dom import minidom
 import codecs
 import shutil
 import utils.bezels as bezelsUtil
-import subprocess
-from xml.dom import minidom
-from PIL import Image, ImageOps
 from . import mameControllers
-from pathlib import Path
-import csv
+from . import mameMachines
+from .messRegistry import messRegistry
+from .mameControlScheme import getMameControlScheme
+from .mameSoftList import prepSoftwareList
 
 eslog = get_logger(__name__)
 
@@ -41,26 +40,9 @@ class MameGenerator(Generator):
             if not os.path.exists("/userdata/" + checkPath + "/"):
                 os.makedirs("/userdata/" + checkPath + "/")
 
-        messDataFile = '/usr/share/batocera/configgen/data/mame/messSystems.csv'
-        openFile = open(messDataFile, 'r')
-        messSystems = []
-        messSysName = []
-        messRomType = []
-        messAutoRun = []
-        with openFile:
-            messDataList = csv.reader(openFile, delimiter=';', quotechar="'")
-            for row in messDataList:
-                messSystems.append(row[0])
-                messSysName.append(row[1])
-                messRomType.append(row[2])
-                messAutoRun.append(row[3])
-        
         # Identify the current system, select MAME or MESS as needed.
-        try:
-            messMode = messSystems.index(system.name)
-        except ValueError:
-            messMode = -1
-        if messMode == -1:
+        messSystem = messRegistry.getSystem(system.name)
+        if messSystem is None:
             commandArray =  [ "/usr/bin/mame/mame" ]
         elif system.name == "vgmplay":
             commandArray =  [ "/usr/bin/mame/vgmplay" ]
@@ -78,7 +60,7 @@ class MameGenerator(Generator):
         # MAME options used here are explained as it's not always straightforward
         # A lot more options can be configured, just run mame -showusage and have a look
         commandArray += [ "-skip_gameinfo" ]
-        if messMode == -1:
+        if messSystem is None:
             commandArray += [ "-rompath",      romDirname ]
         else:
             if softList in subdirSoftList:
@@ -115,23 +97,25 @@ class MameGenerator(Generator):
             if not os.path.exists("/userdata/system/configs/mame/"):
                 os.makedirs("/userdata/system/configs/mame/")    
         else:
+            # the arcade systems other than mame have always used the folder of the last line of messSystems.csv (messSysName[-1])
+            cfgSystem = messSystem if messSystem is not None else messRegistry.getLastSystem()
             if customCfg:
-                cfgPath = "/userdata/system/configs/mame/" + messSysName[messMode]+ "/custom/"
+                cfgPath = "/userdata/system/configs/mame/" + cfgSystem.sysName+ "/custom/"
             else:
-                cfgPath = "/userdata/system/configs/mame/" + messSysName[messMode] + "/"
-            if not os.path.exists("/userdata/system/configs/mame/" + messSysName[messMode] + "/"):
-                os.makedirs("/userdata/system/configs/mame/" + messSysName[messMode] + "/")    
+                cfgPath = "/userdata/system/configs/mame/" + cfgSystem.sysName + "/"
+            if not os.path.exists("/userdata/system/configs/mame/" + cfgSystem.sysName + "/"):
+                os.makedirs("/userdata/system/configs/mame/" + cfgSystem.sysName + "/")    
         if not os.path.exists(cfgPath):
             os.makedirs(cfgPath)
 
         # MAME will create custom configs per game for MAME ROMs and MESS ROMs with no system attached (LCD games, TV games, etc.)
         # This will allow an alternate config path per game for MESS console/computer ROMs that may need additional config.
         if system.isOptSet("pergamecfg") and system.getOptBoolean("pergamecfg"):
-            if not messMode == -1:
-                if not messSysName[messMode] == "":
-                    if not os.path.exists("/userdata/system/configs/mame/" + messSysName[messMode] + "/"):
-                        os.makedirs("/userdata/system/configs/mame/" + messSysName[messMode]+ "/")
-                    cfgPath = "/userdata/system/configs/mame/" + messSysName[messMode]+ "/" + romBasename + "/"
+            if messSystem is not None:
+                if not messSystem.sysName == "":
+                    if not os.path.exists("/userdata/system/configs/mame/" + messSystem.sysName + "/"):
+                        os.makedirs("/userdata/system/configs/mame/" + messSystem.sysName+ "/")
+                    cfgPath = "/userdata/system/configs/mame/" + messSystem.sysName+ "/" + romBasename + "/"
                     if not os.path.exists(cfgPath):
                         os.makedirs(cfgPath)
         commandArray += [ "-cfg_directory"   ,    cfgPath ]
@@ -202,18 +186,19 @@ class MameGenerator(Generator):
         
         # Finally we pass game name
         # MESS will use the full filename and pass the system & rom type parameters if needed.
-        if messMode == -1 and not (system.isOptSet("hiscoreplugin") and system.getOptBoolean("hiscoreplugin") == False):
+        if messSystem is None:
             commandArray += [ romBasename ]
-            commandArray += [ "-plugins", "-plugin", "hiscore" ]
+            if not (system.isOptSet("hiscoreplugin") and system.getOptBoolean("hiscoreplugin") == False):
+                commandArray += [ "-plugins", "-plugin", "hiscore" ]
         else:
-            if messSysName[messMode] == "":
+            if messSystem.sysName == "":
                 commandArray += [ romBasename ]
             else:
                 # Alternate system for machines that have different configs (ie computers with different hardware)
                 if system.isOptSet("altmodel"):
                     commandArray += [ system.config["altmodel"] ]
                 else:
-                    commandArray += [ messSysName[messMode] ]
+                    commandArray += [ messSystem.sysName ]
 
                 if softList == "":
                     # Boot disk for Macintosh
@@ -233,7 +218,7 @@ class MameGenerator(Generator):
                         if system.isOptSet("altromtype"):
                             commandArray += [ "-" + system.config["altromtype"] ]
                         else:
-                            commandArray += [ "-" + messRomType[messMode] ]
+                            commandArray += [ "-" + messSystem.romType ]
                     else:
                         if system.isOptSet("bootdisk"):
                             if ((system.isOptSet("altromtype") and system.config["altromtype"] == "flop1") or not system.isOptSet("altromtype")) and system.config["bootdisk"] in [ "macos30", "macos608", "macos701", "macos75" ]:
@@ -241,37 +226,19 @@ class MameGenerator(Generator):
                             elif system.isOptSet("altromtype"):
                                 commandArray += [ "-" + system.config["altromtype"] ]
                             else:
-                                commandArray += [ "-" + messRomType[messMode] ]
+                                commandArray += [ "-" + messSystem.romType ]
                         else:
                             if system.isOptSet("altromtype"):
                                 commandArray += [ "-" + system.config["altromtype"] ]
                             else:
-                                commandArray += [ "-" + messRomType[messMode] ]
+                                commandArray += [ "-" + messSystem.romType ]
                     # Use the full filename for MESS ROMs
                     commandArray += [ rom ]
                 else:
                     # Prepare software lists
                     if softList != "":
-                        if not os.path.exists(softDir):
-                            os.makedirs(softDir)                    
-                        for fileName in os.listdir(softDir):
-                            checkFile = os.path.join(softDir, fileName)
-                            if os.path.islink(checkFile):
-                                os.unlink(checkFile)
-                            if os.path.isdir(checkFile):
-                                shutil.rmtree(checkFile)
-                        if not os.path.exists(softDir + "hash/"):
-                            os.makedirs(softDir + "hash/")
-                        # Clear existing hashfile links
-                        for hashFile in os.listdir(softDir + "hash/"):
-                            if hashFile.endswith('.xml'):
-                                os.unlink(softDir + "hash/" + hashFile)
-                        os.symlink("/usr/bin/mame/hash/" + softList + ".xml", softDir + "hash/" + softList + ".xml")
-                        if softList in subdirSoftList:
-                            romPath = Path(romDirname)
-                            os.symlink(str(romPath.parents[0]), softDir + softList, True)
-                        else:
-                            os.symlink(romDirname, softDir + softList, True)
+                        prepSoftwareList(subdirSoftList, softList, softDir, softDir + "hash/", "/usr/bin/mame/hash/", romDirname)
+                        if softList not in subdirSoftList:
                             commandArray += [ os.path.splitext(romBasename)[0] ]
 
                 #TI-99 32k RAM expansion & speech modules - enabled by default
@@ -299,15 +266,10 @@ class MameGenerator(Generator):
                             commandArray += [ '-autoboot_delay', '5', '-autoboot_command', 'LOADM”“,,R\n' ]
                 else:
                     # Check for an override file, otherwise use generic (if it exists)
-                    autoRunCmd = messAutoRun[messMode]
-                    autoRunFile = '/usr/share/batocera/configgen/data/mame/' + softList + '_autoload.csv'
-                    if os.path.exists(autoRunFile):
-                        openARFile = open(autoRunFile, 'r')
-                        with openARFile:
-                            autoRunList = csv.reader(openARFile, delimiter=';', quotechar="'")
-                            for row in autoRunList:
-                                if row[0].casefold() == os.path.splitext(romBasename)[0].casefold():
-                                    autoRunCmd = row[1] + "\\n"
+                    autoRunCmd = messSystem.autoRun
+                    autoRunSoft = messRegistry.getAutoRun(softList, os.path.splitext(romBasename)[0])
+                    if autoRunSoft is not None:
+                        autoRunCmd = autoRunSoft + "\\n"
                     if autoRunCmd != "":
                         commandArray += [ "-autoboot_delay", "3", "-autoboot_command", autoRunCmd ]
         
@@ -319,10 +281,10 @@ class MameGenerator(Generator):
         
         buttonLayout = getMameControlScheme(system, romBasename)
                 
-        if messMode == -1:
+        if messSystem is None:
             mameControllers.generatePadsConfig(cfgPath, playersControllers, "", dpadMode, buttonLayout, customCfg)
         else:
-            mameControllers.generatePadsConfig(cfgPath, playersControllers, messSysName[messMode], dpadMode, buttonLayout, customCfg)
+            mameControllers.generatePadsConfig(cfgPath, playersControllers, messSystem.sysName, dpadMode, buttonLayout, customCfg)
         
         # bezels
         if 'bezel' not in system.config or system.config['bezel'] == '':
@@ -332,8 +294,8 @@ class MameGenerator(Generator):
         if system.isOptSet('forceNoBezel') and system.getOptBoolean('forceNoBezel'):
             bezelSet = None
         try:
-            if messMode != -1:
-                MameGenerator.writeBezelConfig(bezelSet, system, rom, messSysName[messMode])
+            if messSystem is not None:
+                MameGenerator.writeBezelConfig(bezelSet, system, rom, messSystem.sysName)
             else:
                 MameGenerator.writeBezelConfig(bezelSet, system, rom, "")
         except:
@@ -374,6 +336,7 @@ class MameGenerator(Generator):
             old.unlink()
 
     @staticmethod
+    @span("mame.bezel")
     def writeBezelConfig(bezelSet, system, rom, messSys):
         romBase = os.path.splitext(os.path.basename(rom))[0] # filename without extension
 
@@ -443,7 +406,7 @@ class MameGenerator(Generator):
                 bz_height = img_height - bz_y - bz_bottom
             else:
                 img_width, img_height = bezelsUtil.fast_image_size(bz_infos["png"])
-                _, _, rotate = MameGenerator.getMameMachineSize(romBase, tmpZipDir)
+                _, _, rotate = MameGenerator.getMameMachineSize(romBase)
 
                 # assumes that all bezels are setup for 4:3H or 3:4V aspects
                 if rotate == 270 or rotate == 90:
@@ -466,53 +429,8 @@ class MameGenerator(Generator):
             f.close()
 
         if system.isOptSet('bezel.tattoo') and system.config['bezel.tattoo'] != "0":
-            if system.config['bezel.tattoo'] == 'system':
-                try:
-                    tattoo_file = '/usr/share/batocera/controller-overlays/'+system.name+'.png'
-                    if not os.path.exists(tattoo_file):
-                        tattoo_file = '/usr/share/batocera/controller-overlays/generic.png'
-                    tattoo = Image.open(tattoo_file)
-                except Exception as e:
-                    eslog.error("Error opening controller overlay: {}".format(tattoo_file))
-            elif system.config['bezel.tattoo'] == 'custom' and os.path.exists(system.config['bezel.tattoo_file']):
-                try:
-                    tattoo_file = system.config['bezel.tattoo_file']
-                    tattoo = Image.open(tattoo_file)
-                except:
-                    eslog.error("Error opening custom file: {}".format('tattoo_file'))
-            else:
-                try:
-                    tattoo_file = '/usr/share/batocera/controller-overlays/generic.png'
-                    tattoo = Image.open(tattoo_file)
-                except:
-                    eslog.error("Error opening custom file: {}".format('tattoo_file'))
-            output_png_file = "/tmp/bezel_tattooed.png"
-            back = Image.open(tmpZipDir + "/" + pngFile)
-            tattoo = tattoo.convert("RGBA")
-            back = back.convert("RGBA")
-            tw,th = bezelsUtil.fast_image_size(tattoo_file)
-            tatwidth = int(240/1920 * img_width) # 240 = half of the difference between 4:3 and 16:9 on 1920px (0.5*1920/16*4)
-            pcent = float(tatwidth / tw)
-            tatheight = int(float(th) * pcent)
-            tattoo = tattoo.resize((tatwidth,tatheight), Image.ANTIALIAS)
-            alpha = back.split()[-1]
-            alphatat = tattoo.split()[-1]
-            if system.isOptSet('bezel.tattoo_corner'):
-                corner = system.config['bezel.tattoo_corner']
-            else:
-                corner = 'NW'
-            if (corner.upper() == 'NE'):
-                back.paste(tattoo, (img_width-tatwidth,20), alphatat) # 20 pixels vertical margins (on 1080p)
-            elif (corner.upper() == 'SE'):
-                back.paste(tattoo, (img_width-tatwidth,img_height-tatheight-20), alphatat)
-            elif (corner.upper() == 'SW'):
-                back.paste(tattoo, (0,img_height-tatheight-20), alphatat)
-            else: # default = NW
-                back.paste(tattoo, (0,20), alphatat)
-            imgnew = Image.new("RGBA", (img_width,img_height), (0,0,0,255))
-            imgnew.paste(back, (0,0,img_width,img_height))
-            imgnew.save(output_png_file, mode="RGBA", format="PNG")
-
+            # 240 = half of the difference between 4:3 and 16:9 on 1920px (0.5*1920/16*4)
+            output_png_file = bezelsUtil.cachedCompositeTattoo(bz_infos["png"], bezelsUtil.getTattooFile(system), bezelsUtil.getTattooCorner(system), 240/1920, 20/1080)
             try:
                 os.remove(tmpZipDir + "/" + pngFile)
             except:
@@ -520,85 +438,9 @@ class MameGenerator(Generator):
             os.symlink(output_png_file, tmpZipDir + "/" + pngFile)
 
     @staticmethod
-    def getMameMachineSize(machine, tmpdir):
-        proc = subprocess.Popen(["/usr/bin/mame/mame", "-listxml", machine], stdout=subprocess.PIPE)
-        (out, err) = proc.communicate()
-        exitcode = proc.returncode
-
-        if exitcode != 0:
-            raise Exception("mame -listxml " + machine + " failed")
-
-        infofile = tmpdir + "/infos.xml"
-        f = open(infofile, "w")
-        f.write(out.decode())
-        f.close()
-
-        infos = minidom.parse(infofile)
-        display = infos.getElementsByTagName('display')
-
-        for element in display:
-            iwidth  = element.getAttribute("width")
-            iheight = element.getAttribute("height")
-            irotate = element.getAttribute("rotate")
-            return int(iwidth), int(iheight), int(irotate)
-
-        raise Exception("display element not found")
-
-def getMameControlScheme(system, romBasename):
-    # Game list files
-    mameCapcom = '/usr/share/batocera/configgen/data/mame/mameCapcom.txt'
-    mameKInstinct = '/usr/share/batocera/configgen/data/mame/mameKInstinct.txt'
-    mameMKombat = '/usr/share/batocera/configgen/data/mame/mameMKombat.txt'
-    mameNeogeo = '/usr/share/batocera/configgen/data/mame/mameNeogeo.txt'
-    mameTwinstick = '/usr/share/batocera/configgen/data/mame/mameTwinstick.txt'
-    mameRotatedstick = '/usr/share/batocera/configgen/data/mame/mameRotatedstick.txt'
-
-    # Controls for games with 5-6 buttons or other unusual controls
-    if system.isOptSet("altlayout"):
-        controllerType = system.config["altlayout"] # Option was manually selected
-    else:
-        controllerType = "auto"
-
-    if controllerType in [ "default", "neomini", "neocd", "twinstick", "qbert" ]:
-        return controllerType
-    else:
-        capcomList = set(open(mameCapcom).read().split())
-        mkList = set(open(mameMKombat).read().split())
-        kiList = set(open(mameKInstinct).read().split())
-        neogeoList = set(open(mameNeogeo).read().split())
-        twinstickList = set(open(mameTwinstick).read().split())
-        qbertList = set(open(mameRotatedstick).read().split())
-            
-        romName = os.path.splitext(romBasename)[0]
-        if romName in capcomList:
-            if controllerType in [ "auto", "snes" ]:
-                return "sfsnes"
-            elif controllerType == "megadrive":
-                return "megadrive"
-            elif controllerType == "fightstick":
-                return "sfstick"
-        elif romName in mkList:
-            if controllerType in [ "auto", "snes" ]:
-                return "mksnes"
-            elif controllerType == "megadrive":
-                return "mkmegadrive"
-            elif controllerType == "fightstick":
-                return "mkstick"
-        elif romName in kiList:
-            if controllerType in [ "auto", "snes" ]:
-                return "kisnes"
-            elif controllerType == "megadrive":
-                return "megadrive"
-            elif controllerType == "fightstick":
-                return "sfstick"
-        elif romName in  neogeoList:
-            return "neomini"
-        elif romName in  twinstickList:
-            return "twinstick"
-        elif romName in  qbertList:
-            return "qbert"
-        else:
-            if controllerType == "fightstick":
-                return "fightstick"
-
-    return "default"
+    @span("mame.machineSize")
+    def getMameMachineSize(machine):
+        infos = mameMachines.getMachineInfos(machine)
+        if infos["width"] is None:
+            raise Exception("display element not found")
+        return infos["width"], infos["height"], infos["rotate"]
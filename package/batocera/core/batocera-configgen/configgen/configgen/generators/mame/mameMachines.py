@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+# the display (width, height, rotate) and the inputs (players, buttons) of the mame machines, from mame -listxml.
+# kept in /userdata/system/cache/configgen/mame-machines, split by the first byte of the md5 of the machine name
+# so that a launch loads only a small file. the whole list is built by configgen-mame (at boot, the system being idle),
+# otherwise the machines are added one by one at their first launch. everything is dropped when the mame binary changes.
+# the shards are written under a lock, the launches don't wait for it (the machine is just not cached then).
+
+import os
+import fcntl
+import pickle
+import hashlib
+import subprocess
+import xml.etree.ElementTree as ET
+import batoceraFiles
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+mameBin = "/usr/bin/mame/mame"
+machinesCache = batoceraFiles.CACHE + "/configgen/mame-machines"
+MACHINES_CACHE_VERSION = 1
+
+# the mame binary the infos come from
+def binaryStamp():
+    try:
+        st = os.stat(mameBin)
+        return (MACHINES_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+def shardName(machine):
+    return hashlib.md5(machine.encode()).hexdigest()[:2]
+
+def loadShard(shard, stamp):
+    try:
+        with open("{}/{}.pickle".format(machinesCache, shard), 'rb') as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp:
+            return cached["machines"]
+    except Exception:
+        pass # missing or outdated
+    return dict()
+
+# exclusive, held by the writers of the shards and of complete.pickle
+class CacheLock():
+
+    def __init__(self, wait=True):
+        self.wait = wait
+        self.fd = None
+
+    def __enter__(self):
+        os.makedirs(machinesCache, exist_ok=True)
+        self.fd = open(machinesCache + "/lock", "w")
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX if self.wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self.fd.close()
+            raise
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.fd.close() # releases the lock
+        return False
+
+def saveShard(shard, stamp, machines):
+    os.makedirs(machinesCache, exist_ok=True)
+    cachefile = "{}/{}.pickle".format(machinesCache, shard)
+    tmpfile = "{}.{}.tmp".format(cachefile, os.getpid())
+    with open(tmpfile, 'wb') as f:
+        pickle.dump({ "stamp": stamp, "machines": machines }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpfile, cachefile)
+
+# the infos of the machine element of mame -listxml
+def machineInfos(element):
+    infos = { "width": None, "height": None, "rotate": None, "players": 0, "buttons": 0 }
+    display = element.find("display")
+    if display is not None and display.get("width") is not None:
+        infos["width"]  = int(display.get("width"))
+        infos["height"] = int(display.get("height"))
+        infos["rotate"] = int(display.get("rotate", "0"))
+    input = element.find("input")
+    if input is not None:
+        infos["players"] = int(input.get("players", "0"))
+        # buttons are on the input element in the old versions, on the control elements since 0.175
+        buttons = [ int(input.get("buttons", "0")) ] + [ int(control.get("buttons", "0")) for control in input.findall("control") ]
+        infos["buttons"] = max(buttons)
+    return infos
+
+# name -> infos of the machines given by mame -listxml (all of them when no machine is given), read as it comes.
+# the devices are skipped
+def listMachines(machines=[]):
+    proc = subprocess.Popen([mameBin, "-listxml"] + machines, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    result = dict()
+    error = None
+    try:
+        for event, element in ET.iterparse(proc.stdout):
+            if element.tag == "machine":
+                if element.get("isdevice") != "yes":
+                    result[element.get("name")] = machineInfos(element)
+                element.clear()
+    except ET.ParseError as e:
+        error = e
+    finally:
+        proc.stdout.close()
+        exitcode = proc.wait()
+    if exitcode != 0:
+        raise Exception("mame -listxml {} failed".format(" ".join(machines)))
+    if error is not None:
+        raise error
+    return result
+
+# the infos of a machine, from the cache or from mame (and then added to the cache)
+def getMachineInfos(machine):
+    stamp = binaryStamp()
+    shard = shardName(machine)
+    machines = loadShard(shard, stamp)
+    if machine in machines:
+        return machines[machine]
+
+    eslog.debug("{} is not in the mame machines cache".format(machine))
+    listed = listMachines([machine])
+    if machine not in listed:
+        raise Exception("mame machine {} not found".format(machine))
+    # the machines it depends on are listed too, only this one is kept
+    infos = listed[machine]
+    try:
+        with CacheLock(wait=False):
+            # the shard as it is now (configgen-mame may have written it meanwhile)
+            machines = loadShard(shard, stamp)
+            machines[machine] = infos
+            saveShard(shard, stamp, machines)
+    except Exception as e:
+        eslog.debug("unable to save the mame machines cache: {}".format(e))
+    return infos
+
+# all the machines of this mame binary are in the cache
+def isComplete():
+    try:
+        with open(machinesCache + "/complete.pickle", 'rb') as f:
+            return pickle.load(f) == binaryStamp()
+    except Exception:
+        return False
+
+# the whole list, about a minute of cpu
+def buildCache():
+    stamp = binaryStamp()
+    if stamp is None:
+        raise Exception("{} not found".format(mameBin))
+    shards = dict()
+    for (name, infos) in listMachines().items():
+        shard = shardName(name)
+        if shard not in shards:
+            shards[shard] = dict()
+        shards[shard][name] = infos
+    with CacheLock():
+        # mame may have been updated while it was listing the machines
+        if binaryStamp() != stamp:
+            raise Exception("{} changed while listing its machines".format(mameBin))
+        for shard in shards:
+            saveShard(shard, stamp, shards[shard])
+        tmpfile = "{}/complete.pickle.{}.tmp".format(machinesCache, os.getpid())
+        with open(tmpfile, 'wb') as f:
+            pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfile, machinesCache + "/complete.pickle")
+    return sum([ len(shards[shard]) for shard in shards ])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# the software list of a mess rom, as mame sees it: a link to the rom folder in /var/run/mame_software
+# and the hash file of the list, used by the standalone and the libretro mame.
+# what is already there is kept from a launch to the next one, only what differs is changed.
+
+import os
+import shutil
+from pathlib import Path
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+def isLinkTo(path, target):
+    return os.path.islink(path) and os.readlink(path) == target
+
+# a copy done by shutil.copy2
+def isCopyOf(path, source):
+    if os.path.islink(path) or not os.path.isfile(path):
+        return False
+    st = os.stat(path)
+    src = os.stat(source)
+    return st.st_size == src.st_size and st.st_mtime_ns == src.st_mtime_ns
+
+def removeEntry(path):
+    if os.path.islink(path) or not os.path.isdir(path):
+        os.unlink(path)
+    else:
+        shutil.rmtree(path)
+
+# links path to target, copies it when links are not supported (/userdata on exfat...)
+def linkFile(path, target, copyFallback):
+    if isLinkTo(path, target):
+        return False
+    tmpLink = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.symlink(target, tmpLink)
+    except OSError:
+        # the copy of the previous launches is kept when it is up to date
+        if not copyFallback:
+            raise
+        if isCopyOf(path, target):
+            return False
+        if os.path.lexists(path):
+            removeEntry(path)
+        shutil.copy2(target, path)
+        return True
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    os.replace(tmpLink, path)
+    return True
+
+def prepSoftwareList(subdirSoftList, softList, softDir, hashDir, hashSourceDir, romDirname, copyFallback=False):
+    softDir  = os.path.normpath(softDir)
+    hashDir  = os.path.normpath(hashDir)
+    romLink  = os.path.join(softDir, softList)
+    hashFile = os.path.join(hashDir, softList + ".xml")
+
+    # Link ROM's parent folder if needed, ROM's folder otherwise
+    if softList in subdirSoftList:
+        romTarget = str(Path(romDirname).parents[0])
+    else:
+        romTarget = romDirname
+
+    changed = False
+
+    # the links and folders of the previous lists
+    os.makedirs(softDir, exist_ok=True)
+    for fileName in os.listdir(softDir):
+        checkFile = os.path.join(softDir, fileName)
+        if checkFile == romLink or checkFile == hashDir:
+            continue
+        if os.path.islink(checkFile) or os.path.isdir(checkFile):
+            removeEntry(checkFile)
+            changed = True
+    if not isLinkTo(romLink, romTarget):
+        if os.path.lexists(romLink):
+            removeEntry(romLink)
+        os.symlink(romTarget, romLink, True)
+        changed = True
+
+    # the hashfile of this list only
+    os.makedirs(hashDir, exist_ok=True)
+    for fileName in os.listdir(hashDir):
+        checkFile = os.path.join(hashDir, fileName)
+        if fileName.endswith(".xml") and checkFile != hashFile:
+            removeEntry(checkFile)
+            changed = True
+    if linkFile(hashFile, os.path.join(hashSourceDir, softList + ".xml"), copyFallback):
+        changed = True
+
+    if not changed:
+        eslog.debug("software list {} already prepared".format(softList))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# the systems run by mame as mess (messSystems.csv) and the autoboot commands of the software lists (<softlist>_autoload.csv),
+# used by the standalone and the libretro mame. the csv files are read once into dicts, kept in memory
+# (the configgen daemon workers inherit them), and read again only when one of them changes.
+
+import os
+import csv
+import collections
+
+# system: the batocera system, sysName: the mess machine ("" for the lcd games and plug'n'play, run by rom name),
+# romType: the media option (cart, flop, cass...), autoRun: the default autoboot command
+MessSystem = collections.namedtuple("MessSystem", [ "system", "sysName", "romType", "autoRun" ])
+
+class MessRegistry():
+
+    def __init__(self, dataDir):
+        self.dataDir = dataDir
+        self.compiled = None
+        self.checkedPid = None
+
+    def sources(self):
+        sources = []
+        for file in sorted(os.listdir(self.dataDir)):
+            if file == "messSystems.csv" or file.endswith("_autoload.csv"):
+                st = os.stat(self.dataDir + "/" + file)
+                sources.append((file, st.st_mtime_ns, st.st_size))
+        return sources
+
+    # the files are checked once per process (per launch)
+    def load(self):
+        if self.compiled is not None and self.checkedPid == os.getpid():
+            return self.compiled
+        sources = self.sources()
+        if self.compiled is None or self.compiled["sources"] != sources:
+            self.compiled = self.compile(sources)
+        self.checkedPid = os.getpid()
+        return self.compiled
+
+    def compile(self, sources):
+        systems = dict()
+        last = None
+        with open(self.dataDir + "/messSystems.csv", 'r') as openFile:
+            for row in csv.reader(openFile, delimiter=';', quotechar="'"):
+                last = MessSystem(row[0], row[1], row[2], row[3])
+                if row[0] not in systems: # the first one, as with list.index
+                    systems[row[0]] = last
+
+        autoRuns = dict() # softlist -> casefolded rom name -> command
+        for (file, mtime, size) in sources:
+            if file.endswith("_autoload.csv"):
+                commands = dict()
+                with open(self.dataDir + "/" + file, 'r') as openARFile:
+                    for row in csv.reader(openARFile, delimiter=';', quotechar="'"):
+                        commands[row[0].casefold()] = row[1] # the last one wins, as when the file was read for each launch
+                autoRuns[file[:-len("_autoload.csv")]] = commands
+
+        return { "sources": sources, "systems": systems, "last": last, "autoRuns": autoRuns }
+
+    # the MessSystem of the batocera system, None when it is run as arcade
+    def getSystem(self, system):
+        return self.load()["systems"].get(system)
+
+    # the last line of messSystems.csv (see MameGenerator.generate)
+    def getLastSystem(self):
+        return self.load()["last"]
+
+    # the autoboot command of the rom (without extension) in the software list, None if there is none
+    def getAutoRun(self, softList, romName):
+        return self.load()["autoRuns"].get(softList, {}).get(romName.casefold())
+
+messRegistry = MessRegistry("/usr/share/batocera/configgen/data/mame")
@@ -126,9 +126,6 @@ class Model2EmuGenerator(Generator):
             with open(wineprefix + "/xact_x64.done", "w") as f:
                 f.write("done")
         
-        # move to the emulator path to ensure configs are saved etc
-        os.chdir(emupath)
-
         # modify the ini file resolution accordingly
         configFileName = emupath + "/EMULATOR.INI"
         Config = configparser.ConfigParser(interpolation=None)
@@ -205,3 +202,7 @@ class Model2EmuGenerator(Generator):
                 "SPA_PLUGIN_DIR": "/usr/lib/spa-0.2:/lib32/spa-0.2",
                 "PIPEWIRE_MODULE_DIR": "/usr/lib/pipewire-0.3:/lib32/pipewire-0.3"
             })
+
+    # the emulator path, to ensure configs are saved etc
+    def executionDirectory(self, config, rom):
+        return batoceraFiles.SAVES + "/model2/model2emu"
@@ -2,12 +2,11 @@
 
 import Command
 import batoceraFiles
+import controllersConfig
 from generators.Generator import Generator
 import shutil
 import os.path
 import configparser
-# TODO: python3 - delete me!
-import codecs
 from . import ppssppConfig
 from . import ppssppControllers
 
@@ -27,10 +26,7 @@ class PPSSPPGenerator(Generator):
             if controller.player != "1":
                 continue
             ppssppControllers.generateControllerConfig(controller)
-            # TODO: python 3 - workawround to encode files in utf-8
-            cfgFile = codecs.open(ppssppControls, "w", "utf-8")
-            cfgFile.write(controller.generateSDLGameDBLine())
-            cfgFile.close()
+            controllersConfig.writeSDLGameDBAllControllers({ index: controller }, ppssppControls)
             break
 
         # The command to run
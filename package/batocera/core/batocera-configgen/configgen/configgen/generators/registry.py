@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import importlib
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+# emulator name -> (module, class)
+# the generator module is only imported when the emulator is launched
+generatorsClasses = {
+    'kodi':              ('generators.kodi.kodiGenerator',                             'KodiGenerator'),
+    'linapple':          ('generators.linapple.linappleGenerator',                     'LinappleGenerator'),
+    'libretro':          ('generators.libretro.libretroGenerator',                     'LibretroGenerator'),
+    'moonlight':         ('generators.moonlight.moonlightGenerator',                   'MoonlightGenerator'),
+    'scummvm':           ('generators.scummvm.scummvmGenerator',                       'ScummVMGenerator'),
+    'dosbox':            ('generators.dosbox.dosboxGenerator',                         'DosBoxGenerator'),
+    'dosbox_staging':    ('generators.dosboxstaging.dosboxstagingGenerator',           'DosBoxStagingGenerator'),
+    'dosboxx':           ('generators.dosboxx.dosboxxGenerator',                       'DosBoxxGenerator'),
+    'mupen64plus':       ('generators.mupen.mupenGenerator',                           'MupenGenerator'),
+    'vice':              ('generators.vice.viceGenerator',                             'ViceGenerator'),
+    'fsuae':             ('generators.fsuae.fsuaeGenerator',                           'FsuaeGenerator'),
+    'amiberry':          ('generators.amiberry.amiberryGenerator',                     'AmiberryGenerator'),
+    'flycast':           ('generators.flycast.flycastGenerator',                       'FlycastGenerator'),
+    'dolphin':           ('generators.dolphin.dolphinGenerator',                       'DolphinGenerator'),
+    'dolphin_triforce':  ('generators.dolphin_triforce.dolphinTriforceGenerator',      'DolphinTriforceGenerator'),
+    'pcsx2':             ('generators.pcsx2.pcsx2Generator',                           'Pcsx2Generator'),
+    'ppsspp':            ('generators.ppsspp.ppssppGenerator',                         'PPSSPPGenerator'),
+    'citra':             ('generators.citra.citraGenerator',                           'CitraGenerator'),
+    'daphne':            ('generators.daphne.daphneGenerator',                         'DaphneGenerator'),
+    'cannonball':        ('generators.cannonball.cannonballGenerator',                 'CannonballGenerator'),
+    'sdlpop':            ('generators.sdlpop.sdlpopGenerator',                         'SdlPopGenerator'),
+    'openbor':           ('generators.openbor.openborGenerator',                       'OpenborGenerator'),
+    'wine':              ('generators.wine.wineGenerator',                             'WineGenerator'),
+    'cemu':              ('generators.cemu.cemuGenerator',                             'CemuGenerator'),
+    'melonds':           ('generators.melonds.melondsGenerator',                       'MelonDSGenerator'),
+    'rpcs3':             ('generators.rpcs3.rpcs3Generator',                           'Rpcs3Generator'),
+    'mame':              ('generators.mame.mameGenerator',                             'MameGenerator'),
+    'pygame':            ('generators.pygame.pygameGenerator',                         'PygameGenerator'),
+    'devilutionx':       ('generators.devilutionx.devilutionxGenerator',               'DevilutionXGenerator'),
+    'hatari':            ('generators.hatari.hatariGenerator',                         'HatariGenerator'),
+    'solarus':           ('generators.solarus.solarusGenerator',                       'SolarusGenerator'),
+    'easyrpg':           ('generators.easyrpg.easyrpgGenerator',                       'EasyRPGGenerator'),
+    'redream':           ('generators.redream.redreamGenerator',                       'RedreamGenerator'),
+    'supermodel':        ('generators.supermodel.supermodelGenerator',                 'SupermodelGenerator'),
+    'xash3d_fwgs':       ('generators.xash3d_fwgs.xash3dFwgsGenerator',                'Xash3dFwgsGenerator'),
+    'tsugaru':           ('generators.tsugaru.tsugaruGenerator',                       'TsugaruGenerator'),
+    'mugen':             ('generators.mugen.mugenGenerator',                           'MugenGenerator'),
+    'fpinball':          ('generators.fpinball.fpinballGenerator',                     'FpinballGenerator'),
+    'lightspark':        ('generators.lightspark.lightsparkGenerator',                 'LightsparkGenerator'),
+    'ruffle':            ('generators.ruffle.ruffleGenerator',                         'RuffleGenerator'),
+    'duckstation':       ('generators.duckstation.duckstationGenerator',               'DuckstationGenerator'),
+    'drastic':           ('generators.drastic.drasticGenerator',                       'DrasticGenerator'),
+    'xemu':              ('generators.xemu.xemuGenerator',                             'XemuGenerator'),
+    'cgenius':           ('generators.cgenius.cgeniusGenerator',                       'CGeniusGenerator'),
+    'flatpak':           ('generators.flatpak.flatpakGenerator',                       'FlatpakGenerator'),
+    'steam':             ('generators.steam.steamGenerator',                           'SteamGenerator'),
+    'ecwolf':            ('generators.ecwolf.ecwolfGenerator',                         'ECWolfGenerator'),
+    'lexaloffle':        ('generators.lexaloffle.lexaloffleGenerator',                 'LexaloffleGenerator'),
+    'model2emu':         ('generators.model2emu.model2emuGenerator',                   'Model2EmuGenerator'),
+    'sonic2013':         ('generators.sonicretro.sonicretroGenerator',                 'SonicRetroGenerator'),
+    'soniccd':           ('generators.sonicretro.sonicretroGenerator',                 'SonicRetroGenerator'),
+    'gsplus':            ('generators.gsplus.gsplusGenerator',                         'GSplusGenerator'),
+    'fba2x':             ('generators.fba2x.fba2xGenerator',                           'Fba2xGenerator'),
+    'yuzu':              ('generators.yuzu.yuzuGenerator',                             'YuzuGenerator'),
+    'ryujinx':           ('generators.ryujinx.ryujinxGenerator',                       'RyujinxGenerator'),
+    'samcoupe':          ('generators.samcoupe.samcoupeGenerator',                     'SamcoupeGenerator'),
+    'abuse':             ('generators.abuse.abuseGenerator',                           'AbuseGenerator'),
+    'cdogs':             ('generators.cdogs.cdogsGenerator',                           'CdogsGenerator'),
+    'hcl':               ('generators.hcl.hclGenerator',                               'HclGenerator'),
+    'openmsx':           ('generators.openmsx.openmsxGenerator',                       'OpenmsxGenerator'),
+    'demul':             ('generators.demul.demulGenerator',                           'DemulGenerator'),
+    #'play':              ('generators.play.playGenerator',                             'PlayGenerator'),
+}
+
+class GeneratorRegistry():
+    def __init__(self):
+        self.instances = dict()
+
+    def __contains__(self, emulator):
+        return emulator in generatorsClasses
+
+    def __getitem__(self, emulator):
+        if emulator not in self.instances:
+            if emulator not in generatorsClasses:
+                raise KeyError(emulator)
+            module, className = generatorsClasses[emulator]
+            eslog.debug("loading generator {} from {}".format(className, module))
+            self.instances[emulator] = getattr(importlib.import_module(module), className)()
+        return self.instances[emulator]
+
+    # import and instantiate all the generators (for the configgen daemon, so that launches don't have to)
+    def preload(self):
+        for emulator in generatorsClasses:
+            try:
+                self[emulator]
+            except Exception as e:
+                eslog.error("unable to load the generator for {}: {}".format(emulator, e))
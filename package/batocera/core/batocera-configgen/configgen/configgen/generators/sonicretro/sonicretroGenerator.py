@@ -154,11 +154,14 @@ class SonicRetroGenerator(Generator):
         with open(iniFile, 'w') as configfile:
             sonicConfig.write(configfile, False)
         
-        os.chdir(rom)
         commandArray = [emu]
         
         return Command.Command(
             array=commandArray,
             env={
                 'SDL_GAMECONTROLLERCONFIG': controllersConfig.generateSdlGameControllerConfig(playersControllers)
-            })
\ No newline at end of file
+            })
+
+    # the game folder
+    def executionDirectory(self, config, rom):
+        return rom
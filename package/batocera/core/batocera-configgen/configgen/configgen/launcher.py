@@ -0,0 +1,526 @@
+#!/usr/bin/env python
+
+import sys
+from Emulator import Emulator
+from Evmapy import Evmapy
+from generators.registry import GeneratorRegistry
+import xml.etree.ElementTree as ET
+import json
+
+import controllersConfig as controllers
+import signal
+import batoceraFiles
+import os
+import subprocess
+import utils.videoMode as videoMode
+import utils.bezels as bezelsUtil
+from utils.pipeline import Pipeline
+from utils.emulatorOutput import OutputCapture
+import utils.trace as trace
+from utils.trace import span
+from utils.logger import get_logger
+
+eslog = get_logger(__name__)
+
+maxnbplayers = 8
+proc = None
+procStarted = None # called with the emulator process once started (see configgenDaemon)
+
+generators = GeneratorRegistry()
+
+def squashfs_begin(rom):
+    eslog.debug("squashfs_begin({})".format(rom))
+    rommountpoint = "/var/run/squashfs/" + os.path.basename(rom)[:-9]
+
+    if not os.path.exists("/var/run/squashfs"):
+        os.mkdir("/var/run/squashfs")
+
+    # first, try to clean an empty remaining directory (for example because of a crash)
+    if os.path.exists(rommountpoint) and os.path.isdir(rommountpoint):
+        eslog.debug("squashfs_begin: {} already exists".format(rommountpoint))
+        # try to remove an empty directory, else, run the directory, ignoring the .squashfs
+        try:
+            os.rmdir(rommountpoint)
+        except:
+            eslog.debug("squashfs_begin: failed to rmdir {}".format(rommountpoint))
+            return False, None, rommountpoint
+
+    # ok, the base directory doesn't exist, let's create it and mount the squashfs on it
+    os.mkdir(rommountpoint)
+    return_code = subprocess.call(["mount", rom, rommountpoint])
+    if return_code != 0:
+        eslog.debug("squashfs_begin: mounting {} failed".format(rommountpoint))
+        try:
+            os.rmdir(rommountpoint)
+        except:
+            pass
+        raise Exception("unable to mount the file {}".format(rom))
+
+    # if the squashfs contains a single file with the same name, take it as the rom file
+    romsingle = rommountpoint + "/" + os.path.basename(rom)[:-9]
+    if len(os.listdir(rommountpoint)) == 1 and  os.path.exists(romsingle):
+        eslog.debug("squashfs: single rom ".format(romsingle))
+        return True, rommountpoint, romsingle
+
+    return True, rommountpoint, rommountpoint
+
+def squashfs_end(rommountpoint):
+    eslog.debug("squashfs_end({})".format(rommountpoint))
+
+    # umount
+    return_code = subprocess.call(["umount", rommountpoint])
+    if return_code != 0:
+        eslog.debug("squashfs_begin: unmounting {} failed".format(rommountpoint))
+        raise Exception("unable to umount the file {}".format(rommountpoint))
+
+    # cleaning the empty directory
+    os.rmdir(rommountpoint)
+
+def main(args, maxnbplayers):
+    # squashfs roms if squashed
+    extension = os.path.splitext(args.rom)[1][1:].lower()
+    if extension == "squashfs":
+        exitCode = 0
+        need_end = False
+        try:
+            need_end, rommountpoint, rom = squashfs_begin(args.rom)
+            exitCode = start_rom(args, maxnbplayers, rom, args.rom)
+        finally:
+            if need_end:
+                squashfs_end(rommountpoint)
+        return exitCode
+    else:
+        return start_rom(args, maxnbplayers, args.rom, args.rom)
+
+def start_rom(args, maxnbplayers, rom, romConfiguration):
+    # everything until the emulator is run
+    prelaunch = span("launcher.prelaunch").start()
+
+    # controllers
+    playersControllers = dict()
+
+    controllersInput = []
+    for p in range(1, maxnbplayers+1):
+        ci = {}
+        ci["index"]      = getattr(args, "p{}index"     .format(p))
+        ci["guid"]       = getattr(args, "p{}guid"      .format(p))
+        ci["name"]       = getattr(args, "p{}name"      .format(p))
+        ci["devicepath"] = getattr(args, "p{}devicepath".format(p))
+        ci["nbbuttons"]  = getattr(args, "p{}nbbuttons" .format(p))
+        ci["nbhats"]     = getattr(args, "p{}nbhats"    .format(p))
+        ci["nbaxes"]     = getattr(args, "p{}nbaxes"    .format(p))
+        controllersInput.append(ci)
+
+    # Read the controller configuration
+    with span("launcher.controllers"):
+        playersControllers = controllers.loadControllerConfig(controllersInput)
+    # find the system to run
+    systemName = args.system
+    eslog.debug("Running system: {}".format(systemName))
+    system = Emulator(systemName, romConfiguration)
+
+    if args.emulator is not None:
+        system.config["emulator"] = args.emulator
+        system.config["emulator-forced"] = True
+    if args.core is not None:
+        system.config["core"] = args.core
+        system.config["core-forced"] = True
+    # the launch is traced only when configgen.trace is on
+    if not system.getOptBoolean('configgen.trace'):
+        trace.stop()
+    debugDisplay = system.config.copy()
+    if "retroachievements.password" in debugDisplay:
+        debugDisplay["retroachievements.password"] = "***"
+    eslog.debug("Settings: {}".format(debugDisplay))
+    if "emulator" in system.config and "core" in system.config:
+        eslog.debug("emulator: {}, core: {}".format(system.config["emulator"], system.config["core"]))
+    else:
+        if "emulator" in system.config:
+            eslog.debug("emulator: {}".format(system.config["emulator"]))
+
+    # the resolution must be changed before configuration while the configuration may depend on it (ie bezels)
+    wantedGameMode = generators[system.config['emulator']].getResolutionMode(system.config)
+    systemMode = videoMode.getCurrentMode()
+
+    resolutionChanged = False
+    mouseChanged = False
+    exitCode = -1
+    try:
+        # core
+        effectiveCore = ""
+        if "core" in system.config and system.config["core"] is not None:
+            effectiveCore = system.config["core"]
+        effectiveRom = ""
+        effectiveRomConfiguration = ""
+        if rom is not None:
+            effectiveRom = rom
+            effectiveRomConfiguration = romConfiguration
+
+        # network options
+        if args.netplaymode is not None:
+            system.config["netplay.mode"] = args.netplaymode
+        if args.netplaypass is not None:
+            system.config["netplay.password"] = args.netplaypass
+        if args.netplayip is not None:
+            system.config["netplay.server.ip"] = args.netplayip
+        if args.netplayport is not None:
+            system.config["netplay.server.port"] = args.netplayport
+
+        # autosave arguments
+        if args.state_slot is not None:
+            system.config["state_slot"] = args.state_slot
+        if args.autosave is not None:
+            system.config["autosave"] = args.autosave
+
+        # SDL VSync is a big deal on OGA and RPi4
+        if system.isOptSet('sdlvsync') and system.getOptBoolean('sdlvsync') == False:
+            system.config["sdlvsync"] = '0'
+        else:
+            system.config["sdlvsync"] = '1'
+        os.environ.update({'SDL_RENDER_VSYNC': system.config["sdlvsync"]})
+
+        def setVideoMode():
+            nonlocal resolutionChanged
+
+            # lower the resolution if mode is auto
+            newsystemMode = systemMode # newsystemmode is the mode after minmax (ie in 1K if tv was in 4K), systemmode is the mode before (ie in es)
+            if system.config["videomode"] == "" or system.config["videomode"] == "default":
+                eslog.debug("minTomaxResolution")
+                eslog.debug("video mode before minmax: {}".format(systemMode))
+                videoMode.minTomaxResolution()
+                newsystemMode = videoMode.getCurrentMode()
+                if newsystemMode != systemMode:
+                    resolutionChanged = True
+
+            eslog.debug("current video mode: {}".format(newsystemMode))
+            eslog.debug("wanted video mode: {}".format(wantedGameMode))
+
+            if wantedGameMode != 'default' and wantedGameMode != newsystemMode:
+                resolutionChanged = True
+                videoMode.changeMode(wantedGameMode)
+            gameResolution = videoMode.getCurrentResolution()
+
+            # if resolution is reversed (ie ogoa boards), reverse it in the gameResolution to have it correct
+            if system.isOptSet('resolutionIsReversed') and system.getOptBoolean('resolutionIsReversed') == True:
+                x = gameResolution["width"]
+                gameResolution["width"]  = gameResolution["height"]
+                gameResolution["height"] = x
+            eslog.debug("resolution: {}x{}".format(str(gameResolution["width"]), str(gameResolution["height"])))
+            return gameResolution
+
+        def createSaveDir():
+            # savedir: create the save directory if not already done
+            dirname = os.path.join(batoceraFiles.savesDir, system.name)
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
+
+        def setMouse():
+            nonlocal mouseChanged
+            if generators[system.config['emulator']].getMouseMode(system.config):
+                mouseChanged = True
+                videoMode.changeMouse(True)
+
+        def gameStart():
+            # run a script before emulator starts
+            callExternalScripts("/usr/share/batocera/configgen/scripts", "gameStart", [systemName, system.config['emulator'], effectiveCore, effectiveRom])
+            callExternalScripts("/userdata/system/scripts", "gameStart", [systemName, system.config['emulator'], effectiveCore, effectiveRom])
+
+        # the directory the emulator is run from, if wanted
+        # (given to its process only, the stages run in threads: the directory of configgen stays the same)
+        executionDirectory = generators[system.config['emulator']].executionDirectory(system.config, effectiveRom)
+
+        def generate():
+            with span("generator." + system.config['emulator'], core=effectiveCore):
+                return generators[system.config['emulator']].generate(system, rom, playersControllers, stages.results["videomode"])
+
+        # the stages are run in this order, or overlapped when global.configgen.parallel=1 in batocera.conf:
+        # evmapy runs during the mode switch, then the gameStart scripts, the generator and the hud bezel run together
+        hudSupport = system.isOptSet('hud_support') and system.getOptBoolean('hud_support') == True
+        stages = Pipeline(system.isOptSet('configgen.parallel') and system.getOptBoolean('configgen.parallel'))
+        stages.add("videomode", setVideoMode)
+        stages.add("savedir",   createSaveDir)
+        stages.add("mouse",     setMouse)
+        stages.add("gameStart", gameStart, after=["videomode", "mouse"])
+        stages.add("evmapy",    lambda: Evmapy.start(systemName, system.config['emulator'], effectiveCore, effectiveRomConfiguration, playersControllers))
+        stages.add("generate",  generate, after=["videomode", "savedir"])
+        if hudSupport:
+            stages.add("hudbezel", lambda: getHudBezel(system, rom, stages.results["videomode"]), after=["videomode"])
+
+        # run the emulator
+        try:
+            results = stages.run()
+            cmd = results["generate"]
+
+            if hudSupport:
+                hud_bezel = results["hudbezel"]
+                if (system.isOptSet('hud') and system.config["hud"] != "" and system.config["hud"] != "none") or hud_bezel is not None:
+                    gameinfos = extractGameInfosFromXml(args.gameinfoxml)
+                    cmd.env["MANGOHUD_DLSYM"] = "1"
+                    hudconfig = getHudConfig(system, args.systemname, system.config['emulator'], effectiveCore, rom, gameinfos, hud_bezel)
+                    with open('/var/run/hud.config', 'w') as f:
+                        f.write(hudconfig)
+                    cmd.env["MANGOHUD_CONFIGFILE"] = "/var/run/hud.config"
+                    if generators[system.config['emulator']].hasInternalMangoHUDCall() == False:
+                        cmd.array.insert(0, "mangohud")
+
+            prelaunch.stop()
+            with span("launcher.run"):
+                exitCode = runCommand(cmd, system.config.get('configgen.emulatorlog', 'debug'), executionDirectory)
+        finally:
+            Evmapy.stop()
+
+        # run a script after emulator shuts down
+        callExternalScripts("/userdata/system/scripts", "gameStop", [systemName, system.config['emulator'], effectiveCore, effectiveRom])
+        callExternalScripts("/usr/share/batocera/configgen/scripts", "gameStop", [systemName, system.config['emulator'], effectiveCore, effectiveRom])
+
+    finally:
+        # always restore the resolution
+        if resolutionChanged:
+            try:
+                videoMode.changeMode(systemMode)
+            except Exception:
+                pass # don't fail
+
+        if mouseChanged:
+            try:
+                videoMode.changeMouse(False)
+            except Exception:
+                pass # don't fail
+
+    # exit
+    return exitCode
+
+def getHudBezel(system, rom, gameResolution):
+    if 'bezel' not in system.config or system.config['bezel'] == "" or system.config['bezel'] == "none":
+        return None
+
+    eslog.debug("hud enabled. trying to apply the bezel {}".format(system.config['bezel']))
+
+    if generators[system.config['emulator']].supportsInternalBezels():
+        eslog.debug("skipping bezels for emulator {}".format(system.config['emulator']))
+        return None
+
+    bezel = system.config['bezel']
+    bz_infos = bezelsUtil.getBezelInfos(rom, bezel, system.name)
+    if bz_infos is None:
+        eslog.debug("no bezel info file found")
+        return None
+
+    overlay_info_file = bz_infos["info"]
+    overlay_png_file  = bz_infos["png"]
+
+    # check the info file
+    # bottom, top, left and right must not cover too much the image to be considered as compatible
+    if os.path.exists(overlay_info_file):
+        try:
+            infos = json.load(open(overlay_info_file))
+        except:
+            eslog.warning("unable to read {}".format(overlay_info_file))
+            infos = {}
+    else:
+        infos = {}
+
+    if "width" in infos and "height" in infos:
+        bezel_width  = infos["width"]
+        bezel_height = infos["height"]
+        eslog.info("bezel size read from {}".format(overlay_info_file))
+    else:
+        bezel_width, bezel_height = bezelsUtil.fast_image_size(overlay_png_file)
+        eslog.info("bezel size read from {}".format(overlay_png_file))
+
+    # max cover proportion and ratio distortion
+    max_cover = 0.05 # 5%
+    max_ratio_delta = 0.01
+
+    screen_ratio = gameResolution["width"] / gameResolution["height"]
+    bezel_ratio  = bezel_width / bezel_height
+
+    # the screen and bezel ratio must be approximatly the same
+    if abs(screen_ratio - bezel_ratio) > max_ratio_delta:
+        eslog.debug("screen ratio ({}) is too far from the bezel one ({}) : {} - {} > {}".format(screen_ratio, bezel_ratio, screen_ratio, bezel_ratio, max_ratio_delta))
+        return None
+
+    # the ingame image and the bezel free space must feet
+    ## the bezel top and bottom cover must be minimum
+    if "top" in infos and infos["top"] / bezel_height > max_cover:
+        eslog.debug("bezel top covers too much the game image : {} / {} > {}".format(infos["top"], bezel_height, max_cover))
+        return None
+    if "bottom" in infos and infos["bottom"] / bezel_height > max_cover:
+        eslog.debug("bezel bottom covers too much the game image : {} / {} > {}".format(infos["bottom"], bezel_height, max_cover))
+        return None
+
+    # if there is no information about top/bottom, assume default is 0
+
+    ## the bezel left and right cover must be maximum
+    ingame_ratio = generators[system.config['emulator']].getInGameRatio(system.config, gameResolution, rom)
+    img_height = bezel_height
+    img_width  = img_height * ingame_ratio
+
+    if "left" not in infos:
+        eslog.debug("bezel has no left info in {}".format(overlay_info_file))
+        # assume default is 4/3 over 16/9
+        infos_left = (bezel_width - (bezel_height / 3 * 4)) / 2
+        if abs((infos_left  - ((bezel_width-img_width)/2.0)) / img_width) > max_cover:
+            eslog.debug("bezel left covers too much the game image : {} / {} > {}".format(infos_left  - ((bezel_width-img_width)/2.0), img_width, max_cover))
+            return None
+        
+    if "right" not in infos:
+        eslog.debug("bezel has no right info in {}".format(overlay_info_file))
+        # assume default is 4/3 over 16/9
+        infos_right = (bezel_width - (bezel_height / 3 * 4)) / 2
+        if abs((infos_right - ((bezel_width-img_width)/2.0)) / img_width) > max_cover:
+            eslog.debug("bezel right covers too much the game image : {} / {} > {}".format(infos_right  - ((bezel_width-img_width)/2.0), img_width, max_cover))
+            return None
+    
+    if "left"  in infos and abs((infos["left"]  - ((bezel_width-img_width)/2.0)) / img_width) > max_cover:
+        eslog.debug("bezel left covers too much the game image : {} / {} > {}".format(infos["left"]  - ((bezel_width-img_width)/2.0), img_width, max_cover))
+        return None
+    if "right" in infos and abs((infos["right"] - ((bezel_width-img_width)/2.0)) / img_width) > max_cover:
+        eslog.debug("bezel right covers too much the game image : {} / {} > {}".format(infos["right"]  - ((bezel_width-img_width)/2.0), img_width, max_cover))
+        return None
+
+    # if screen and bezel sizes doesn't match, resize
+    if (bezel_width != gameResolution["width"] or bezel_height != gameResolution["height"]):
+        eslog.debug("bezel needs to be resized")
+        try:
+            overlay_png_file = bezelsUtil.cachedResizeImage(overlay_png_file, gameResolution["width"], gameResolution["height"])
+        except Exception as e:
+            eslog.error("failed to resize the image {}".format(e))
+            return None
+
+    if system.isOptSet('bezel.tattoo') and system.config['bezel.tattoo'] != "0":
+        overlay_png_file = bezelsUtil.cachedTatooImage(overlay_png_file, system)
+
+    eslog.debug("applying bezel {}".format(overlay_png_file))
+    return overlay_png_file
+
+def extractGameInfosFromXml(xml):
+    vals = {}
+
+    try:
+        infos = ET.parse(xml)
+        try:
+            vals["name"] = infos.find("./game/name").text
+        except:
+            pass
+        try:
+            vals["thumbnail"] = infos.find("./game/thumbnail").text
+        except:
+            pass
+    except:
+        pass
+    return vals
+
+def callExternalScripts(folder, event, args):
+    if not os.path.isdir(folder):
+        return
+
+    for file in os.listdir(folder):
+        if os.path.isdir(os.path.join(folder, file)):
+            callExternalScripts(os.path.join(folder, file), event, args)
+        else:
+            if os.access(os.path.join(folder, file), os.X_OK):
+                eslog.debug("calling external script: " + str([os.path.join(folder, file), event] + args))
+                subprocess.call([os.path.join(folder, file), event] + args)
+
+def hudConfig_protectStr(str):
+    if str is None:
+        return ""
+    return str
+
+def getHudConfig(system, systemName, emulator, core, rom, gameinfos, bezel):
+    configstr = ""
+
+    if bezel != "" and bezel is not None:
+        configstr = "background_image={}\nlegacy_layout=false\n".format(hudConfig_protectStr(bezel))
+
+    if not system.isOptSet('hud'):
+        return configstr + "background_alpha=0\n" # hide the background
+
+    mode = system.config["hud"]
+
+    emulatorstr = emulator
+    if emulator != core and core is not None:
+        emulatorstr += "/" + core
+
+    gameName = ""
+    if "name" in gameinfos:
+        gameName = gameinfos["name"]
+    gameThumbnail = ""
+    if "thumbnail" in gameinfos:
+        gameThumbnail = gameinfos["thumbnail"]
+
+    # predefined values
+    if mode == "perf":
+        configstr += "position=bottom-left\nbackground_alpha=0.9\nlegacy_layout=false\ncustom_text=%GAMENAME%\ncustom_text=%SYSTEMNAME%\ncustom_text=%EMULATORCORE%\nfps\ngpu_name\nengine_version\nvulkan_driver\nresolution\nram\ngpu_stats\ngpu_temp\ncpu_stats\ncpu_temp\ncore_load"
+    elif mode == "game":
+        configstr += "position=bottom-left\nbackground_alpha=0\nlegacy_layout=false\nfont_size=32\nimage_max_width=200\nimage=%THUMBNAIL%\ncustom_text=%GAMENAME%\ncustom_text=%SYSTEMNAME%\ncustom_text=%EMULATORCORE%"
+    elif mode == "custom" and system.isOptSet('hud_custom') and system.config["hud_custom"] != "" :
+        configstr += system.config["hud_custom"].replace("\\n", "\n")
+    else:
+        configstr = configstr + "background_alpha=0\n" # hide the background
+
+    configstr = configstr.replace("%SYSTEMNAME%", hudConfig_protectStr(systemName))
+    configstr = configstr.replace("%GAMENAME%", hudConfig_protectStr(gameName))
+    configstr = configstr.replace("%EMULATORCORE%", hudConfig_protectStr(emulatorstr))
+    configstr = configstr.replace("%THUMBNAIL%", hudConfig_protectStr(gameThumbnail))
+
+    return configstr
+
+def runCommand(command, outputLevel="debug", cwd=None):
+    global proc
+
+    command.env.update(os.environ)
+    eslog.debug("command: {}".format(str(command)))
+    eslog.debug("command: {}".format(str(command.array)))
+    eslog.debug("env: {}".format(str(command.env)))
+    exitcode = -1
+    if command.array:
+        output = OutputCapture(outputLevel)
+        proc = subprocess.Popen(command.array, env=command.env, cwd=cwd, **output.popenArgs())
+        if procStarted is not None:
+            procStarted(proc)
+    else:
+        return exitcode
+    try:
+        output.start(proc)
+        exitcode = proc.wait()
+    except BrokenPipeError:
+        # Seeing BrokenPipeError? This is probably caused by head truncating output in the front-end
+        # Examine es-core/src/platform.cpp::runSystemCommand for additional context
+        pass
+    except:
+        eslog.error("emulator exited")
+    finally:
+        output.stop()
+
+    return exitcode
+
+def signal_handler(signal, frame):
+    global proc
+    eslog.debug('Exiting')
+    if proc:
+        eslog.debug('killing proc')
+        proc.kill()
+
+def launch(args):
+    global proc
+    proc = None
+    signal.signal(signal.SIGINT, signal_handler)
+
+    exitcode = -1
+    trace.start("{} {}".format(args.system, os.path.basename(args.rom)))
+    try:
+        with span("launcher.launch", system=args.system, rom=os.path.basename(args.rom)):
+            exitcode = main(args, maxnbplayers)
+    except Exception as e:
+        eslog.error("configgen exception: ", exc_info=True)
+    finally:
+        trace.save()
+    return exitcode
+
+# Local Variables:
+# tab-width:4
+# indent-tabs-mode:nil
+# End:
+# vim: set expandtab tabstop=4 shiftwidth=4:
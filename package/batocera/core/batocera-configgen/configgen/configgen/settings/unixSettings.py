@@ -4,11 +4,14 @@ import configparser
 import os
 import re
 import io
+import itertools
 from configgen.utils.logger import get_logger
 
 eslog = get_logger(__name__)
 __source__ = os.path.basename(__file__)
 
+protectRegex = re.compile(r'[^A-Za-z0-9-\.]+')
+
 class UnixSettings():
 
     def __init__(self, settingsFile, separator='', defaultComment='#'):
@@ -22,35 +25,82 @@ class UnixSettings():
         self.config = configparser.ConfigParser(interpolation=None, strict=False) # strict=False to allow to read duplicates set by users
         # To prevent ConfigParser from converting to lower case
         self.config.optionxform = str
+        # index of the values by prefix, built on the first loadAll
+        self.index = None
 
         try:
-            # TODO: remove me when we migrate to Python 3
-            # pretend where have a [DEFAULT] section
-            file = io.StringIO()
-            file.write('[DEFAULT]\n')
-            file.write(io.open(self.settingsFile, encoding='utf_8_sig').read())
-            file.seek(0, os.SEEK_SET)
-
-            self.config.readfp(file)
+            # pretend where have a [DEFAULT] section, the file is read line by line, without copy
+            with io.open(self.settingsFile, encoding='utf_8_sig') as file:
+                self.config.read_file(itertools.chain(['[DEFAULT]\n'], file), source=self.settingsFile)
         except IOError as e:
             eslog.error(str(e))
+        # values as read, to report the changes on write
+        self.loaded = dict(self.config.defaults())
+
+    # shared read only settings (batocera.conf), parsed once per launch
+    # and kept by the configgen daemon as long as the file doesn't change
+    snapshots = dict()
+
+    @staticmethod
+    def snapshot(settingsFile):
+        try:
+            st = os.stat(settingsFile)
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+
+        if settingsFile in UnixSettings.snapshots:
+            (snapshotStamp, settings) = UnixSettings.snapshots[settingsFile]
+            if snapshotStamp == stamp:
+                return settings
+
+        settings = UnixSettings(settingsFile)
+        settings.buildIndex()
+        UnixSettings.snapshots[settingsFile] = (stamp, settings)
+        return settings
 
+    # the file is only rewritten when its content changes (to save sd card writes), and atomically
     def write(self):
-        fp = open(self.settingsFile, 'w')
         try:
-            for (key, value) in self.config.items('DEFAULT'):
-                fp.write("{0}{2}={2}{1}\n".format(key, str(value), self.separator))
+            content = "".join(["{0}{2}={2}{1}\n".format(key, str(value), self.separator) for (key, value) in self.config.items('DEFAULT')])
         except:
             # PSX Mednafen writes beetle_psx_hw_cpu_freq_scale = "100%(native)"
             # Python 2.7 is EOL and ConfigParser 2.7 takes "%(" as a won't fix error
             # TODO: clean that up when porting to Python 3
             eslog.error("Wrong value detected (after % char maybe?), ignoring.")
-        fp.close()
+            return
+
+        target = os.path.realpath(self.settingsFile)
+        try:
+            with io.open(target, encoding='utf_8_sig') as fp:
+                if fp.read() == content:
+                    eslog.debug("{0} is unchanged, not written".format(self.settingsFile))
+                    return
+        except (IOError, UnicodeError):
+            pass # missing or invalid, rewrite it
+
+        current = self.config.defaults()
+        nbchanges = len([key for key in current if key not in self.loaded or self.loaded[key] != current[key]]) + len([key for key in self.loaded if key not in current])
+        eslog.debug("Writing {0} ({1} keys changed)".format(self.settingsFile, nbchanges))
+
+        tmpfile = "{0}.{1}.tmp".format(target, os.getpid())
+        with io.open(tmpfile, 'w', encoding='utf_8') as fp:
+            fp.write(content)
+        os.replace(tmpfile, target)
+        self.loaded = dict(current)
 
     def save(self, name, value):
         eslog.debug("Writing {0} = {1} to {2}".format(name, value, self.settingsFile))
         # TODO: do we need proper section support? PSP config is an ini file
         self.config.set('DEFAULT', name, str(value))
+        self.index = None
+
+    # several values at once, in the order of the dict
+    def saveAll(self, values):
+        eslog.debug("Writing {0} values to {1}".format(len(values), self.settingsFile))
+        for (name, value) in values.items():
+            self.config.set('DEFAULT', name, str(value))
+        self.index = None
 
     def disableAll(self, name):
         eslog.debug("Disabling {0} from {1}".format(name, self.settingsFile))
@@ -58,20 +108,35 @@ class UnixSettings():
             m = re.match(r"^" + name, key)
             if m:
                 self.config.remove_option('DEFAULT', key)
+        self.index = None
 
     def remove(self, name):
         self.config.remove_option('DEFAULT', name)
+        self.index = None
 
     @staticmethod
     def protectString(str):
-        return re.sub('[^A-Za-z0-9-\.]+', '_', str)
+        return protectRegex.sub('_', str)
 
     def loadAll(self, name):
         eslog.debug("Looking for {0}.* in {1}".format(name, self.settingsFile))
-        res = dict()
-        for (key, value) in self.config.items('DEFAULT'):
-            m = re.match(r"^" + UnixSettings.protectString(name) + "\.(.+)", UnixSettings.protectString(key))
-            if m:
-                res[m.group(1)] = value;
+        if self.index is None:
+            self.buildIndex()
+        prefix = UnixSettings.protectString(name)
+        if prefix in self.index:
+            return dict(self.index[prefix])
+        return dict()
 
-        return res
+    # one pass on the keys: for a key a.b.c, index it as c in the a.b section and as b.c in the a section
+    # so that loadAll only has to look at the keys of the section
+    def buildIndex(self):
+        self.index = dict()
+        for (key, value) in self.config.defaults().items():
+            pkey = UnixSettings.protectString(key)
+            pos = pkey.find('.', 1)
+            while pos != -1 and pos < len(pkey)-1:
+                prefix = pkey[:pos]
+                if prefix not in self.index:
+                    self.index[prefix] = dict()
+                self.index[prefix][pkey[pos+1:]] = value
+                pos = pkey.find('.', pos+1)
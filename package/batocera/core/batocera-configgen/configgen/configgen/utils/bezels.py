@@ -1,12 +1,69 @@
 import os
 import batoceraFiles
 import struct
-from PIL import Image, ImageOps
+import hashlib
+import pickle
+import resource
 from .logger import get_logger
+from .trace import span
 from .videoMode import getGameSpecial
 
 eslog = get_logger(__name__)
 
+# PIL is only imported by the functions rendering images, the lookup is done on each launch
+
+# the rendered bezels (resized, padded, tattooed) are kept in /userdata/system/cache/bezels,
+# named after the source images (path, mtime, size) and the rendering parameters.
+# the least recently used ones are removed when the cache gets bigger than this
+bezelCacheMaxSize = 128 * 1024 * 1024
+
+# the content of the decoration directories, to find the bezel without testing each candidate file (/userdata can be slow).
+# it is saved in the cache and a directory is listed again only when its mtime changes
+class BezelIndex():
+
+    def __init__(self, indexFile):
+        self.indexFile = indexFile
+        self.dirs = None # directory -> (mtime, files)
+        self.changed = False
+
+    def load(self):
+        if self.dirs is not None:
+            return
+        try:
+            with open(self.indexFile, 'rb') as f:
+                self.dirs = pickle.load(f)
+        except Exception:
+            self.dirs = dict() # missing or invalid
+
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.indexFile), exist_ok=True)
+            tmpfile = "{}.{}.tmp".format(self.indexFile, os.getpid())
+            with open(tmpfile, 'wb') as f:
+                pickle.dump(self.dirs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, self.indexFile)
+        except Exception as e:
+            eslog.debug("unable to save the bezels index: {}".format(e))
+        self.changed = False
+
+    # the files of the directory, None if it doesn't exist
+    def files(self, directory):
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        if directory in self.dirs and self.dirs[directory][0] == mtime:
+            return self.dirs[directory][1]
+        files = frozenset(os.listdir(directory))
+        self.dirs[directory] = (mtime, files)
+        self.changed = True
+        return files
+
+bezelIndex = BezelIndex(batoceraFiles.CACHE + "/configgen/bezels-index.pickle")
+
+@span("bezels.getBezelInfos")
 def getBezelInfos(rom, bezel, systemName):
     # by order choose :
     # rom name in the system subfolder of the user directory (gb/mario.png)
@@ -17,88 +74,57 @@ def getBezelInfos(rom, bezel, systemName):
     # system name in the user directory (gb.png)
     # system name with special graphic in the system directory (gb-90.png)
     # system name in the system directory (gb.png)
-    # default name (default.png)
+    # default name with special graphic in the user directory (default-90.png)
+    # default name in the user directory (default.png)
+    # default name with special graphic in the system directory (default-90.png)
+    # default name in the system directory (default.png)
     # else return
     # mamezip files are for MAME-specific advanced artwork (bezels with overlays and backdrops, animated LEDs, etc)
     gameSpecial = getGameSpecial(systemName, rom)
     romBase = os.path.splitext(os.path.basename(rom))[0] # filename without extension
-    overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".info"
-    overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".png"
-    overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".lay"
-    overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".zip"
-    bezel_game = True
-    if not os.path.exists(overlay_png_file):
-        overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/games/" + systemName + "/" + romBase + ".info"
-        overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/games/" + systemName + "/" + romBase + ".png"
-        overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".lay"
-        overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + systemName + "/" + romBase + ".zip"
-        bezel_game = True
-        if not os.path.exists(overlay_png_file):
-            overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".info"
-            overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".png"
-            overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".lay"
-            overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".zip"
-            bezel_game = True
-            if not os.path.exists(overlay_png_file):
-                overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/games/" + romBase + ".info"
-                overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/games/" + romBase + ".png"
-                overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".lay"
-                overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/games/" + romBase + ".zip"
-                bezel_game = True
-                if not os.path.exists(overlay_png_file):
-                    if gameSpecial != 0:
-                      overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".info"
-                      overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".png"
-                      overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".lay"
-                      overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".zip"
-                      bezel_game = False
-                    if not os.path.exists(overlay_png_file):
-                        overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + ".info"
-                        overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + ".png"
-                        overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + ".lay"
-                        overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/systems/" + systemName + ".zip"
-                        bezel_game = False
-                        if not os.path.exists(overlay_png_file):
-                            if gameSpecial != 0:
-                              overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".info"
-                              overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".png"
-                              overlay_layout_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".lay"
-                              overlay_mamezip_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + "-" + str(gameSpecial) + ".zip"
-                              bezel_game = False
-                            if not os.path.exists(overlay_png_file):
-                                overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + ".info"
-                                overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + ".png"
-                                overlay_layout_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + ".lay"
-                                overlay_mamezip_file  = batoceraFiles.overlaySystem + "/" + bezel + "/systems/" + systemName + ".zip"
-                                bezel_game = False
-                                if not os.path.exists(overlay_png_file):
-                                    overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/default-" + str(gameSpecial) + ".info"
-                                    overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/default-" + str(gameSpecial) + ".png"
-                                    overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/default-" + str(gameSpecial) + ".lay"
-                                    overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/default-" + str(gameSpecial) + ".zip"
-                                    bezel_game = True
-                                    if not os.path.exists(overlay_png_file):
-                                      overlay_info_file = batoceraFiles.overlayUser + "/" + bezel + "/default.info"
-                                      overlay_png_file  = batoceraFiles.overlayUser + "/" + bezel + "/default.png"
-                                      overlay_layout_file  = batoceraFiles.overlayUser + "/" + bezel + "/default.lay"
-                                      overlay_mamezip_file  = batoceraFiles.overlayUser + "/" + bezel + "/default.zip"
-                                      bezel_game = True
-                                      if not os.path.exists(overlay_png_file):
-                                          overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/default-" + str(gameSpecial) + ".info"
-                                          overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default-" + str(gameSpecial) + ".png"
-                                          overlay_layout_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default-" + str(gameSpecial) + ".lay"
-                                          overlay_mamezip_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default-" + str(gameSpecial) + ".zip"
-                                          bezel_game = True
-                                          if not os.path.exists(overlay_png_file):
-                                            overlay_info_file = batoceraFiles.overlaySystem + "/" + bezel + "/default.info"
-                                            overlay_png_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default.png"
-                                            overlay_layout_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default.lay"
-                                            overlay_mamezip_file  = batoceraFiles.overlaySystem + "/" + bezel + "/default.zip"
-                                            bezel_game = True
-                                            if not os.path.exists(overlay_png_file):
-                                              return None
-    eslog.debug("Original bezel file used: {}".format(overlay_png_file))
-    return { "png": overlay_png_file, "info": overlay_info_file, "layout": overlay_layout_file, "mamezip": overlay_mamezip_file, "specific_to_game": bezel_game }
+    user = batoceraFiles.overlayUser + "/" + bezel
+    system = batoceraFiles.overlaySystem + "/" + bezel
+
+    # (directory of the png and info files, name, directory of the lay and zip files, specific to game)
+    # the lay and zip files of the games are always taken from the user directory
+    candidates = [
+        (user,   "/games/" + systemName, romBase,                              user + "/games/" + systemName, True),
+        (system, "/games/" + systemName, romBase,                              user + "/games/" + systemName, True),
+        (user,   "/games",               romBase,                              user + "/games",               True),
+        (system, "/games",               romBase,                              user + "/games",               True),
+        (user,   "/systems",             systemName + "-" + str(gameSpecial),  None,                          False),
+        (user,   "/systems",             systemName,                           None,                          False),
+        (system, "/systems",             systemName + "-" + str(gameSpecial),  None,                          False),
+        (system, "/systems",             systemName,                           None,                          False),
+        (user,   "",                     "default-" + str(gameSpecial),        None,                          True),
+        (user,   "",                     "default",                            None,                          True),
+        (system, "",                     "default-" + str(gameSpecial),        None,                          True),
+        (system, "",                     "default",                            None,                          True),
+    ]
+
+    bezelIndex.load()
+    listings = dict()
+    try:
+        for (root, subdir, name, otherdir, bezel_game) in candidates:
+            # a missing decoration doesn't need more lookups
+            if root not in listings:
+                listings[root] = bezelIndex.files(root)
+            if listings[root] is None:
+                continue
+            directory = root + subdir
+            if directory not in listings:
+                listings[directory] = bezelIndex.files(directory)
+            if listings[directory] is None or name + ".png" not in listings[directory]:
+                continue
+
+            if otherdir is None:
+                otherdir = directory
+            overlay_png_file = directory + "/" + name + ".png"
+            eslog.debug("Original bezel file used: {}".format(overlay_png_file))
+            return { "png": overlay_png_file, "info": directory + "/" + name + ".info", "layout": otherdir + "/" + name + ".lay", "mamezip": otherdir + "/" + name + ".zip", "specific_to_game": bezel_game }
+        return None
+    finally:
+        bezelIndex.save()
 
 # Much faster than PIL Image.size
 def fast_image_size(image_file):
@@ -115,114 +141,173 @@ def fast_image_size(image_file):
            return -1, -1
         return struct.unpack('>ii', head[16:24]) #image width, height
 
-def resizeImage(input_png, output_png, screen_width, screen_height):
+# the bezel as RGBA, palette + transparency images (TheBezelProject) are converted directly
+# the images without transparency are rejected, unless transparent is False (the tattoo goes over any bezel)
+def openBezel(input_png, transparent=True):
+    from PIL import Image
     imgin = Image.open(input_png)
-    eslog.debug("Resizing bezel: image mode {}".format(imgin.mode))
-    if imgin.mode != "RGBA":
-        alphaPaste(input_png, output_png, imgin, fillcolor, (screen_width, screen_height))
-    else:
-        imgout = imgin.resize((screen_width, screen_height), Image.BICUBIC)
-        imgout.save(output_png, mode="RGBA", format="PNG")
+    eslog.debug("Bezel image mode {}".format(imgin.mode))
+    if imgin.mode == "RGBA":
+        return imgin
+    if transparent and imgin.mode not in ["LA", "PA"] and not 'transparency' in imgin.info:
+        raise Exception("no transparent pixels in the image, abort")
+    return imgin.convert("RGBA")
+
+@span("bezels.resizeImage")
+def resizeImage(input_png, output_png, screen_width, screen_height):
+    from PIL import Image
+    imgin = openBezel(input_png)
+    imgout = imgin.resize((screen_width, screen_height), Image.BICUBIC)
+    imgout.save(output_png, mode="RGBA", format="PNG")
 
+@span("bezels.padImage")
 def padImage(input_png, output_png, screen_width, screen_height, bezel_width, bezel_height):
+  from PIL import ImageOps
   fillcolor = 'black'
+  imgin = openBezel(input_png)
+  imgout = ImageOps.pad(imgin, (screen_width, screen_height), color=fillcolor, centering=(0.5,0.5))
+  imgout.save(output_png, mode="RGBA", format="PNG")
 
-  wratio = screen_width / float(bezel_width)
-  hratio = screen_height / float(bezel_height)
-
-  xoffset = screen_width  - bezel_width
-  yoffset = screen_height - bezel_height
-
-  borderw = 0
-  borderh = 0
-  if wratio > 1:
-      borderw = xoffset // 2
-  if hratio > 1:
-      borderh = yoffset // 2
-  imgin = Image.open(input_png)
-  if imgin.mode != "RGBA":
-      alphaPaste(input_png, output_png, imgin, fillcolor, (screen_width, screen_height))
-  else:
-      imgout = ImageOps.pad(imgin, (screen_width, screen_height), color=fillcolor, centering=(0.5,0.5))
-      imgout.save(output_png, mode="RGBA", format="PNG")
-
-def tatooImage(input_png, output_png, system):
+def getTattooFile(system):
   if system.config['bezel.tattoo'] == 'system':
-      try:
-          tattoo_file = '/usr/share/batocera/controller-overlays/'+system.name+'.png'
-          if not os.path.exists(tattoo_file):
-              tattoo_file = '/usr/share/batocera/controller-overlays/generic.png'
-          tattoo = Image.open(tattoo_file)
-      except:
-          eslog.error("Error opening controller overlay: {}".format(tattoo_file))
-  elif system.config['bezel.tattoo'] == 'custom' and os.path.exists(system.config['bezel.tattoo_file']):
-      try:
-          tattoo_file = system.config['bezel.tattoo_file']
-          tattoo = Image.open(tattoo_file)
-      except:
-          eslog.error("Error opening custom file: {}".format(tattoo_file))
-  else:
-      try:
+      tattoo_file = '/usr/share/batocera/controller-overlays/'+system.name+'.png'
+      if not os.path.exists(tattoo_file):
           tattoo_file = '/usr/share/batocera/controller-overlays/generic.png'
-          tattoo = Image.open(tattoo_file)
-      except:
-          eslog.error("Error opening custom file: {}".format(tattoo_file))
-  # Open the existing bezel...
-  back = Image.open(input_png)
-  # Convert it otherwise it implodes later on...
-  back = back.convert("RGBA")
-  tattoo = tattoo.convert("RGBA")
-  # Quickly grab the sizes.
-  w,h = fast_image_size(input_png)
-  tw,th = fast_image_size(tattoo_file)
-  if "bezel.resize_tattoo" in system.config and system.config['bezel.resize_tattoo'] == 0:
-      # Maintain the image's original size.
-      # Failsafe for if the image is too large.
-      if tw > w or th > h:
-          # Limit width to that of the bezel and crop the rest.
-          pcent = float(w / tw)
-          th = int(float(th) * pcent)
-          # Resize the tattoo to the calculated size.
-          tattoo = tattoo.resize((w,th), Image.BICUBIC)
+  elif system.config['bezel.tattoo'] == 'custom' and os.path.exists(system.config['bezel.tattoo_file']):
+      tattoo_file = system.config['bezel.tattoo_file']
   else:
+      tattoo_file = '/usr/share/batocera/controller-overlays/generic.png'
+  return tattoo_file
+
+def getTattooCorner(system):
+  if system.isOptSet('bezel.tattoo_corner'):
+      return system.config['bezel.tattoo_corner'].upper()
+  return 'NW'
+
+# tattoo width relative to the bezel width (the bezel side column), None to keep its size
+def getTattooWidthRatio(system):
+  if system.isOptSet('bezel.resize_tattoo') and str(system.config['bezel.resize_tattoo']) == '0':
+      return None
+  return 225/1920
+
+# blends the tattoo in a corner of the bezel
+# only the corner region is composited, in the bezel buffer itself
+@span("bezels.compositeTattoo")
+def compositeTattoo(input_png, output_png, tattoo_file, corner, width_ratio, margin_ratio):
+  from PIL import Image
+  back = openBezel(input_png, transparent=False)
+  back.load()
+  try:
+      tattoo = Image.open(tattoo_file)
+  except:
+      eslog.error("Error opening controller overlay: {}".format(tattoo_file))
+      raise
+  if tattoo.mode != "RGBA":
+      tattoo = tattoo.convert("RGBA")
+
+  w,h = back.size
+  tw,th = tattoo.size
+  if width_ratio is not None:
       # Resize to be slightly smaller than the bezel's column.
-      twtemp = int((225/1920) * w)
-      pcent = float(twtemp / tw)
-      th = int(float(th) * pcent)
-      tattoo = tattoo.resize((twtemp,th), Image.BICUBIC)
+      twtemp = int(width_ratio * w)
+      th = int(th * twtemp / tw)
       tw = twtemp
-  # Create a new blank canvas that is the same size as the bezel for later compositing (they are required to be the same size).
-  tattooCanvas = Image.new("RGBA", back.size)
-  # Margin for the tattoo
-  margin = int((20 / 1080) * h)
-  if system.isOptSet('bezel.tattoo_corner'):
-      corner = system.config['bezel.tattoo_corner']
-  else:
-      corner = 'NW'
-  if (corner.upper() == 'NE'):
-      tattooCanvas.paste(tattoo, (w-tw,margin)) # 20 pixels vertical margins (on 1080p)
-  elif (corner.upper() == 'SE'):
-      tattooCanvas.paste(tattoo, (w-tw,h-th-margin))
-  elif (corner.upper() == 'SW'):
-      tattooCanvas.paste(tattoo, (0,h-th-margin))
-  else: # default = NW
-      tattooCanvas.paste(tattoo, (0,margin))
-  back = Image.alpha_composite(back, tattooCanvas)
-
-  imgnew = Image.new("RGBA", (w,h), (0,0,0,255))
-  imgnew.paste(back, (0,0,w,h))
-  imgnew.save(output_png, mode="RGBA", format="PNG")
-
-def alphaPaste(input_png, output_png, imgin, fillcolor, screensize):
-  # screensize=(screen_width, screen_height)
-  imgin = Image.open(input_png)
-  # TheBezelProject have Palette + alpha, not RGBA. PIL can't convert from P+A to RGBA.
-  # Even if it can load P+A, it can't save P+A as PNG. So we have to recreate a new image to adapt it.
-  if not 'transparency' in imgin.info:
-      raise Exception("no transparent pixels in the image, abort")
-  alpha = imgin.split()[-1]  # alpha from original palette + alpha
-  ix,iy = fast_image_size(input_png)
-  imgnew = Image.new("RGBA", (ix,iy), (0,0,0,255))
-  imgnew.paste(alpha, (0,0,ix,iy))
-  imgout = ImageOps.pad(imgnew, screensize, color=fillcolor, centering=(0.5,0.5))
-  imgout.save(output_png, mode="RGBA", format="PNG")
+  elif tw > w:
+      # Maintain the image's original size.
+      # Failsafe for if the image is too large: limit width to that of the bezel.
+      th = int(th * w / tw)
+      tw = w
+  if (tw,th) != tattoo.size:
+      tattoo = tattoo.resize((tw,th), Image.BICUBIC)
+
+  margin = int(margin_ratio * h) # 20 pixels vertical margins (on 1080p)
+  x = w-tw if corner in ['NE', 'SE'] else 0
+  y = h-th-margin if corner in ['SE', 'SW'] else margin
+  # the part of the tattoo inside the bezel
+  box = (max(x, 0), max(y, 0), min(x+tw, w), min(y+th, h))
+  if box[2] > box[0] and box[3] > box[1]:
+      region = back.crop(box)
+      part = tattoo.crop((box[0]-x, box[1]-y, box[2]-x, box[3]-y))
+      back.paste(Image.alpha_composite(region, part), box)
+  back.save(output_png, mode="RGBA", format="PNG")
+  eslog.debug("Tattoo composited, max rss {} MB".format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024))
+
+@span("bezels.tatooImage")
+def tatooImage(input_png, output_png, system):
+  compositeTattoo(input_png, output_png, getTattooFile(system), getTattooCorner(system), getTattooWidthRatio(system), 20/1080)
+
+# a source changed when its path, its modification time or its size changed (the content is not read)
+# a render of the cache is named after its own sources and params (and its mtime changes when it is used): its name is enough
+def fileStamp(path):
+    if os.path.dirname(os.path.abspath(path)) == os.path.abspath(batoceraFiles.overlayCache):
+        return (path,)
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+# returns the image rendered by render(output_png) from the sources and the params, from the cache when possible
+# sources: the files the image depends on, params: all the other values the rendering depends on
+@span("bezels.cachedRender")
+def cachedRender(sources, params, render):
+    key = hashlib.sha1(repr(params).encode())
+    for source in sources:
+        key.update(repr(fileStamp(source)).encode())
+    output_png = batoceraFiles.overlayCache + "/" + key.hexdigest() + ".png"
+
+    if os.path.exists(output_png):
+        eslog.debug("Bezel render found in the cache: {}".format(output_png))
+        try:
+            os.utime(output_png) # most recently used
+        except OSError:
+            pass
+        return output_png
+
+    if not os.path.exists(batoceraFiles.overlayCache):
+        os.makedirs(batoceraFiles.overlayCache, exist_ok=True)
+    tmpfile = "{}.{}.tmp".format(output_png, os.getpid())
+    try:
+        render(tmpfile)
+        os.replace(tmpfile, output_png)
+    finally:
+        if os.path.exists(tmpfile):
+            os.remove(tmpfile)
+    eslog.debug("Bezel render added to the cache: {}".format(output_png))
+    evictBezelCache(output_png)
+    return output_png
+
+def evictBezelCache(keep):
+    files = []
+    size = 0
+    for entry in os.scandir(batoceraFiles.overlayCache):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue # removed meanwhile
+        files.append((st.st_mtime, st.st_size, entry.path))
+        size += st.st_size
+
+    for (mtime, filesize, path) in sorted(files):
+        if size <= bezelCacheMaxSize:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            size -= filesize
+            eslog.debug("Bezel render removed from the cache: {}".format(path))
+        except OSError:
+            pass
+
+def cachedResizeImage(input_png, screen_width, screen_height):
+    return cachedRender([input_png], ("resize", screen_width, screen_height),
+                        lambda output_png: resizeImage(input_png, output_png, screen_width, screen_height))
+
+def cachedPadImage(input_png, screen_width, screen_height, bezel_width, bezel_height):
+    return cachedRender([input_png], ("pad", screen_width, screen_height, bezel_width, bezel_height),
+                        lambda output_png: padImage(input_png, output_png, screen_width, screen_height, bezel_width, bezel_height))
+
+def cachedCompositeTattoo(input_png, tattoo_file, corner, width_ratio, margin_ratio):
+    return cachedRender([input_png, tattoo_file], ("tattoo", corner, width_ratio, margin_ratio),
+                        lambda output_png: compositeTattoo(input_png, output_png, tattoo_file, corner, width_ratio, margin_ratio))
+
+def cachedTatooImage(input_png, system):
+    return cachedCompositeTattoo(input_png, getTattooFile(system), getTattooCorner(system), getTattooWidthRatio(system), 20/1080)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+# the output of the emulator is read while it runs instead of being kept in memory until it exits.
+# the lines go to /userdata/system/logs/emulator.log (the previous launches in emulator.log.1, .2),
+# only the last ones are kept to be logged by configgen at the end, as before.
+#   <system>.configgen.emulatorlog=debug   stdout and stderr (default)
+#   <system>.configgen.emulatorlog=error   stderr only
+#   <system>.configgen.emulatorlog=none    nothing, the output is not even read
+
+import os
+import threading
+import subprocess
+import collections
+import batoceraFiles
+from .logger import get_logger
+
+eslog = get_logger(__name__)
+
+emulatorLog = batoceraFiles.logdir + "emulator.log"
+emulatorLogMaxSize = 2 * 1024 * 1024
+emulatorLogBackups = 2
+tailLines = 200
+maxLineSize = 64 * 1024 # a line without end (\r progress bars, binary output) is cut there
+levels = [ "debug", "error", "none" ]
+
+# emulator.log, renamed emulator.log.1 (and so on) at each launch and when it gets too big
+class RotatingLog():
+
+    def __init__(self, logfile, maxSize=emulatorLogMaxSize, backups=emulatorLogBackups):
+        self.logfile = logfile
+        self.maxSize = maxSize
+        self.backups = backups
+        self.lock = threading.Lock()
+        self.file = None
+        self.rotate()
+
+    def rotate(self):
+        if self.file is not None:
+            self.file.close()
+        if os.path.exists(self.logfile) and os.path.getsize(self.logfile) > 0:
+            for n in range(self.backups - 1, 0, -1):
+                if os.path.exists("{}.{}".format(self.logfile, n)):
+                    os.replace("{}.{}".format(self.logfile, n), "{}.{}".format(self.logfile, n + 1))
+            os.replace(self.logfile, self.logfile + ".1")
+        self.file = open(self.logfile, "wb")
+        self.size = 0
+
+    def write(self, data):
+        with self.lock:
+            if self.file is None:
+                return
+            if self.size > 0 and self.size + len(data) > self.maxSize:
+                self.rotate()
+            self.file.write(data)
+            self.size += len(data)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+class OutputCapture():
+
+    def __init__(self, level="debug", logfile=None):
+        if logfile is None:
+            logfile = emulatorLog
+        if level not in levels:
+            eslog.warning("unknown emulator log level {}, using debug".format(level))
+            level = "debug"
+        self.level = level
+        self.logfile = logfile
+        self.tails = dict()
+        self.threads = []
+        self.log = None
+        self.proc = None
+
+    # the stdout and stderr arguments of Popen
+    def popenArgs(self):
+        return {
+            "stdout": subprocess.PIPE if self.level == "debug" else subprocess.DEVNULL,
+            "stderr": subprocess.PIPE if self.level in [ "debug", "error" ] else subprocess.DEVNULL
+        }
+
+    def start(self, proc):
+        self.proc = proc
+        if self.level == "none":
+            return
+        try:
+            self.log = RotatingLog(self.logfile)
+        except Exception as e:
+            eslog.warning("unable to open {}: {}".format(self.logfile, e))
+
+        for (name, pipe) in [ ("stdout", proc.stdout), ("stderr", proc.stderr) ]:
+            if pipe is not None:
+                self.tails[name] = collections.deque(maxlen=tailLines)
+                thread = threading.Thread(target=self.read, args=(name, pipe), name="emulator-" + name, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    # read what is available, the complete lines go to the log (not to mix the lines of stdout and stderr)
+    def read(self, name, pipe):
+        tail = self.tails[name]
+        rest = b""
+        try:
+            while True:
+                data = pipe.read1(65536)
+                if not data:
+                    break
+                end = data.rfind(b"\n")
+                if end == -1:
+                    rest += data
+                    if len(rest) > maxLineSize:
+                        if self.log is not None:
+                            self.log.write(rest + b"\n")
+                        tail.append(rest[:maxLineSize])
+                        rest = b""
+                    continue
+                lines = rest + data[:end + 1]
+                rest = data[end + 1:]
+                if self.log is not None:
+                    self.log.write(lines)
+                tail.extend([ line[:maxLineSize] for line in lines.splitlines()[-tailLines:] ])
+        except (OSError, ValueError):
+            pass # pipe closed
+        finally:
+            if rest:
+                if self.log is not None:
+                    self.log.write(rest + b"\n")
+                tail.append(rest[:maxLineSize])
+            pipe.close()
+
+    # once the emulator exited, wait for the end of its output and log the last lines
+    # (not waiting when it is still running, after an error)
+    def stop(self):
+        running = self.proc is not None and self.proc.poll() is None
+        for thread in self.threads:
+            thread.join(1 if running else None)
+        if self.log is not None:
+            self.log.close()
+        if "stdout" in self.tails and len(self.tails["stdout"]) > 0:
+            eslog.debug(b"\n".join(list(self.tails["stdout"])).decode(errors="replace"))
+        if "stderr" in self.tails and len(self.tails["stderr"]) > 0:
+            eslog.error(b"\n".join(list(self.tails["stderr"])).decode(errors="replace"))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+# a small dependency graph executor for the launch stages.
+# the stages run one after the other in the order they were added,
+# or, in parallel mode, each one in a thread as soon as the stages it depends on are done.
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from utils.logger import get_logger
+from utils.trace import span
+
+eslog = get_logger(__name__)
+
+class Pipeline():
+
+    def __init__(self, parallel=False):
+        self.parallel = parallel
+        self.stages = []
+        self.results = dict()
+        self.timings = dict()
+
+    # after: names of the stages to wait for, they must have been added before
+    def add(self, name, function, after=[]):
+        names = [ stage[0] for stage in self.stages ]
+        for dependency in after:
+            if dependency not in names:
+                raise Exception("stage {} depends on the unknown stage {}".format(name, dependency))
+        self.stages.append((name, function, after))
+
+    # returns the results of the stages by name
+    # on error, the running stages are finished, the others are not started, and the first exception is raised
+    def run(self):
+        start = time.monotonic()
+        try:
+            if self.parallel:
+                self.runParallel()
+            else:
+                for (name, function, after) in self.stages:
+                    self.results[name] = self.runStage(name, function)
+        finally:
+            eslog.debug("launch stages done in {:.3f}s ({}): {}".format(time.monotonic() - start, "parallel" if self.parallel else "serial",
+                                                                      ", ".join([ "{} {:.3f}s".format(name, self.timings[name]) for (name, function, after) in self.stages if name in self.timings ])))
+        return self.results
+
+    def runStage(self, name, function):
+        start = time.monotonic()
+        try:
+            with span("stage." + name):
+                return function()
+        finally:
+            self.timings[name] = time.monotonic() - start
+            eslog.debug("stage {} done in {:.3f}s".format(name, self.timings[name]))
+
+    def runParallel(self):
+        pending = list(self.stages)
+        running = dict()
+        error = None
+
+        with ThreadPoolExecutor(max_workers=len(self.stages) or 1) as executor:
+            while pending or running:
+                if error is None:
+                    for stage in list(pending):
+                        (name, function, after) = stage
+                        if all([ dependency in self.results for dependency in after ]):
+                            pending.remove(stage)
+                            running[executor.submit(self.runStage, name, function)] = name
+                if not running:
+                    break
+                done, notdone = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as e:
+                        eslog.error("stage {} failed: {}".format(name, e))
+                        if error is None:
+                            error = e
+
+        if error is not None:
+            raise error
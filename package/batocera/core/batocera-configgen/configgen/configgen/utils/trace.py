@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# timing spans of the launch, saved per launch as a chrome trace (chrome://tracing, https://ui.perfetto.dev)
+# in /userdata/system/logs/configgen-traces when configgen.trace=1 in batocera.conf. configgenTraces.py aggregates the last ones.
+# nothing is recorded outside of a launch (configgen-bezels, the configgen daemon itself).
+#
+#   with span("videoMode.changeMode"):      or      @span("videoMode.changeMode")
+#       ...                                         def changeMode(videomode):
+
+import os
+import time
+import json
+import threading
+import functools
+import batoceraFiles
+from .logger import get_logger
+
+eslog = get_logger(__name__)
+
+traceDir = batoceraFiles.logdir + "configgen-traces"
+maxTraces = 50
+maxEvents = 10000
+
+class Tracer():
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset(False)
+
+    def reset(self, enabled, description=None):
+        with self.lock:
+            self.enabled = enabled
+            self.description = description
+            self.origin = time.perf_counter()
+            self.events = []
+            self.threads = dict()
+
+    def add(self, name, begin, end, args):
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = { "name": name, "cat": name.split(".")[0], "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                  "ts": round((begin - self.origin) * 1000000), "dur": round((end - begin) * 1000000) }
+        if args:
+            event["args"] = args
+        with self.lock:
+            if not self.enabled or len(self.events) >= maxEvents:
+                return
+            if thread.ident not in self.threads:
+                self.threads[thread.ident] = thread.name
+                self.events.append({ "name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread.ident, "args": { "name": thread.name } })
+            self.events.append(event)
+
+tracer = Tracer()
+
+class span():
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self.begin = None
+
+    def start(self):
+        if tracer.enabled:
+            self.begin = time.perf_counter()
+        return self
+
+    def stop(self):
+        if self.begin is not None:
+            tracer.add(self.name, self.begin, time.perf_counter(), self.args)
+            self.begin = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+        return False
+
+    # used as a decorator
+    def __call__(self, function):
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            with span(self.name, **self.args):
+                return function(*args, **kwargs)
+        return traced
+
+# a new trace for each launch (the configgen daemon workers inherit the one of the daemon)
+# recorded until the configuration of the system says if the launch is traced (stop() otherwise)
+def start(description=None):
+    tracer.reset(True, description)
+
+# the launch is not traced: what was recorded is dropped
+def stop():
+    tracer.reset(False)
+
+def save():
+    with tracer.lock:
+        if not tracer.enabled:
+            return None
+        events = list(tracer.events)
+    if len(events) == 0:
+        return None
+
+    try:
+        if not os.path.exists(traceDir):
+            os.makedirs(traceDir)
+        filename = "{}/{}-{}.json".format(traceDir, time.strftime("%Y%m%d-%H%M%S"), os.getpid())
+        with open(filename, "w") as f:
+            json.dump({ "traceEvents": events, "displayTimeUnit": "ms", "otherData": { "launch": tracer.description } }, f)
+        eslog.debug("trace saved to {}".format(filename))
+
+        # keep only the last traces
+        traces = listTraces()
+        for old in traces[:-maxTraces]:
+            os.remove(old)
+        return filename
+    except Exception as e:
+        eslog.warning("unable to save the trace: {}".format(e))
+        return None
+
+def listTraces(directory=None):
+    if directory is None:
+        directory = traceDir
+    if not os.path.isdir(directory):
+        return []
+    return sorted([ os.path.join(directory, file) for file in os.listdir(directory) if file.endswith(".json") ])
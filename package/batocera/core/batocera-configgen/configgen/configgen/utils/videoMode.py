@@ -7,44 +7,132 @@ import time
 import subprocess
 import json
 import csv
+import glob
+import hashlib
+import threading
 from .logger import get_logger
+from .trace import span
 
 eslog = get_logger(__name__)
 
+# batocera-resolution forks a shell, and usually xrandr or drm tools.
+# the list of the modes is kept in /var/run (so fetched once per boot) and fetched again when
+# a drm connector changes (hotplug) or when /var/run/batocera-resolution.changed is touched (setOutput, forceMode)
+# the current mode and resolution are queried together, and kept until the mode is changed
+class VideoModeCache():
+
+    def __init__(self, cacheFile=batoceraFiles.videoModesCache, changedFile=batoceraFiles.videoModesChanged):
+        self.cacheFile = cacheFile
+        self.changedFile = changedFile
+        self.lock = threading.Lock()
+        self.modes = None   # mode -> description
+        self.current = None # (mode, resolution)
+
+    def stamp(self):
+        # status and modes of the drm connectors + date of the last change notified by batocera-resolution
+        md5 = hashlib.md5()
+        for attribute in sorted(glob.glob("/sys/class/drm/card*-*/status") + glob.glob("/sys/class/drm/card*-*/modes")):
+            try:
+                with open(attribute, "rb") as f:
+                    md5.update(attribute.encode() + b"\0" + f.read())
+            except IOError:
+                pass
+        try:
+            changed = os.stat(self.changedFile).st_mtime_ns
+        except OSError:
+            changed = None
+        return [md5.hexdigest(), changed]
+
+    def listModes(self, refresh=False):
+        with self.lock:
+            if self.modes is not None and not refresh:
+                return self.modes
+            stamp = self.stamp()
+
+            if not refresh:
+                try:
+                    with open(self.cacheFile) as f:
+                        cache = json.load(f)
+                    if cache["stamp"] == stamp:
+                        self.modes = cache["modes"]
+                        return self.modes
+                except (IOError, ValueError, KeyError):
+                    pass # missing or invalid
+
+            proc = subprocess.Popen(["batocera-resolution listModes"], stdout=subprocess.PIPE, shell=True)
+            (out, err) = proc.communicate()
+            self.modes = dict()
+            for valmod in out.decode().splitlines():
+                vals = valmod.split(":", 1)
+                self.modes[vals[0]] = vals[1] if len(vals) > 1 else ""
+
+            try:
+                tmpfile = "{}.{}.tmp".format(self.cacheFile, os.getpid())
+                with open(tmpfile, "w") as f:
+                    json.dump({ "stamp": stamp, "modes": self.modes }, f)
+                os.replace(tmpfile, self.cacheFile)
+            except IOError as e:
+                eslog.debug("unable to save the video modes: {}".format(e))
+            return self.modes
+
+    def modeExists(self, videomode):
+        if videomode in self.listModes():
+            return True
+        # the cache may be late (ie a mode forced since the last change), check once again
+        return videomode in self.listModes(refresh=True)
+
+    def getCurrent(self):
+        with self.lock:
+            if self.current is None:
+                proc = subprocess.Popen(["batocera-resolution currentMode; echo '--'; batocera-resolution currentResolution"], stdout=subprocess.PIPE, shell=True)
+                (out, err) = proc.communicate()
+                lines = out.decode().splitlines()
+                separator = lines.index("--")
+                mode = lines[0] if separator > 0 else None # the first line
+                resolution = lines[separator+1] if separator+1 < len(lines) else ""
+                self.current = (mode, resolution)
+            return self.current
+
+    def invalidateCurrent(self):
+        with self.lock:
+            self.current = None
+
+cache = VideoModeCache()
+
 # Set a specific video mode
+@span("videoMode.changeMode")
 def changeMode(videomode):
     if checkModeExists(videomode):
         cmd = "batocera-resolution setMode \"{}\"".format(videomode)
         if cmd is not None:
             eslog.debug("setVideoMode({}): {} ".format(videomode, cmd))
             os.system(cmd)
+            cache.invalidateCurrent()
 
+@span("videoMode.getCurrentMode")
 def getCurrentMode():
-    proc = subprocess.Popen(["batocera-resolution currentMode"], stdout=subprocess.PIPE, shell=True)
-    (out, err) = proc.communicate()
-    for val in out.decode().splitlines():
-        return val # return the first line
+    return cache.getCurrent()[0]
 
+@span("videoMode.minTomaxResolution")
 def minTomaxResolution():
     proc = subprocess.Popen(["batocera-resolution minTomaxResolution"], stdout=subprocess.PIPE, shell=True)
     (out, err) = proc.communicate()
+    cache.invalidateCurrent()
 
+@span("videoMode.getCurrentResolution")
 def getCurrentResolution():
-    proc = subprocess.Popen(["batocera-resolution currentResolution"], stdout=subprocess.PIPE, shell=True)
-    (out, err) = proc.communicate()
-    vals = out.decode().split("x")
+    (mode, resolution) = cache.getCurrent()
+    vals = resolution.split("x")
     return { "width": int(vals[0]), "height": int(vals[1]) }
 
+@span("videoMode.checkModeExists")
 def checkModeExists(videomode):
-    proc = subprocess.Popen(["batocera-resolution listModes"], stdout=subprocess.PIPE, shell=True)
-    (out, err) = proc.communicate()
-    for valmod in out.decode().splitlines():
-        vals = valmod.split(":")
-        if(videomode == vals[0]):
-            return True
+    if cache.modeExists(videomode):
+        return True
     eslog.error("invalid video mode {}".format(videomode))
     return False
 
+@span("videoMode.changeMouse")
 def changeMouse(mode):
     eslog.debug("changeMouseMode({})".format(mode))
     if mode:
@@ -54,6 +142,7 @@ def changeMouse(mode):
     proc = subprocess.Popen([cmd], stdout=subprocess.PIPE, shell=True)
     (out, err) = proc.communicate()
 
+@span("videoMode.getGLVersion")
 def getGLVersion():
     try:
         glxVerCmd = 'glxinfo | grep "OpenGL version"'
@@ -64,6 +153,7 @@ def getGLVersion():
     except:
         return 0
 
+@span("videoMode.getGLVendor")
 def getGLVendor():
     try:
         glxVendCmd = 'glxinfo | grep "OpenGL vendor string"'
@@ -74,6 +164,7 @@ def getGLVendor():
     except:
         return "unknown"
 
+@span("videoMode.getGameSpecial")
 def getGameSpecial(systemName, rom):
     # Returns an ID for games that need rotated bezels/shaders or have special art
     # Vectrex will actually return an abbreviated game name for overlays, all others will return 0, 90, or 270 for rotation angle
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# the configgen modules import each other from the configgen folder, and a few as the configgen package
+testsDir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(testsDir), "configgen"))
+sys.path.insert(1, os.path.dirname(testsDir))
+sys.path.insert(2, testsDir)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+# getMameControlScheme as it was before generators/mame/mameControlScheme.py (the same in mameGenerator.py and libretroMAMEConfig.py),
+# kept as the reference of test_mameControlScheme.py (frozen: only the directory of the game lists can be changed)
+
+import os
+
+dataDir = "/usr/share/batocera/configgen/data/mame"
+
+def getMameControlScheme(system, romBasename):
+    # Game list files
+    mameCapcom = dataDir + '/mameCapcom.txt'
+    mameKInstinct = dataDir + '/mameKInstinct.txt'
+    mameMKombat = dataDir + '/mameMKombat.txt'
+    mameNeogeo = dataDir + '/mameNeogeo.txt'
+    mameTwinstick = dataDir + '/mameTwinstick.txt'
+    mameRotatedstick = dataDir + '/mameRotatedstick.txt'
+
+    # Controls for games with 5-6 buttons or other unusual controls
+    if system.isOptSet("altlayout"):
+        controllerType = system.config["altlayout"] # Option was manually selected
+    else:
+        controllerType = "auto"
+
+    if controllerType in [ "default", "neomini", "neocd", "twinstick", "qbert" ]:
+        return controllerType
+    else:
+        capcomList = set(open(mameCapcom).read().split())
+        mkList = set(open(mameMKombat).read().split())
+        kiList = set(open(mameKInstinct).read().split())
+        neogeoList = set(open(mameNeogeo).read().split())
+        twinstickList = set(open(mameTwinstick).read().split())
+        qbertList = set(open(mameRotatedstick).read().split())
+            
+        romName = os.path.splitext(romBasename)[0]
+        if romName in capcomList:
+            if controllerType in [ "auto", "snes" ]:
+                return "sfsnes"
+            elif controllerType == "megadrive":
+                return "megadrive"
+            elif controllerType == "fightstick":
+                return "sfstick"
+        elif romName in mkList:
+            if controllerType in [ "auto", "snes" ]:
+                return "mksnes"
+            elif controllerType == "megadrive":
+                return "mkmegadrive"
+            elif controllerType == "fightstick":
+                return "mkstick"
+        elif romName in kiList:
+            if controllerType in [ "auto", "snes" ]:
+                return "kisnes"
+            elif controllerType == "megadrive":
+                return "megadrive"
+            elif controllerType == "fightstick":
+                return "sfstick"
+        elif romName in  neogeoList:
+            return "neomini"
+        elif romName in  twinstickList:
+            return "twinstick"
+        elif romName in  qbertList:
+            return "qbert"
+        else:
+            if controllerType == "fightstick":
+                return "fightstick"
+
+    return "default"
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# the bezel render cache and the decoration index of utils/bezels.py
+
+import os
+import pytest
+from random import Random
+import batoceraFiles
+from Emulator import Emulator
+import utils.bezels as bezels
+import bezelsLegacy
+
+def writer(content, calls):
+    def render(output_png):
+        calls.append(output_png)
+        with open(output_png, "wb") as f:
+            f.write(content)
+    return render
+
+def test_cachedRender_chain(tmp_path, monkeypatch):
+    monkeypatch.setattr(batoceraFiles, "overlayCache", str(tmp_path / "cache"))
+    source = tmp_path / "bezel.png"
+    source.write_bytes(b"bezel")
+
+    # pad then tattoo on its output, as libretroConfig.writeBezelConfig does
+    def launch(calls):
+        padded = bezels.cachedRender([str(source)], ("pad", 1920, 1080), writer(b"padded", calls))
+        return bezels.cachedRender([padded], ("tattoo", "NW"), writer(b"tattooed", calls))
+
+    calls = []
+    first = launch(calls)
+    assert len(calls) == 2
+    for i in range(3):
+        calls = []
+        assert launch(calls) == first
+        assert calls == []
+
+    # a new source renders both again
+    source.write_bytes(b"another bezel")
+    calls = []
+    assert launch(calls) != first
+    assert len(calls) == 2
+
+# a decoration with bezels at each level of the lookup, in the user and the system directories
+@pytest.fixture
+def decorations(tmp_path, monkeypatch):
+    user = tmp_path / "user"
+    system = tmp_path / "system"
+    files = [ system / "thebezelproject/default.png",
+              system / "thebezelproject/systems/snes.png",
+              system / "thebezelproject/systems/megadrive.png",
+              system / "thebezelproject/games/snes/Super Mario World (USA).png",
+              system / "thebezelproject/games/Sonic.png",
+              user   / "thebezelproject/systems/megadrive.png",
+              user   / "thebezelproject/games/snes/Zelda.png",
+              user   / "mine/default.png" ]
+    for file in files:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_bytes(b"png")
+    monkeypatch.setattr(batoceraFiles, "overlayUser", str(user))
+    monkeypatch.setattr(batoceraFiles, "overlaySystem", str(system))
+    monkeypatch.setattr(bezels, "bezelIndex", bezels.BezelIndex(str(tmp_path / "cache/bezels-index.pickle")))
+    return tmp_path
+
+lookups = [ ("/userdata/roms/snes/Super Mario World (USA).zip", "thebezelproject", "snes"),
+            ("/userdata/roms/snes/Zelda.zip",                   "thebezelproject", "snes"),
+            ("/userdata/roms/snes/Unknown.zip",                 "thebezelproject", "snes"),
+            ("/userdata/roms/megadrive/Sonic.zip",              "thebezelproject", "megadrive"),
+            ("/userdata/roms/megadrive/Columns.zip",            "thebezelproject", "megadrive"),
+            ("/userdata/roms/nes/Mario.zip",                    "thebezelproject", "nes"),
+            ("/userdata/roms/nes/Mario.zip",                    "mine",            "nes"),
+            ("/userdata/roms/nes/Mario.zip",                    "missing",         "nes") ]
+
+# os.stat calls (os.path.exists stats too) and os.listdir calls
+def countCalls(monkeypatch, function):
+    counts = { "stat": 0, "listdir": 0 }
+    stat = os.stat
+    listdir = os.listdir
+    def countedStat(*args, **kwargs):
+        counts["stat"] += 1
+        return stat(*args, **kwargs)
+    def countedListdir(*args, **kwargs):
+        counts["listdir"] += 1
+        return listdir(*args, **kwargs)
+    with monkeypatch.context() as m:
+        m.setattr(os, "stat", countedStat)
+        m.setattr(os, "listdir", countedListdir)
+        result = function()
+    return (result, counts)
+
+def test_getBezelInfos(decorations, monkeypatch):
+    # the index costs a stat per directory (the decoration roots first), the cascade one per candidate file:
+    # more for a game bezel found at once, less as soon as the lookup goes down to the system and default bezels
+    totalCascade = 0
+    totalIndexed = 0
+    for (rom, bezel, systemName) in lookups:
+        (expected, cascade) = countCalls(monkeypatch, lambda: bezelsLegacy.getBezelInfos(rom, bezel, systemName))
+        (result, first) = countCalls(monkeypatch, lambda: bezels.getBezelInfos(rom, bezel, systemName))
+        assert result == expected
+
+        # the next launches, the index being saved
+        bezels.bezelIndex.dirs = None
+        (result, indexed) = countCalls(monkeypatch, lambda: bezels.getBezelInfos(rom, bezel, systemName))
+        assert result == expected
+        assert indexed["listdir"] == 0
+        print("{} {}: cascade {} stats, indexed {} stats (first lookup {} stats and {} listdir)".format(bezel, rom, cascade["stat"], indexed["stat"], first["stat"], first["listdir"]))
+        totalCascade += cascade["stat"]
+        totalIndexed += indexed["stat"]
+    assert totalIndexed < totalCascade
+
+def test_getBezelInfos_fallback_stats(decorations, monkeypatch):
+    # a game without bezel goes through the whole cascade: 12 candidates tested against 7 directories
+    rom = "/userdata/roms/nes/Mario.zip"
+    (expected, cascade) = countCalls(monkeypatch, lambda: bezelsLegacy.getBezelInfos(rom, "thebezelproject", "nes"))
+    bezels.getBezelInfos(rom, "thebezelproject", "nes")
+    bezels.bezelIndex.dirs = None
+    (result, indexed) = countCalls(monkeypatch, lambda: bezels.getBezelInfos(rom, "thebezelproject", "nes"))
+    assert result == expected
+    assert indexed["stat"] < cascade["stat"]
+
+def test_BezelIndex_rebuilt(decorations):
+    rom = "/userdata/roms/snes/Contra.zip"
+    assert bezels.getBezelInfos(rom, "thebezelproject", "snes")["png"].endswith("/systems/snes.png")
+
+    # a bezel added for the game: its directory mtime changes, the directory is listed again
+    bezels.bezelIndex.dirs = None
+    games = decorations / "user/thebezelproject/games/snes"
+    (games / "Contra.png").write_bytes(b"png")
+    st = os.stat(games)
+    os.utime(games, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+    infos = bezels.getBezelInfos(rom, "thebezelproject", "snes")
+    assert infos["png"] == str(games / "Contra.png")
+    assert infos["specific_to_game"]
+
+    # and removed
+    bezels.bezelIndex.dirs = None
+    (games / "Contra.png").unlink()
+    os.utime(games, ns=(st.st_atime_ns, st.st_mtime_ns + 2000000000))
+    assert bezels.getBezelInfos(rom, "thebezelproject", "snes")["png"].endswith("/systems/snes.png")
+
+def tattooSystem(tattoo_file, corner):
+    system = Emulator.__new__(Emulator)
+    system.name = "snes"
+    system.config = { "bezel.tattoo": "custom", "bezel.tattoo_file": tattoo_file, "bezel.tattoo_corner": corner }
+    return system
+
+# the corner-only composite against the full-frame one of the baseline
+@pytest.mark.parametrize("corner", [ "NW", "NE", "SE", "SW" ])
+@pytest.mark.parametrize("size,mode", [ ((1920, 1080), "RGBA"), ((640, 480), "RGBA"), ((1920, 1080), "RGB") ])
+def test_tatooImage(tmp_path, corner, size, mode):
+    Image = pytest.importorskip("PIL.Image")
+    random = Random(size[0] + len(mode))
+
+    # an opaque frame around a transparent screen, noisy for the blending to show
+    (w, h) = size
+    bezel = Image.frombytes("RGBA", size, random.randbytes(w * h * 4))
+    bezel.putalpha(255)
+    bezel.paste((0, 0, 0, 0), (w // 6, h // 12, w - w // 6, h - h // 12))
+    bezel.convert(mode).save(tmp_path / "bezel.png")
+    # a tattoo with a partly transparent alpha
+    tattoo = Image.frombytes("RGBA", (300, 420), random.randbytes(300 * 420 * 4))
+    tattoo.save(tmp_path / "tattoo.png")
+
+    system = tattooSystem(str(tmp_path / "tattoo.png"), corner)
+    bezelsLegacy.tatooImage(str(tmp_path / "bezel.png"), str(tmp_path / "legacy.png"), system)
+    bezels.tatooImage(str(tmp_path / "bezel.png"), str(tmp_path / "corner.png"), system)
+
+    legacy = Image.open(tmp_path / "legacy.png")
+    corner = Image.open(tmp_path / "corner.png")
+    assert legacy.mode == corner.mode == "RGBA"
+    assert legacy.size == corner.size
+    assert legacy.tobytes() == corner.tobytes()
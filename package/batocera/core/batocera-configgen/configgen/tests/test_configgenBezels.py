@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+# configgen-bezels (configgenBezels.py)
+
+import os
+import sys
+import batoceraFiles
+import configgenBezels
+import utils.videoMode as videoMode
+from Emulator import Emulator
+
+configsDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../configs")
+
+def test_main_default_bezel(tmp_path, monkeypatch, capsys):
+    # a stock batocera.conf: global.bezel is commented out
+    conf = tmp_path / "batocera.conf"
+    conf.write_text("#global.bezel=none\nglobal.videomode=default\n")
+    monkeypatch.setattr(batoceraFiles, "batoceraConf", str(conf))
+    monkeypatch.setattr(batoceraFiles, "CACHE", str(tmp_path / "cache"))
+    monkeypatch.setattr(batoceraFiles, "overlayUser", str(tmp_path / "decorations"))
+    monkeypatch.setattr(batoceraFiles, "overlaySystem", str(tmp_path / "system-decorations"))
+    compiledDefaults = Emulator.get_compiled_defaults
+    monkeypatch.setattr(Emulator, "get_compiled_defaults", staticmethod(lambda defaultyml, defaultarchyml:
+        compiledDefaults(os.path.join(configsDir, "configgen-defaults.yml"), os.path.join(configsDir, "configgen-defaults-x86_64.yml"))))
+    monkeypatch.setattr(videoMode, "getCurrentResolution", lambda: { "width": 1920, "height": 1080 })
+    monkeypatch.setattr(os, "nice", lambda increment: 0)
+    monkeypatch.setattr(sys, "argv", [ "configgen-bezels" ])
+
+    assert configgenBezels.main() == 0
+    output = capsys.readouterr().out
+    assert "no decoration set" not in output
+    assert "0 bezels of consoles for 1920x1080" in output
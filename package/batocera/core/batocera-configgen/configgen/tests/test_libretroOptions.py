@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+# generateCoreSettings (the per-core tables) against the code it replaced (libretroOptionsLegacy.py),
+# for every libretro core/system pair of es_systems.yml.
+# the batocera.conf options are explored from the ones each implementation reads: every value known
+# for an option (es_features.yml, the tables, the comparisons of the old code) is tried, and the options
+# read only once another one is set are tried on top of it.
+
+import os
+import re
+import yaml
+import pytest
+import batoceraFiles
+from Emulator import Emulator
+from generators.libretro import libretroOptions
+import libretroOptionsLegacy
+
+esSystemDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../../emulationstation/batocera-es-system")
+maxDepth = 2
+unknownValue = "unknown-value"
+
+# the bugs of the old code, fixed by the tables: core -> options -> (coreKey, value saved by the tables)
+expectedDifferences = {
+    # the old code read keyboard_pass_through (KeyError)
+    'vice_x64':   { 'vice_keyboard_pass_through': lambda value: ('vice_physical_keyboard_pass_through', value) },
+    'vice_x64sc': { 'vice_keyboard_pass_through': lambda value: ('vice_physical_keyboard_pass_through', value) },
+    # the old code saved + value + '"' (TypeError)
+    'mesen': { 'mesen_fdsautoinsertdisk':  lambda value: ('mesen_fdsautoinsertdisk',  '"' + value + '"'),
+               'mesen_fdsfastforwardload': lambda value: ('mesen_fdsfastforwardload', '"' + value + '"') },
+    # the old code saved the controller 1 in picodrive_sprlim
+    'picodrive': { 'picodrive_controller1': lambda value: ('picodrive_input1', '"' + value + '"') },
+}
+
+class SettingsRecorder():
+    def __init__(self):
+        self.settings = dict()
+
+    def save(self, name, value):
+        self.settings[name] = str(value)
+
+    def saveAll(self, values):
+        for (name, value) in values.items():
+            self.settings[name] = str(value)
+
+    def write(self):
+        pass
+
+# the config of the system, remembering the options read
+class RecordingConfig(dict):
+    def __init__(self, values):
+        super().__init__(values)
+        self.read = set()
+
+    def __contains__(self, key):
+        self.read.add(key)
+        return super().__contains__(key)
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+def corePairs():
+    with open(os.path.join(esSystemDir, "es_systems.yml")) as f:
+        systems = yaml.safe_load(f)
+    pairs = []
+    for (systemName, system) in systems.items():
+        emulators = system.get("emulators") or {}
+        for core in emulators.get("libretro") or {}:
+            pairs.append((systemName, core))
+    return pairs
+
+def knownValues():
+    values = dict()
+    def add(key, value):
+        if isinstance(key, str) and isinstance(value, str):
+            values.setdefault(key, set()).add(value)
+
+    def addFeatures(node):
+        if isinstance(node, dict):
+            for (name, child) in node.items():
+                if name == "cfeatures" and isinstance(child, dict):
+                    for (key, feature) in child.items():
+                        if isinstance(feature, dict) and isinstance(feature.get("choices"), dict):
+                            for value in feature["choices"].values():
+                                add(key, str(value))
+                addFeatures(child)
+    with open(os.path.join(esSystemDir, "es_features.yml")) as f:
+        addFeatures(yaml.safe_load(f))
+
+    for options in libretroOptions.coreOptions.values():
+        for option in options:
+            if isinstance(option, libretroOptions.CoreOption):
+                keys = option.key.values() if isinstance(option.key, dict) else [ option.key ]
+                for key in keys:
+                    for value in option.values:
+                        add(key, value)
+            elif isinstance(option, libretroOptions.CoreOptionGroup):
+                for value in option.choices:
+                    add(option.key, value)
+
+    for source in [ libretroOptionsLegacy.__file__, libretroOptions.__file__ ]:
+        with open(source) as f:
+            code = f.read()
+        for (key, value) in re.findall(r"config\[['\"]([^'\"]+)['\"]\]\s*[!=]=\s*['\"]([^'\"]*)['\"]", code):
+            add(key, value)
+        for (key, choices) in re.findall(r"config\[['\"]([^'\"]+)['\"]\]\s+(?:not\s+)?in\s+[\[\(]([^\]\)]*)[\]\)]", code):
+            for value in re.findall(r"['\"]([^'\"]*)['\"]", choices):
+                add(key, value)
+    return values
+
+values = knownValues()
+
+def makeSystem(systemName, config):
+    system = Emulator.__new__(Emulator)
+    system.name = systemName
+    system.config = RecordingConfig(config)
+    return system
+
+def run(generate, systemName, config, rom):
+    system = makeSystem(systemName, config)
+    recorder = SettingsRecorder()
+    try:
+        generate(recorder, system, rom)
+        result = list(recorder.settings.items())
+    except Exception as e:
+        result = type(e).__name__
+    return (result, system.config.read)
+
+def expectedSettings(systemName, config, rom):
+    # the old code without the options it got wrong, then the values saved by the tables for them
+    fixes = expectedDifferences.get(config['core'], {})
+    legacyConfig = { key: value for (key, value) in config.items() if key not in fixes }
+    (result, read) = run(libretroOptionsLegacy.generateCoreSettings, systemName, legacyConfig, rom)
+    if isinstance(result, list):
+        settings = dict(result)
+        for (key, fix) in fixes.items():
+            if key in config:
+                (coreKey, value) = fix(config[key])
+                assert coreKey in settings
+                settings[coreKey] = value
+        result = list(settings.items())
+    return (result, read | set(fixes))
+
+@pytest.mark.parametrize("systemName,core", corePairs())
+def test_generateCoreSettings(systemName, core, tmp_path, monkeypatch):
+    monkeypatch.setattr(batoceraFiles, "CONF", str(tmp_path))
+    os.makedirs(os.path.join(str(tmp_path), "retroarch"))
+    rom = "/userdata/roms/{}/game.zip".format(systemName)
+
+    pending = [ ({ 'core': core, 'retroarchcore.custom_option': '"custom"' }, 0) ]
+    done = set()
+    while pending:
+        (config, depth) = pending.pop()
+        (expected, legacyRead) = expectedSettings(systemName, config, rom)
+        (actual, read) = run(libretroOptions.generateCoreSettings, systemName, config, rom)
+        assert actual == expected, config
+
+        if depth == maxDepth:
+            continue
+        for key in sorted((read | legacyRead) - set(config)):
+            for value in sorted(values.get(key, set()) | { unknownValue }):
+                next = dict(config)
+                next[key] = value
+                stamp = tuple(sorted(next.items()))
+                if stamp not in done:
+                    done.add(stamp)
+                    pending.append((next, depth + 1))
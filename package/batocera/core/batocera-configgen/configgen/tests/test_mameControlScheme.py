@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+# the control scheme classifier of generators/mame/mameControlScheme.py against the getMameControlScheme it replaced,
+# for the roms of each game list and every altlayout
+
+import os
+import time
+import pytest
+from Emulator import Emulator
+from generators.mame import mameControlScheme
+import mameControlSchemeLegacy
+
+dataDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../data/mame")
+altlayouts = [ None, "auto", "snes", "megadrive", "fightstick", "default", "neomini", "neocd", "twinstick", "qbert", "unknown" ]
+
+@pytest.fixture(autouse=True)
+def gameLists(monkeypatch):
+    monkeypatch.setattr(mameControlSchemeLegacy, "dataDir", dataDir)
+    monkeypatch.setattr(mameControlScheme, "controlSchemeClassifier", mameControlScheme.ControlSchemeClassifier(dataDir))
+
+def makeSystem(altlayout):
+    system = Emulator.__new__(Emulator)
+    system.name = "mame"
+    system.config = { "emulator": "mame", "core": "mame" }
+    if altlayout is not None:
+        system.config["altlayout"] = altlayout
+    return system
+
+def listRoms(file):
+    with open(os.path.join(dataDir, file)) as f:
+        return f.read().split()
+
+@pytest.mark.parametrize("family,file", mameControlScheme.families)
+def test_getMameControlScheme(family, file):
+    roms = listRoms(file)
+    assert len(roms) > 0
+    for altlayout in altlayouts:
+        system = makeSystem(altlayout)
+        for rom in roms:
+            romBasename = rom + ".zip"
+            assert mameControlScheme.getMameControlScheme(system, romBasename) == mameControlSchemeLegacy.getMameControlScheme(system, romBasename), (rom, altlayout)
+
+def test_getMameControlScheme_unlisted():
+    for altlayout in altlayouts:
+        system = makeSystem(altlayout)
+        for romBasename in [ "pacman.zip", "sf2.7z", "unknown", ".zip" ]:
+            assert mameControlScheme.getMameControlScheme(system, romBasename) == mameControlSchemeLegacy.getMameControlScheme(system, romBasename), (romBasename, altlayout)
+
+def test_getMameControlScheme_timing():
+    # one lookup per launch: the lists are read by the first one (in a fresh process) and only checked by the next ones
+    system = makeSystem(None)
+    roms = [ rom + ".zip" for (family, file) in mameControlScheme.families for rom in listRoms(file)[:20] ] + [ "pacman.zip" ]
+
+    start = time.perf_counter()
+    for rom in roms:
+        mameControlSchemeLegacy.getMameControlScheme(system, rom)
+    legacy = (time.perf_counter() - start) / len(roms)
+
+    start = time.perf_counter()
+    for rom in roms:
+        mameControlScheme.controlSchemeClassifier.checkedPid = None # as in a new launch
+        mameControlScheme.getMameControlScheme(system, rom)
+    classified = (time.perf_counter() - start) / len(roms)
+
+    print("lookup: {:.1f}us before, {:.1f}us now".format(legacy * 1000000, classified * 1000000))
+    assert classified < legacy
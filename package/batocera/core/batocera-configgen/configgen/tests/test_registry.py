@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+# generators/registry.py: a launch imports the generator of its emulator only
+
+import os
+import sys
+import subprocess
+
+testsDir = os.path.dirname(os.path.abspath(__file__))
+
+# in a new interpreter, for sys.modules to hold only what the launch imports
+def importedModules(emulator):
+    code = "\n".join([
+        "import sys",
+        "from generators.registry import GeneratorRegistry",
+        "GeneratorRegistry()[{!r}]".format(emulator),
+        "print('\\n'.join(sys.modules))" ])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ os.path.join(os.path.dirname(testsDir), "configgen"), os.path.dirname(testsDir) ])
+    output = subprocess.check_output([ sys.executable, "-c", code ], env=env, stderr=subprocess.DEVNULL)
+    return output.decode().split("\n")
+
+def test_libretro_imports():
+    modules = importedModules("libretro")
+    assert "generators.libretro.libretroGenerator" in modules
+    assert "PIL" not in modules
+    assert "generators.mame.mameGenerator" not in modules
+    assert "generators.mame.mameControllers" not in modules
+    assert "generators.libretro.libretroMAMEConfig" not in modules
+    assert [ module for module in modules if module.startswith("generators.") and not module.startswith(("generators.libretro", "generators.Generator", "generators.registry")) ] == []
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+# UnixSettings.loadAll (the index built in one pass on the keys) against the regex scan of each key it replaced,
+# on a big batocera.conf
+
+import re
+import time
+import pytest
+from settings.unixSettings import UnixSettings
+
+systems = [ "snes", "megadrive", "psx", "n64", "mame", "neogeo", "amiga500", "c64", "x68000", "3do" ]
+games = [ "Super Mario World (USA).zip", "Street Fighter II' [b1].zip", "Sonic & Knuckles + Sonic 3.7z", "Pokémon Rouge.gba", "a=b c.zip" ]
+nbLines = 50000
+
+# the loadAll of the baseline
+def baselineLoadAll(settings, name):
+    res = dict()
+    for (key, value) in settings.config.items('DEFAULT'):
+        m = re.match(r"^" + UnixSettings.protectString(name) + r"\.(.+)", UnixSettings.protectString(key))
+        if m:
+            res[m.group(1)] = value
+    return res
+
+@pytest.fixture(scope="module")
+def batoceraConf(tmp_path_factory):
+    lines = [ "# batocera.conf", "global.bezel=consoles", "global.retroarchcore.opt-x=1", "global.ai_service_url=http://example.com/?a=b" ]
+    i = 0
+    while len(lines) < nbLines:
+        system = systems[i % len(systems)]
+        game = games[i % len(games)]
+        lines.append("{}.option{}={}".format(system, i, i))
+        lines.append("{}[\"{}\"].option{}={}".format(system, game, i, i))
+        lines.append("{}.folder[\"/userdata/roms/{}/dir {}\"].option{}={}".format(system, system, i % 7, i, i))
+        lines.append("{}.retroarchcore.{}_option{}=\"value {}\"".format(system, system, i, i))
+        if i % 100 == 0:
+            lines.append("#{}.commented{}=1".format(system, i))
+            lines.append("{}.option{}=duplicate".format(system, i))
+        i += 1
+    conf = tmp_path_factory.mktemp("unixsettings") / "batocera.conf"
+    conf.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(conf)
+
+# the system, game and folder names, each game and folder for one of the systems
+def names():
+    result = [ "global", "global.retroarchcore", "unknown" ]
+    for (i, system) in enumerate(systems):
+        result += [ system, system + ".retroarchcore" ]
+        result += [ "{}[\"{}\"]".format(system, games[i % len(games)]), "{}.folder[\"/userdata/roms/{}/dir {}\"]".format(system, system, i % 7) ]
+    return result
+
+def test_loadAll(batoceraConf):
+    settings = UnixSettings(batoceraConf)
+    for name in names():
+        expected = baselineLoadAll(settings, name)
+        assert settings.loadAll(name) == expected, name
+    assert len(settings.loadAll("snes")) > 0
+    assert len(settings.loadAll("n64[\"Pokémon Rouge.gba\"]")) > 0
+
+def test_loadAll_timing(batoceraConf):
+    # the loadAll calls of a launch: global, the system, the folder and the game
+    launch = [ "global", "snes", "snes.folder[\"/userdata/roms/snes/dir 1\"]", "snes[\"Super Mario World (USA).zip\"]" ]
+
+    settings = UnixSettings(batoceraConf)
+    start = time.perf_counter()
+    for name in launch:
+        baselineLoadAll(settings, name)
+    baseline = time.perf_counter() - start
+
+    settings = UnixSettings(batoceraConf)
+    start = time.perf_counter()
+    for name in launch:
+        settings.loadAll(name) # the index is built by the first one
+    indexed = time.perf_counter() - start
+
+    print("{} lines, {} loadAll: baseline {:.1f}ms, indexed {:.1f}ms".format(nbLines, len(launch), baseline * 1000, indexed * 1000))
+    assert indexed < baseline